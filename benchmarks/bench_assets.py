@@ -0,0 +1,70 @@
+"""Cost of blitting day-42 enemy sprites straight from image.load vs through AssetManager.
+
+A freshly loaded PNG is not in the display's pixel format, so every blit
+converts each pixel; AssetManager hands out convert_alpha()'d copies.
+
+Run from the repository root:
+    python benchmarks/bench_assets.py
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+import pygame
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from wodi.assets import AssetManager
+
+SCREEN = (1080, 2340)
+GRID_SIZE = 40
+COUNTS = [100, 500, 2000]
+FRAMES = 50
+
+
+def make_png(path):
+    """An RGBA sprite with transparent corners, like an exported game asset."""
+    sprite = pygame.Surface((128, 128), pygame.SRCALPHA)
+    sprite.fill((0, 0, 0, 0))
+    pygame.draw.circle(sprite, (220, 40, 40, 255), (64, 64), 60)
+    pygame.image.save(sprite, path)
+
+
+def time_blits(screen, image, positions):
+    batch = [(image, pos) for pos in positions]
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        screen.blits(batch, False)
+    return (time.perf_counter() - start) / FRAMES * 1000
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode(SCREEN)
+    rng = random.Random(42)
+    with tempfile.TemporaryDirectory() as root:
+        make_png(os.path.join(root, "enemy.png"))
+        raw = pygame.transform.scale(pygame.image.load(os.path.join(root, "enemy.png")), (GRID_SIZE, GRID_SIZE))
+        assets = AssetManager(root)
+        converted = assets.scaled("enemy.png", (GRID_SIZE, GRID_SIZE))
+        for _ in range(COUNTS[-1]):
+            assets.scaled("enemy.png", (GRID_SIZE, GRID_SIZE))
+
+    print(f"raw format: {raw.get_bitsize()} bpp masks={raw.get_masks()}")
+    print(f"converted:  {converted.get_bitsize()} bpp masks={converted.get_masks()}")
+    print(f"{'sprites':>8} {'load ms':>9} {'managed ms':>11} {'speedup':>8}")
+    for count in COUNTS:
+        positions = [(rng.randint(0, SCREEN[0] - GRID_SIZE), rng.randint(0, SCREEN[1] - GRID_SIZE))
+                     for _ in range(count)]
+        raw_ms = time_blits(screen, raw, positions)
+        managed_ms = time_blits(screen, converted, positions)
+        print(f"{count:>8} {raw_ms:9.2f} {managed_ms:11.2f} {raw_ms / managed_ms:7.1f}x")
+    print(f"cache: {assets.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""How wodi.balance sweeps scale with worker processes.
+
+Runs the same day-28 sweep with 1, 2, 4, ... workers up to the CPU count
+and prints runs per second and the speedup over one worker. The reports
+must come out identical whatever the worker count.
+
+Run from the repository root:
+    python benchmarks/bench_balance.py --runs 2000
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from wodi.balance import sweep
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+GAME = os.path.join(ROOT, "day-28-building-games-on-my-phone", "game.py")
+GRID = {"enemy_speed": [3, 5, 7], "num_enemies": [3, 5]}
+
+
+def worker_counts(limit):
+    counts = [1]
+    while counts[-1] * 2 <= limit:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != limit:
+        counts.append(limit)
+    return counts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=1000, help="runs per parameter set")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args(argv)
+
+    print(f"{'workers':>7} {'seconds':>8} {'runs/sec':>9} {'speedup':>8}")
+    base = sets = None
+    for workers in worker_counts(args.max_workers):
+        report = sweep(GAME, GRID, args.runs, policy="dodge", workers=workers)
+        if sets is None:
+            base, sets = report["runs_per_second"], report["sets"]
+        assert report["sets"] == sets, "results depend on the worker count"
+        rate = report["runs_per_second"]
+        print(f"{workers:>7} {report['seconds']:8.2f} {rate:9.0f} {rate / base:7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
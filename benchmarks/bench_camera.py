@@ -0,0 +1,76 @@
+"""Drawing a scrolling level: one draw.rect per platform vs cached chunk surfaces.
+
+A camera the size of the day-33 screen pans across a level whose width grows
+with the platform count. "rects" draws every platform with pygame.draw.rect
+at its screen position, the way the games drew their platforms; "layer"
+blits the visible chunks of a StaticLayer built from the same platforms.
+Both renders are compared pixel for pixel on the last frame.
+
+Run from the repository root:
+    python benchmarks/bench_camera.py
+"""
+
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+import pygame
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from wodi.camera import Camera, StaticLayer
+
+VIEW = (600, 400)
+LEVEL_HEIGHT = 1200
+COUNTS = [3, 100, 1000, 10000]
+WIDTH_PER_PLATFORM = 150
+FRAMES = 300
+SPEED = 13
+BLACK, WHITE = (0, 0, 0), (255, 255, 255)
+
+
+def make_level(count, rng):
+    width = max(VIEW[0] * 2, count * WIDTH_PER_PLATFORM)
+    platforms = [pygame.Rect(rng.randrange(width - 150), rng.randrange(LEVEL_HEIGHT - 20), 150, 20)
+                 for _ in range(count)]
+    return platforms, pygame.Rect(0, 0, width, LEVEL_HEIGHT)
+
+
+def draw_rects(screen, camera, platforms):
+    for plat in platforms:
+        pygame.draw.rect(screen, BLACK, camera.to_screen(plat))
+
+
+def pan(screen, camera, draw):
+    start = time.perf_counter()
+    for frame in range(FRAMES):
+        camera.rect.topleft = (frame * SPEED, frame * SPEED // 3)
+        camera.rect.clamp_ip(camera.bounds)
+        screen.fill(WHITE)
+        draw()
+    return (time.perf_counter() - start) / FRAMES * 1000
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode(VIEW)
+    rng = random.Random(20)
+    print(f"{'platforms':>9} {'rects ms':>9} {'layer ms':>9} {'chunks/frame':>13} {'chunk draws':>12}")
+    for count in COUNTS:
+        platforms, bounds = make_level(count, rng)
+        camera = Camera(VIEW, bounds)
+        layer = StaticLayer((plat, BLACK) for plat in platforms)
+
+        rects_ms = pan(screen, camera, lambda: draw_rects(screen, camera, platforms))
+        expected = pygame.image.tobytes(screen, "RGB")
+        blits = []
+        layer_ms = pan(screen, camera, lambda: blits.append(camera.draw(screen, layer)))
+        assert pygame.image.tobytes(screen, "RGB") == expected
+
+        print(f"{count:>9} {rects_ms:9.3f} {layer_ms:9.3f} {sum(blits) / len(blits):13.1f} {layer.redraws:12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Ticks per second of the wodi.enemysim engines, after checking they produce identical trajectories.
+
+Before timing, wodi.enemysim.check() compares every engine with the
+python reference, stepping both one tick and several ticks at a time.
+Each engine then starts from the same random enemies in a day-39-sized
+box and is timed on whole batches of ticks for at least --seconds. The
+numba engine is compiled before timing.
+
+Run from the repository root:
+    python benchmarks/bench_enemysim.py
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from wodi.enemysim import ENGINES, check, random_enemies
+
+WIDTH, HEIGHT = 1080, 880
+COUNTS = [10, 1000, 100000]
+
+
+def ticks_per_second(cls, count, seconds):
+    sim = cls(*random_enemies(count, WIDTH, HEIGHT), WIDTH, HEIGHT)
+    sim.step()  # compiles the numba engine
+    batch = 1
+    ticks = 0
+    start = time.perf_counter()
+    while True:
+        sim.step(batch)
+        ticks += batch
+        elapsed = time.perf_counter() - start
+        if elapsed >= seconds:
+            return ticks / elapsed
+        batch *= 2
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=1.0, help="minimum timing per engine and count")
+    args = parser.parse_args(argv)
+
+    missing = sorted({"python", "numpy", "numba"} - set(ENGINES))
+    if missing:
+        print(f"not installed, skipped: {', '.join(missing)}")
+    check()
+    print(f"trajectories identical across {', '.join(ENGINES)}")
+
+    print(f"{'enemies':>8} " + " ".join(f"{name + ' ticks/s':>16}" for name in ENGINES))
+    for count in COUNTS:
+        rates = [ticks_per_second(cls, count, args.seconds) for cls in ENGINES.values()]
+        print(f"{count:>8} " + " ".join(f"{rate:16.1f}" for rate in rates))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Per-frame update cost of the day-42 shooter step: Rect objects vs EntityStore.
+
+Each frame moves every enemy and bullet, culls bullets above the play area
+and resolves bullet-vs-enemy hits. Run from the repository root:
+    python benchmarks/bench_entities.py
+"""
+
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+import pygame
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from wodi.entities import EntityStore, EntityView
+from wodi.spatial import SpatialHash
+
+GRID_SIZE = 40
+WIDTH, GAME_TOP = 1080, 80
+COUNTS = [1000, 10000, 50000]
+OBJECT_LIMIT = 10000
+FRAMES = 10
+
+
+def arena_bottom(count):
+    return GAME_TOP + (count * 8 // (WIDTH // GRID_SIZE) + 1) * GRID_SIZE
+
+
+def spawn(count, rng):
+    bottom = arena_bottom(count)
+    enemies = [(rng.randint(0, WIDTH - GRID_SIZE), rng.randint(GAME_TOP, bottom - GRID_SIZE),
+                rng.choice([-2, -1, 1, 2]), rng.choice([-2, -1, 1, 2])) for _ in range(count)]
+    bullets = [(rng.randint(0, WIDTH - 10), rng.randint(GAME_TOP, bottom)) for _ in range(count)]
+    return enemies, bullets
+
+
+def object_frames(enemies, bullets):
+    enemies = [[pygame.Rect(x, y, GRID_SIZE, GRID_SIZE), vx, vy] for x, y, vx, vy in enemies]
+    bullets = [pygame.Rect(x, y, 10, 10) for x, y in bullets]
+    grid = SpatialHash(GRID_SIZE)
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        for b in bullets:
+            b.y -= 5
+        bullets = [b for b in bullets if b.bottom >= GAME_TOP]
+        grid.clear()
+        for b in bullets:
+            grid.insert(b, b)
+        spent = set()
+        survivors = []
+        for e in enemies:
+            e[0].x += e[1]
+            e[0].y += e[2]
+            for b in grid.query(e[0]):
+                if id(b) not in spent and e[0].colliderect(b):
+                    spent.add(id(b))
+                    break
+            else:
+                survivors.append(e)
+        enemies = survivors
+        bullets = [b for b in bullets if id(b) not in spent]
+    return (time.perf_counter() - start) / FRAMES * 1000
+
+
+def store_frames(enemies, bullets):
+    enemy_store, bullet_store = EntityStore(), EntityStore()
+    for x, y, vx, vy in enemies:
+        EntityView(enemy_store, x, y, GRID_SIZE, GRID_SIZE, vx, vy)
+    for x, y in bullets:
+        EntityView(bullet_store, x, y, 10, 10, 0, -5)
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        bullet_store.move()
+        bullet_store.cull(top=GAME_TOP)
+        enemy_store.move()
+        hit_enemies, hit_bullets = enemy_store.overlap_pairs(bullet_store, GRID_SIZE)
+        for e, b in zip(hit_enemies.tolist(), hit_bullets.tolist()):
+            if enemy_store.alive[e] and bullet_store.alive[b]:
+                enemy_store.kill(e)
+                bullet_store.kill(b)
+        enemy_store.compact()
+        bullet_store.compact()
+    return (time.perf_counter() - start) / FRAMES * 1000
+
+
+def main():
+    rng = random.Random(42)
+    print(f"{'entities':>9} {'objects ms':>11} {'store ms':>9}")
+    for count in COUNTS:
+        enemies, bullets = spawn(count, rng)
+        objects = f"{object_frames(enemies, bullets):11.2f}" if count <= OBJECT_LIMIT else f"{'skipped':>11}"
+        print(f"{count:>9} {objects} {store_frames(enemies, bullets):9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+"""Per-frame update and render cost of every day-N game, run headless with scripted input.
+
+Each game is stepped and rendered for --frames ticks with the seeded random
+tap policy from wodi.headless; step() and render() are timed separately and
+summarised as p50/p95/p99 milliseconds. A second, untimed pass under
+tracemalloc records the bytes allocated per frame. Results go to a JSON
+report; pass an older report as --baseline to print the change per game.
+
+--workload replays wodi.replay recordings instead, tick for tick, so a long
+real session (say ten minutes of day-41 with hundreds of spawns) becomes a
+repeatable benchmark.
+
+Run from the repository root:
+    python benchmarks/bench_games.py --frames 2000 --output bench_games.json
+    python benchmarks/bench_games.py --workload day41-10min.wodr
+"""
+
+import argparse
+import glob
+import json
+import os
+import platform
+import random
+import re
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from wodi.headless import DEFAULT_SIZE, load_game, random_policy  # sets the dummy SDL drivers
+import pygame
+
+from wodi.game import open_screen
+from wodi.replay import Recording
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def game_paths(root=ROOT):
+    """Every non-empty day-N game.py, in day order."""
+    paths = [p for p in glob.glob(os.path.join(root, "day-*", "game.py")) if os.path.getsize(p)]
+    return sorted(paths, key=lambda p: int(re.search(r"day-(\d+)", p).group(1)))
+
+
+def percentiles(samples, points=(50, 95, 99)):
+    ordered = sorted(samples)
+    last = len(ordered) - 1
+    return {f"p{p}": ordered[round(last * p / 100)] for p in points}
+
+
+def summarise(samples_ns):
+    ms = [s / 1e6 for s in samples_ns]
+    summary = {k: round(v, 4) for k, v in percentiles(ms).items()}
+    summary["mean"] = round(sum(ms) / len(ms), 4)
+    return summary
+
+
+def start_game(game_cls, seed):
+    screen = open_screen(game_cls, DEFAULT_SIZE)
+    random.seed(seed)
+    game = game_cls(screen)
+    return screen, game, random_policy(rng=random.Random(seed))
+
+
+def start_recording(game_cls, recording):
+    screen = open_screen(game_cls, recording.size)
+    random.seed(recording.seed)
+    game = game_cls(screen)
+    ticks = recording.inputs()
+    return screen, game, lambda game, frame: next(ticks)
+
+
+def time_game(game_cls, frames, seed, warmup, start=None):
+    screen, game, policy = start() if start else start_game(game_cls, seed)
+    clock = time.perf_counter_ns
+    update, render = [], []
+    for frame in range(warmup + frames):
+        inputs = policy(game, frame)
+        t0 = clock()
+        game.step(inputs)
+        t1 = clock()
+        game.render(screen)
+        t2 = clock()
+        if frame >= warmup:
+            update.append(t1 - t0)
+            render.append(t2 - t1)
+    return update, render
+
+
+def trace_allocations(game_cls, frames, seed, start=None):
+    """Mean and peak bytes allocated within one step + render."""
+    screen, game, policy = start() if start else start_game(game_cls, seed)
+    per_frame = []
+    tracemalloc.start()
+    try:
+        for frame in range(frames):
+            inputs = policy(game, frame)
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+            game.step(inputs)
+            game.render(screen)
+            per_frame.append(tracemalloc.get_traced_memory()[1] - base)
+    finally:
+        tracemalloc.stop()
+    return {"mean": round(sum(per_frame) / len(per_frame)), "max": max(per_frame)}
+
+
+def bench(path, frames, seed, warmup, alloc_frames):
+    name = os.path.basename(os.path.dirname(path))
+    try:
+        game_cls = load_game(path)
+        update, render = time_game(game_cls, frames, seed, warmup)
+        allocations = trace_allocations(game_cls, alloc_frames, seed) if alloc_frames else None
+    except Exception as exc:  # one broken day should not sink the whole report
+        return {"game": name, "error": f"{type(exc).__name__}: {exc}"}
+    return result(name, game_cls, update, render, allocations)
+
+
+def bench_recording(path, warmup, alloc_frames):
+    """Like bench(), but the ticks, seed and screen size come from a recording."""
+    name = os.path.basename(path)
+    try:
+        recording = Recording(path)
+        game_cls = load_game(recording.game_path())
+        start = lambda: start_recording(game_cls, recording)
+        warmup = min(warmup, recording.ticks // 10)
+        update, render = time_game(game_cls, recording.ticks - warmup, None, warmup, start)
+        alloc_frames = min(alloc_frames, recording.ticks)
+        allocations = trace_allocations(game_cls, alloc_frames, None, start) if alloc_frames else None
+    except Exception as exc:
+        return {"game": name, "error": f"{type(exc).__name__}: {exc}"}
+    return result(name, game_cls, update, render, allocations)
+
+
+def result(name, game_cls, update, render, allocations):
+    frame = [u + r for u, r in zip(update, render)]
+    return {
+        "game": name,
+        "caption": game_cls.caption,
+        "update_ms": summarise(update),
+        "render_ms": summarise(render),
+        "frame_ms": summarise(frame),
+        "alloc_bytes_per_frame": allocations,
+    }
+
+
+def compare(results, baseline):
+    """Print p50/p95 frame time change against an earlier report."""
+    before = {r["game"]: r for r in baseline["results"] if "error" not in r}
+    print(f"\n{'game':<36} {'p50 ms':>8} {'change':>8} {'p95 ms':>8} {'change':>8}")
+    for r in results:
+        old = before.get(r["game"])
+        if "error" in r or old is None:
+            continue
+        row = f"{r['game']:<36}"
+        for key in ("p50", "p95"):
+            new_ms, old_ms = r["frame_ms"][key], old["frame_ms"][key]
+            change = (new_ms - old_ms) / old_ms * 100 if old_ms else 0.0
+            row += f" {new_ms:8.3f} {change:+7.1f}%"
+        print(row)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("games", nargs="*", help="game.py paths (default: every day-N game)")
+    parser.add_argument("--frames", type=int, default=2000)
+    parser.add_argument("--warmup", type=int, default=100)
+    parser.add_argument("--alloc-frames", type=int, default=300, help="frames traced for allocations, 0 to skip")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="bench_games.json")
+    parser.add_argument("--baseline", help="earlier report to compare against")
+    parser.add_argument("--workload", nargs="+", metavar="RECORDING",
+                        help="time these wodi.replay recordings instead of the scripted games")
+    args = parser.parse_args(argv)
+
+    pygame.init()
+    results = []
+    print(f"{'game':<36} {'update p50/p95/p99 ms':>24} {'render p50/p95/p99 ms':>24} {'alloc B/frame':>14}")
+    if args.workload:
+        runs = (bench_recording(path, args.warmup, args.alloc_frames) for path in args.workload)
+    else:
+        runs = (bench(path, args.frames, args.seed, args.warmup, args.alloc_frames)
+                for path in args.games or game_paths())
+    for r in runs:
+        results.append(r)
+        if "error" in r:
+            print(f"{r['game']:<36} skipped: {r['error']}")
+            continue
+        u, d = r["update_ms"], r["render_ms"]
+        alloc = r["alloc_bytes_per_frame"]
+        print(f"{r['game']:<36} {u['p50']:7.3f} {u['p95']:7.3f} {u['p99']:8.3f} "
+              f"{d['p50']:7.3f} {d['p95']:7.3f} {d['p99']:8.3f} {alloc['mean'] if alloc else '-':>14}")
+
+    report = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "platform": platform.platform(),
+        "size": list(DEFAULT_SIZE),
+        "frames": args.frames,
+        "warmup": args.warmup,
+        "seed": args.seed,
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nwrote {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            compare(results, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""Touch-to-flip latency of every day-N game under each frame pacing mode.
+
+Each game runs in the real wodi.game.run loop (on the dummy video driver)
+while a background thread taps random on-screen buttons at random moments.
+Every tap is stamped when it is posted; wodi.latency.LatencyProbe records
+the first flip after a tick consumed it (tick) and after a render saw it as
+latched input (feedback). The report gives p50/p95/p99/max milliseconds per
+game and mode.
+
+Run from the repository root:
+    python benchmarks/bench_latency.py --seconds 3 --pacing tick adaptive --late-latch
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from wodi.headless import load_game  # sets the dummy SDL drivers
+import pygame
+
+from bench_games import game_paths, percentiles
+from wodi.game import run
+from wodi.latency import LatencyProbe
+from wodi.pacing import MODES
+
+
+class TapInjector(LatencyProbe):
+    """A probe that also feeds the game taps from a second thread for `seconds`."""
+
+    def __init__(self, seconds, seed, gap=(0.05, 0.25), hold=0.03):
+        super().__init__()
+        self.seconds = seconds
+        self.rng = random.Random(seed)
+        self.gap = gap
+        self.hold = hold
+
+    def start(self, game):
+        super().start(game)
+        threading.Thread(target=self.tap, daemon=True).start()
+
+    def tap(self):
+        end = time.perf_counter() + self.seconds
+        buttons = list(self.game.buttons.values())
+        while time.perf_counter() < end:
+            time.sleep(self.rng.uniform(*self.gap))
+            if buttons:
+                pos = self.rng.choice(buttons).center
+            else:
+                pos = (self.rng.randrange(self.game.width), self.rng.randrange(self.game.height))
+            pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=1,
+                                                 injected_at=time.perf_counter()))
+            time.sleep(self.hold)
+            pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONUP, pos=pos, button=1))
+        pygame.event.post(pygame.event.Event(pygame.QUIT))
+
+
+def summarise(samples):
+    if not samples:
+        return None
+    ms = [s * 1000 for s in samples]
+    summary = {k: round(v, 2) for k, v in percentiles(ms).items()}
+    summary["max"] = round(max(ms), 2)
+    summary["taps"] = len(ms)
+    return summary
+
+
+def measure(path, pacing, late_latch, seconds, seed):
+    name = os.path.basename(os.path.dirname(path))
+    probe = TapInjector(seconds, seed)
+    try:
+        game_cls = load_game(path)
+        random.seed(seed)
+        run(game_cls, pacing=pacing, late_latch=late_latch, probe=probe)
+    except SystemExit:
+        pass
+    except Exception as exc:  # one broken day should not sink the whole report
+        pygame.quit()
+        return {"game": name, "pacing": pacing, "late_latch": late_latch,
+                "error": f"{type(exc).__name__}: {exc}"}
+    return {"game": name, "pacing": pacing, "late_latch": late_latch, "fps": game_cls.render_fps or game_cls.fps,
+            "tick_ms": summarise(probe.tick), "feedback_ms": summarise(probe.feedback)}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("games", nargs="*", help="game.py paths (default: every day-N game)")
+    parser.add_argument("--pacing", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--late-latch", action="store_true", help="also run every mode with late latching")
+    parser.add_argument("--seconds", type=float, default=3.0, help="tapping time per game and mode")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="bench_latency.json")
+    args = parser.parse_args(argv)
+
+    configs = [(mode, False) for mode in args.pacing]
+    if args.late_latch:
+        configs += [(mode, True) for mode in args.pacing]
+
+    results = []
+    print(f"{'game':<36} {'pacing':<15} {'tick p50/p95/p99/max ms':>28} {'feedback p50/p95/p99/max ms':>30}")
+    for path in args.games or game_paths():
+        for pacing, late_latch in configs:
+            r = measure(path, pacing, late_latch, args.seconds, args.seed)
+            results.append(r)
+            label = pacing + ("+latch" if late_latch else "")
+            if "error" in r:
+                print(f"{r['game']:<36} {label:<15} skipped: {r['error']}")
+                continue
+            row = f"{r['game']:<36} {label:<15}"
+            for key, width in (("tick_ms", 28), ("feedback_ms", 30)):
+                s = r[key]
+                cell = f"{s['p50']:.1f} {s['p95']:.1f} {s['p99']:.1f} {s['max']:.1f}" if s else "-"
+                row += f" {cell:>{width}}"
+            print(row)
+
+    with open(args.output, "w") as f:
+        json.dump({"created": time.strftime("%Y-%m-%dT%H:%M:%S"), "seconds": args.seconds,
+                   "seed": args.seed, "results": results}, f, indent=2)
+    print(f"\nwrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
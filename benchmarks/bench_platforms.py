@@ -0,0 +1,83 @@
+"""Platform queries per player step: linear scan vs PlatformIndex.
+
+Levels grow sideways with the platform count, like a long side-scroller, and
+each query is a 40x50 player somewhere in the level. "overlap" is the
+ground-contact check of day-33 to day-35 (the Python loop they used, and
+Rect.collidelistall as the fastest possible scan); "ground" finds the
+nearest platform below the player. Every index answer is checked against
+the scan.
+
+Run from the repository root:
+    python benchmarks/bench_platforms.py
+"""
+
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+import pygame
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from wodi.bvh import PlatformIndex
+
+COUNTS = [3, 10, 100, 1000, 10000]
+LEVEL_HEIGHT = 2000
+WIDTH_PER_PLATFORM = 120
+QUERIES = 2000
+
+
+def make_level(count, rng):
+    width = max(600, count * WIDTH_PER_PLATFORM)
+    return [pygame.Rect(rng.randint(0, width - 150), rng.randint(0, LEVEL_HEIGHT - 20), rng.randint(60, 400), 20)
+            for _ in range(count)], width
+
+
+def loop_overlap(platforms, rect):
+    return [i for i, plat in enumerate(platforms) if rect.colliderect(plat)]
+
+
+def loop_ground(platforms, rect):
+    best, best_top = -1, None
+    for i, plat in enumerate(platforms):
+        if plat.top >= rect.bottom and plat.left < rect.right and plat.right > rect.left:
+            if best_top is None or plat.top < best_top:
+                best, best_top = i, plat.top
+    return best
+
+
+def per_query_us(fn, queries):
+    start = time.perf_counter()
+    answers = [fn(rect) for rect in queries]
+    return (time.perf_counter() - start) / len(queries) * 1e6, answers
+
+
+def main():
+    rng = random.Random(33)
+    print(f"{'platforms':>9} {'build ms':>9} | {'overlap us: loop':>16} {'collidelist':>11} {'index':>7} "
+          f"| {'ground us: loop':>15} {'index':>7}")
+    for count in COUNTS:
+        platforms, width = make_level(count, rng)
+        queries = [pygame.Rect(rng.randint(0, width - 40), rng.randint(0, LEVEL_HEIGHT - 50), 40, 50)
+                   for _ in range(QUERIES)]
+
+        start = time.perf_counter()
+        index = PlatformIndex(platforms)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        loop_us, expected = per_query_us(lambda r: loop_overlap(platforms, r), queries)
+        scan_us, scanned = per_query_us(lambda r: r.collidelistall(platforms), queries)
+        index_us, found = per_query_us(index.overlapping, queries)
+        assert found == expected == scanned
+
+        ground_loop_us, expected = per_query_us(lambda r: loop_ground(platforms, r), queries)
+        ground_index_us, found = per_query_us(index.ground_below, queries)
+        assert found == expected
+
+        print(f"{count:>9} {build_ms:9.2f} | {loop_us:16.2f} {scan_us:11.2f} {index_us:7.2f} "
+              f"| {ground_loop_us:15.2f} {ground_index_us:7.2f}")
+
+
+if __name__ == "__main__":
+    main()
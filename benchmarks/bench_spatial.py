@@ -0,0 +1,84 @@
+"""Bullet-vs-enemy collision cost per frame: nested loop vs SpatialHash.
+
+The arena grows with the entity count so density stays at the level of a busy
+day-41 screen; a flat "us/entity" column means the broadphase scales linearly.
+
+Run from the repository root:
+    python benchmarks/bench_spatial.py
+"""
+
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+import pygame
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from wodi.spatial import SpatialHash
+
+GRID_SIZE = 40
+WIDTH, GAME_TOP = 1080, 80
+CELLS_PER_ENTITY = 8
+COUNTS = [100, 500, 1000, 2000, 5000]
+NAIVE_LIMIT = 2000
+FRAMES = 20
+
+
+def make_rects(count, size, game_bottom, rng):
+    return [pygame.Rect(rng.randint(0, WIDTH - size), rng.randint(GAME_TOP, game_bottom - size), size, size)
+            for _ in range(count)]
+
+
+def naive_frame(enemies, bullets):
+    hits = 0
+    for e in enemies:
+        for b in bullets:
+            if e.colliderect(b):
+                hits += 1
+                break
+    return hits
+
+
+def grid_frame(enemies, bullets, grid):
+    grid.clear()
+    for b in bullets:
+        grid.insert(b, b)
+    hits = 0
+    for e in enemies:
+        for b in grid.query(e):
+            if e.colliderect(b):
+                hits += 1
+                break
+    return hits
+
+
+def time_frames(fn, *args):
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        hits = fn(*args)
+    return (time.perf_counter() - start) / FRAMES * 1000, hits
+
+
+def main():
+    rng = random.Random(41)
+    grid = SpatialHash(GRID_SIZE)
+    print(f"{'entities':>9} {'naive ms':>10} {'grid ms':>9} {'grid us/entity':>15}")
+    for count in COUNTS:
+        rows = count * CELLS_PER_ENTITY // (WIDTH // GRID_SIZE) + 1
+        game_bottom = GAME_TOP + rows * GRID_SIZE
+        enemies = make_rects(count, GRID_SIZE, game_bottom, rng)
+        bullets = make_rects(count, 10, game_bottom, rng)
+        grid_ms, grid_hits = time_frames(grid_frame, enemies, bullets, grid)
+        if count <= NAIVE_LIMIT:
+            naive_ms, naive_hits = time_frames(naive_frame, enemies, bullets)
+            assert naive_hits == grid_hits
+            naive = f"{naive_ms:10.2f}"
+        else:
+            naive = f"{'skipped':>10}"
+        print(f"{count:>9} {naive} {grid_ms:9.2f} {grid_ms * 1000 / (2 * count):15.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Long day-41/42 sessions under the spawn scheduler: live enemies, step time and memory per game minute.
+
+The player is kept alive (game_over is cleared before every tick) and
+never shoots, so only culling removes enemies. Each game runs with its own
+waves, then with a flood wave of four enemies every tick, first capped at
+max_enemies and then with the cap lifted. tracemalloc tracks the memory
+held by Python objects.
+
+Run from the repository root:
+    python benchmarks/bench_spawn.py --minutes 10
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from wodi.headless import DEFAULT_SIZE, load_game  # sets the dummy SDL drivers
+import pygame
+
+from wodi.game import open_screen
+from wodi.input import NO_INPUT
+from wodi.spawn import Wave
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+GAMES = ["day-41-building-games-on-my-phone", "day-42-building-games-on-my-phone"]
+FLOOD = (Wave(1, 4),)
+
+
+def session(game_cls, minutes, waves=None, cap=None):
+    random.seed(42)
+    game = game_cls(open_screen(game_cls, DEFAULT_SIZE))
+    if waves is not None:
+        game.spawner.waves = waves
+    if cap is not None:
+        game.spawner.cap = cap
+    game.reset()
+    per_minute = game.fps * 60
+    rows = []
+    tracemalloc.start()
+    for minute in range(1, minutes + 1):
+        samples = []
+        for _ in range(per_minute):
+            game.game_over = False
+            start = time.perf_counter_ns()
+            game.step(NO_INPUT)
+            samples.append(time.perf_counter_ns() - start)
+        samples.sort()
+        rows.append((minute, len(game.enemies), samples[len(samples) // 2] / 1e6,
+                     samples[len(samples) * 99 // 100] / 1e6, tracemalloc.get_traced_memory()[0] / 1024))
+    tracemalloc.stop()
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--minutes", type=int, default=5, help="game minutes per session")
+    args = parser.parse_args(argv)
+    pygame.init()
+    for name in GAMES:
+        game_cls = load_game(os.path.join(ROOT, name, "game.py"))
+        try:
+            runs = [("waves", session(game_cls, args.minutes)),
+                    ("flood, capped", session(game_cls, args.minutes, FLOOD))]
+            if name != GAMES[0]:  # day-41's pool is its cap; it cannot hold more
+                runs.append(("flood, uncapped", session(game_cls, args.minutes, FLOOD, sys.maxsize)))
+        except FileNotFoundError as e:
+            print(f"{game_cls.caption}: skipped: {e}")
+            continue
+        print(game_cls.caption)
+        print(f"  {'run':<16} {'minute':>6} {'enemies':>8} {'p50 ms':>8} {'p99 ms':>8} {'KiB':>9}")
+        for label, rows in runs:
+            for minute, enemies, p50, p99, kib in rows:
+                print(f"  {label:<16} {minute:>6} {enemies:>8} {p50:8.3f} {p99:8.3f} {kib:9.1f}")
+
+
+if __name__ == "__main__":
+    main()
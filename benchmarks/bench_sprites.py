@@ -0,0 +1,84 @@
+"""Drawing a crowd of enemies and bullets: one call per entity vs SpriteBatch.
+
+Each frame draws `count` 40x40 enemies and as many 10x10 bullets scattered
+over the day-41 play area. "per entity" is what the games did (a
+pygame.draw.rect per enemy and bullet, or a blit per enemy image);
+"batch" queues the same sprites on a SpriteBatch and flushes one blits()
+call per layer. Both renders are compared pixel for pixel.
+
+Run from the repository root:
+    python benchmarks/bench_sprites.py
+"""
+
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+import pygame
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from wodi.batch import SpriteBatch
+
+SCREEN = (1080, 960)
+GRID_SIZE = 40
+COUNTS = [10, 100, 1000, 10000]
+FRAMES = 50
+RED, BLUE, WHITE = (255, 0, 0), (0, 0, 255), (255, 255, 255)
+
+
+def per_entity(screen, enemies, bullets, image):
+    if image is None:
+        for rect in enemies:
+            pygame.draw.rect(screen, RED, rect)
+    else:
+        for rect in enemies:
+            screen.blit(image, rect)
+    for rect in bullets:
+        pygame.draw.rect(screen, BLUE, rect)
+
+
+def batched(screen, batch, enemies, bullets, image):
+    if image is None:
+        batch.rects("enemies", RED, enemies, (GRID_SIZE, GRID_SIZE))
+    else:
+        batch.images("enemies", image, enemies)
+    batch.rects("bullets", BLUE, bullets, (10, 10))
+    batch.flush(screen)
+
+
+def frame_ms(screen, draw):
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        screen.fill(WHITE)
+        draw()
+    return (time.perf_counter() - start) / FRAMES * 1000
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode(SCREEN)
+    image = pygame.Surface((GRID_SIZE, GRID_SIZE)).convert()
+    image.fill(RED)
+    pygame.draw.circle(image, (120, 0, 0), (GRID_SIZE // 2, GRID_SIZE // 2), GRID_SIZE // 3)
+    rng = random.Random(41)
+    batch = SpriteBatch(("enemies", "bullets"))
+
+    print(f"{'entities':>9} | {'rects: per entity ms':>20} {'batch ms':>9} | {'images: per entity ms':>21} {'batch ms':>9}")
+    for count in COUNTS:
+        enemies = [pygame.Rect(rng.randrange(-20, SCREEN[0]), rng.randrange(-20, SCREEN[1]), GRID_SIZE, GRID_SIZE)
+                   for _ in range(count)]
+        bullets = [pygame.Rect(rng.randrange(SCREEN[0]), rng.randrange(SCREEN[1]), 10, 10) for _ in range(count)]
+        row = []
+        for sprite in (None, image):
+            row.append(frame_ms(screen, lambda: per_entity(screen, enemies, bullets, sprite)))
+            expected = pygame.image.tobytes(screen, "RGB")
+            row.append(frame_ms(screen, lambda: batched(screen, batch, enemies, bullets, sprite)))
+            assert pygame.image.tobytes(screen, "RGB") == expected
+        print(f"{count:>9} | {row[0]:20.3f} {row[1]:9.3f} | {row[2]:21.3f} {row[3]:9.3f}")
+
+
+if __name__ == "__main__":
+    main()
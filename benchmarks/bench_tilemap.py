@@ -0,0 +1,71 @@
+"""Streaming a level far wider than the screen: chunk loads and frame cost as the camera scrolls.
+
+A generated platformer level is written to a temporary file, memory-mapped,
+and a 600x400 camera scrolls across it. Each frame streams the chunks
+around the camera and gathers the solid rects near a player-sized box, the
+work a day-33-style game would do per frame. The numbers to watch are
+"loaded", which stays at max_chunks however long the level is, and the
+per-frame time.
+
+Run from the repository root:
+    python benchmarks/bench_tilemap.py --width 200000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+import pygame
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from bench_games import percentiles
+from wodi.tilemap import TileMap, generate
+
+VIEW = (600, 400)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--width", type=int, default=100000, help="level width in tiles")
+    parser.add_argument("--height", type=int, default=64, help="level height in tiles")
+    parser.add_argument("--speed", type=int, default=64, help="camera px per frame")
+    parser.add_argument("--frames", type=int, default=5000)
+    parser.add_argument("--surfaces", action="store_true", help="also draw each visible chunk's surface")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "level.wodt")
+        start = time.perf_counter()
+        generate(path, args.width, args.height)
+        write_s = time.perf_counter() - start
+
+        with TileMap(path) as tilemap:
+            level = tilemap.rect
+            print(f"level {tilemap.width}x{tilemap.height} tiles ({level.width}x{level.height}px), "
+                  f"{os.path.getsize(path) / 1e6:.1f} MB written in {write_s:.1f}s")
+            view = pygame.Rect((0, level.height - VIEW[1]), VIEW)
+            frame_ms, peak = [], 0
+            for frame in range(args.frames):
+                view.x = frame * args.speed % (level.width - VIEW[0])
+                t0 = time.perf_counter()
+                visible = tilemap.stream(view)
+                player = pygame.Rect(view.centerx, view.bottom - 120, 40, 50)
+                tilemap.solids(player.inflate(64, 64))
+                if args.surfaces:
+                    for chunk in visible:
+                        chunk.surface
+                frame_ms.append((time.perf_counter() - t0) * 1000)
+                peak = max(peak, len(tilemap.loaded))
+
+            p = percentiles(frame_ms)
+            print(f"{args.frames} frames at {args.speed}px/frame: {tilemap.loads} chunk loads, "
+                  f"loaded peak {peak} of {tilemap.chunks_x * tilemap.chunks_y} chunks (max_chunks {tilemap.max_chunks})")
+            print(f"frame ms p50 {p['p50']:.3f}  p95 {p['p95']:.3f}  p99 {p['p99']:.3f}  max {max(frame_ms):.3f}")
+
+
+if __name__ == "__main__":
+    main()
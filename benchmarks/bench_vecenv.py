@@ -0,0 +1,110 @@
+"""Environment steps per second of wodi.vecenv, and a check that it plays like the real games.
+
+Every copy takes a random action each step. The throughput table covers
+both environments and both observation kinds at several copy counts.
+The check plays the pygame day-28 and day-41 games through wodi.balance
+and copies of the matching environment under the same scripted policy:
+idle on both games, and on day 41 also standing still while firing every
+other tick. That exercises bullets, swept hits and scoring. It prints
+mean episode length and score, with the environment's standard error.
+The two use different random draws, so the means should agree within a
+couple of standard errors, not exactly.
+
+Run from the repository root:
+    python benchmarks/bench_vecenv.py
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from wodi.balance import sweep
+from wodi.headless import load_game
+from wodi.vecenv import DodgeVecEnv, ShooterVecEnv
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ENVS = [("day-28-building-games-on-my-phone", DodgeVecEnv), ("day-41-building-games-on-my-phone", ShooterVecEnv)]
+COPIES = [1, 64, 1024, 8192]
+MAX_TICKS = 5000
+
+
+def steps_per_second(env_cls, observe, n, steps):
+    env = env_cls(observe=observe, seed=0)
+    env.reset(n)
+    actions = numpy.random.default_rng(0).integers(0, env.num_actions, (steps, n))
+    start = time.perf_counter()
+    for a in actions:
+        env.step(a)
+    return n * steps / (time.perf_counter() - start)
+
+
+def episodes(env_cls, count, max_ticks, act):
+    """Length and score of the first `count` episodes, cut off at max_ticks like wodi.balance.
+
+    act(env) gives every copy's action from its state, e.g. its tick count.
+    """
+    env = env_cls(seed=0)
+    env.reset(count)
+    ticks = numpy.full(count, max_ticks)
+    scores = numpy.zeros(count, dtype=numpy.int64)
+    running = numpy.ones(count, dtype=bool)
+    for _ in range(max_ticks):
+        _, _, done = env.step(act(env))
+        ended = done & running
+        ticks[ended] = env.final_ticks[ended]
+        scores[ended] = env.final_score[ended]
+        running &= ~done
+        if not running.any():
+            break
+    scores[running] = env.score[running]
+    return ticks, scores
+
+
+def idle(env):
+    return numpy.zeros(env.n, dtype=numpy.int64)
+
+
+def shoot(env):
+    # wodi.balance's "shoot" policy: tap shoot on even frames, frame 0 first
+    return numpy.where(env.ticks % 2 == 0, 5, 0)
+
+
+def mean_se(values):
+    return f"{values.mean():.2f} +- {values.std() / numpy.sqrt(len(values)):.2f}"
+
+
+def load_fps(name):
+    return load_game(os.path.join(ROOT, name, "game.py")).fps
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--steps", type=int, default=200, help="steps timed per configuration")
+    parser.add_argument("--episodes", type=int, default=2000, help="episodes per game and policy for the check")
+    args = parser.parse_args(argv)
+
+    print(f"{'environment':<14} {'observe':<7} {'copies':>7} {'steps/sec':>11}")
+    for _, env_cls in ENVS:
+        for observe in ("vector", "grid"):
+            for n in COPIES:
+                rate = steps_per_second(env_cls, observe, n, max(10, args.steps * 64 // max(n, 64)))
+                print(f"{env_cls.__name__:<14} {observe:<7} {n:>7} {rate:11.0f}")
+
+    print()
+    print(f"{'game':<36} {'policy':<6} {'game ticks':>10} {'env ticks':>17} {'game score':>10} {'env score':>14}")
+    checks = [(ENVS[0], "idle", idle), (ENVS[1], "idle", idle), (ENVS[1], "shoot", shoot)]
+    for (name, env_cls), policy, act in checks:
+        report = sweep(os.path.join(ROOT, name, "game.py"), {}, args.episodes, policy=policy, max_ticks=MAX_TICKS)
+        game = report["sets"][0]
+        game_ticks = game["seconds"]["mean"] * load_fps(name)
+        ticks, scores = episodes(env_cls, args.episodes, MAX_TICKS, act)
+        print(f"{report['game']:<36} {policy:<6} {game_ticks:10.1f} {mean_se(ticks):>17} "
+              f"{game['score']['mean']:10.2f} {mean_se(scores):>14}")
+
+
+if __name__ == "__main__":
+    main()
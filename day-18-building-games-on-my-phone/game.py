@@ -1,66 +1,65 @@
 import pygame
 import sys
+import os
 
-# Initialize Pygame
-pygame.init()
-
-# Screen setup
-WIDTH, HEIGHT = 800, 600
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Day 20: Gravity Demo")
-
-# Clock for controlling FPS
-clock = pygame.time.Clock()
-FPS = 60
-
-# Player properties
-player_width = 50
-player_height = 50
-player_x = WIDTH // 2
-player_y = 100
-y_speed = 0           # Vertical speed
-gravity = 0.5         # Gravity acceleration
-jump_speed = -10      # Jump velocity
-ground_level = HEIGHT - 100  # Ground Y position
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from wodi.game import Game, run
+from wodi.timestep import lerp
 
 # Colors
 WHITE = (255, 255, 255)
 RED = (255, 0, 0)
 GREEN = (0, 255, 0)
 
-# Game loop
-running = True
-while running:
-    clock.tick(FPS)
-    screen.fill(WHITE)
 
-    # Event handling
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
+class GravityDemo(Game):
+    caption = "Day 20: Gravity Demo"
+    size = (800, 600)
+    fps = 60              # Physics steps per second; gravity and jump_speed are per step
+    render_fps = 60       # Render cap, 0 = uncapped
+    keys = (pygame.K_SPACE,)
+
+    def __init__(self, screen):
+        super().__init__(screen)
+
+        # Player properties
+        self.player_width = 50
+        self.player_height = 50
+        self.player_x = self.width // 2
+        self.gravity = 0.5         # Gravity acceleration
+        self.jump_speed = -10      # Jump velocity
+        self.ground_level = self.height - 100  # Ground Y position
+        self.reset()
+
+    def reset(self):
+        self.player_y = 100
+        self.prev_y = self.player_y  # Position before the last step, for interpolation
+        self.y_speed = 0             # Vertical speed
+
+    def step(self, inputs):
+        self.prev_y = self.player_y
+        if pygame.K_SPACE in inputs.keys and self.player_y + self.player_height >= self.ground_level:
+            self.y_speed = self.jump_speed
 
-    # Key presses
-    keys = pygame.key.get_pressed()
-    if keys[pygame.K_SPACE] and player_y + player_height >= ground_level:
-        y_speed = jump_speed
+        # Apply gravity
+        self.y_speed += self.gravity
+        self.player_y += self.y_speed
 
-    # Apply gravity
-    y_speed += gravity
-    player_y += y_speed
+        # Ground collision
+        if self.player_y + self.player_height >= self.ground_level:
+            self.player_y = self.ground_level - self.player_height
+            self.y_speed = 0
 
-    # Ground collision
-    if player_y + player_height >= ground_level:
-        player_y = ground_level - player_height
-        y_speed = 0
+    def render(self, surface):
+        surface.fill(WHITE)
 
-    # Draw ground
-    pygame.draw.rect(screen, GREEN, (0, ground_level, WIDTH, HEIGHT - ground_level))
+        # Draw ground
+        pygame.draw.rect(surface, GREEN, (0, self.ground_level, self.width, self.height - self.ground_level))
 
-    # Draw player
-    pygame.draw.rect(screen, RED, (player_x, player_y, player_width, player_height))
+        # Draw player
+        draw_y = lerp(self.prev_y, self.player_y, self.alpha)
+        pygame.draw.rect(surface, RED, (self.player_x, draw_y, self.player_width, self.player_height))
 
-    # Update display
-    pygame.display.update()
 
-pygame.quit()
-sys.exit()
+if __name__ == "__main__":
+    run(GravityDemo)
@@ -1,17 +1,11 @@
 import pygame
 import sys
 import random
+import os
 
-# Initialize pygame
-pygame.init()
-
-# Screen setup
-WIDTH, HEIGHT = 600, 400
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Day 28: Onscreen Buttons + Restart")
-
-# Clock
-clock = pygame.time.Clock()
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from wodi.game import Game, run
+from wodi.text import draw_text
 
 # Colors
 WHITE = (255, 255, 255)
@@ -21,112 +15,105 @@ RED = (255, 0, 0)
 GREEN = (0, 200, 0)
 DARK_GREEN = (0, 150, 0)
 
-# Fonts
-font = pygame.font.SysFont(None, 40)
-
-# Player setup
-player_size = 40
-player = pygame.Rect(WIDTH // 2, HEIGHT - 60, player_size, player_size)
-
-# Enemy setup
-enemy_size = 40
-num_enemies = 5
-enemies = []
-for _ in range(num_enemies):
-    x = random.randint(0, WIDTH - enemy_size)
-    y = random.randint(-150, -40)
-    enemies.append(pygame.Rect(x, y, enemy_size, enemy_size))
-enemy_speed = 5
-
-# Game variables
-score = 0
-game_over = False
-
-# Button setup
-button_width, button_height = 100, 60
-left_button = pygame.Rect(20, HEIGHT - button_height - 10, button_width, button_height)
-right_button = pygame.Rect(WIDTH - button_width - 20, HEIGHT - button_height - 10, button_width, button_height)
-
-def draw_text(text, font, color, x, y, center=True):
-    """Helper to draw text on screen"""
-    label = font.render(text, True, color)
-    rect = label.get_rect()
-    if center:
-        rect.center = (x, y)
-    else:
-        rect.topleft = (x, y)
-    screen.blit(label, rect)
-
-def reset_game():
-    global player, enemies, score, game_over
-    player = pygame.Rect(WIDTH // 2, HEIGHT - 60, player_size, player_size)
-    enemies = []
-    for _ in range(num_enemies):
-        x = random.randint(0, WIDTH - enemy_size)
-        y = random.randint(-150, -40)
-        enemies.append(pygame.Rect(x, y, enemy_size, enemy_size))
-    score = 0
-    game_over = False
-
-# Game loop
-while True:
-    screen.fill(WHITE)
-
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            pygame.quit()
-            sys.exit()
 
+class DodgeGame(Game):
+    caption = "Day 28: Onscreen Buttons + Restart"
+    size = (600, 400)
+    fps = 30
+
+    def __init__(self, screen):
+        super().__init__(screen)
+        WIDTH, HEIGHT = self.width, self.height
+
+        # Fonts
+        self.font = pygame.font.SysFont(None, 40)
+
+        # Player setup
+        self.player_size = 40
+
+        # Enemy setup
+        self.enemy_size = 40
+        self.num_enemies = 5
+        self.enemy_speed = 5
+        self.respawn_range = (-150, -40)  # y an enemy re-enters at, above the screen
+
+        # Button setup
+        button_width, button_height = 100, 60
+        self.buttons = {
+            "left": pygame.Rect(20, HEIGHT - button_height - 10, button_width, button_height),
+            "right": pygame.Rect(WIDTH - button_width - 20, HEIGHT - button_height - 10, button_width, button_height),
+            "restart": pygame.Rect(WIDTH//2 - 80, HEIGHT//2 + 40, 160, 50),
+        }
+        self.reset()
+
+    def reset(self):
+        self.player = pygame.Rect(self.width // 2, self.height - 60, self.player_size, self.player_size)
+        self.enemies = []
+        for _ in range(self.num_enemies):
+            x = random.randint(0, self.width - self.enemy_size)
+            y = random.randint(*self.respawn_range)
+            self.enemies.append(pygame.Rect(x, y, self.enemy_size, self.enemy_size))
+        self.score = 0
+        self.game_over = False
+
+    def counts(self):
+        return {"enemies": len(self.enemies)}
+
+    def step(self, inputs):
         # Restart button after Game Over
-        if game_over and event.type == pygame.MOUSEBUTTONDOWN:
-            mouse_pos = pygame.mouse.get_pos()
-            restart_btn = pygame.Rect(WIDTH//2 - 80, HEIGHT//2 + 40, 160, 50)
-            if restart_btn.collidepoint(mouse_pos):
-                reset_game()
+        if self.game_over:
+            if "restart" in inputs.pressed:
+                self.reset()
+            return
 
-    if not game_over:
         # Handle onscreen button presses
-        mouse_pressed = pygame.mouse.get_pressed()
-        if mouse_pressed[0]:  # Left click (or touch)
-            mouse_pos = pygame.mouse.get_pos()
-            if left_button.collidepoint(mouse_pos) and player.left > 0:
-                player.x -= 5
-            if right_button.collidepoint(mouse_pos) and player.right < WIDTH:
-                player.x += 5
+        player = self.player
+        if "left" in inputs.held and player.left > 0:
+            player.x -= 5
+        if "right" in inputs.held and player.right < self.width:
+            player.x += 5
 
         # Enemy movement
-        for enemy in enemies:
-            enemy.y += enemy_speed
-            if enemy.y > HEIGHT:
-                enemy.y = random.randint(-150, -40)
-                enemy.x = random.randint(0, WIDTH - enemy_size)
-                score += 1
+        for enemy in self.enemies:
+            enemy.y += self.enemy_speed
+            if enemy.y > self.height:
+                enemy.y = random.randint(*self.respawn_range)
+                enemy.x = random.randint(0, self.width - self.enemy_size)
+                self.score += 1
 
             # Collision detection
             if player.colliderect(enemy):
-                game_over = True
-
-        # Draw player + enemies
-        pygame.draw.rect(screen, BLUE, player)
-        for enemy in enemies:
-            pygame.draw.rect(screen, RED, enemy)
-
-        # Draw buttons
-        pygame.draw.rect(screen, DARK_GREEN, left_button)
-        pygame.draw.rect(screen, DARK_GREEN, right_button)
-        draw_text("◀", font, WHITE, left_button.centerx, left_button.centery)
-        draw_text("▶", font, WHITE, right_button.centerx, right_button.centery)
-
-        # Draw score
-        draw_text(f"Score: {score}", font, BLACK, 10, 10, center=False)
-
-    else:
-        # Game over screen
-        draw_text("GAME OVER", font, RED, WIDTH//2, HEIGHT//2 - 20)
-        restart_btn = pygame.Rect(WIDTH//2 - 80, HEIGHT//2 + 40, 160, 50)
-        pygame.draw.rect(screen, GREEN, restart_btn)
-        draw_text("Restart", font, WHITE, restart_btn.centerx, restart_btn.centery)
-        draw_text(f"Final Score: {score}", font, BLACK, WIDTH//2, HEIGHT//2 - 70)
-
-    pygame.display.flip()
-    clock.tick(30)
+                self.game_over = True
+
+    def render(self, surface):
+        surface.fill(WHITE)
+        font = self.font
+        WIDTH, HEIGHT = self.width, self.height
+
+        if not self.game_over:
+            # Draw player + enemies
+            pygame.draw.rect(surface, BLUE, self.player)
+            for enemy in self.enemies:
+                pygame.draw.rect(surface, RED, enemy)
+
+            # Draw buttons
+            left_button, right_button = self.buttons["left"], self.buttons["right"]
+            pygame.draw.rect(surface, DARK_GREEN, left_button)
+            pygame.draw.rect(surface, DARK_GREEN, right_button)
+            draw_text(surface, "◀", font, WHITE, left_button.centerx, left_button.centery)
+            draw_text(surface, "▶", font, WHITE, right_button.centerx, right_button.centery)
+
+            # Draw score
+            draw_text(surface, f"Score: {self.score}", font, BLACK, 10, 10, center=False, dynamic=True)
+
+        else:
+            # Game over screen
+            draw_text(surface, "GAME OVER", font, RED, WIDTH//2, HEIGHT//2 - 20)
+            restart_btn = self.buttons["restart"]
+            pygame.draw.rect(surface, GREEN, restart_btn)
+            draw_text(surface, "Restart", font, WHITE, restart_btn.centerx, restart_btn.centery)
+            draw_text(surface, f"Final Score: {self.score}", font, BLACK, WIDTH//2, HEIGHT//2 - 70)
+
+
+if __name__ == "__main__":
+    run(DodgeGame)
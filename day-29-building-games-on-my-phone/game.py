@@ -1,17 +1,13 @@
 import pygame
 import sys
 import random
+import os
 
-# Initialize
-pygame.init()
-
-# Screen
-WIDTH, HEIGHT = 600, 400
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Day 29: Background Update 🎨")
-
-# Clock
-clock = pygame.time.Clock()
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from wodi.assets import AssetManager
+from wodi.background import Background
+from wodi.game import Game, run
+from wodi.text import draw_text
 
 # Colors
 WHITE = (255, 255, 255)
@@ -21,139 +17,131 @@ RED = (255, 0, 0)
 GREEN = (0, 200, 0)
 GRAY = (30, 30, 30)
 
-# Font
-font = pygame.font.SysFont(None, 40)
-
-# Player setup
-player_size = 40
-player = pygame.Rect(WIDTH // 2, HEIGHT - 60, player_size, player_size)
-
-# Enemy setup
-enemy_size = 40
-num_enemies = 5
-enemies = []
-for _ in range(num_enemies):
-    enemies.append(pygame.Rect(random.randint(0, WIDTH - enemy_size), random.randint(-200, -40), enemy_size, enemy_size))
-enemy_speed = 5
-
-# Buttons
-button_size = (80, 60)
-left_button = pygame.Rect(20, HEIGHT - 70, *button_size)
-right_button = pygame.Rect(WIDTH - 100, HEIGHT - 70, *button_size)
-
-# Game variables
-score = 0
-game_over = False
-
-# Load background image (optional, must be in same folder)
-try:
-    bg_image = pygame.image.load("background.png")
-    bg_image = pygame.transform.scale(bg_image, (WIDTH, HEIGHT))
-except:
-    bg_image = None
-
-def draw_text(text, font, color, x, y, center=True):
-    label = font.render(text, True, color)
-    rect = label.get_rect()
-    if center:
-        rect.center = (x, y)
-    else:
-        rect.topleft = (x, y)
-    screen.blit(label, rect)
-
-def draw_gradient():
-    for i in range(HEIGHT):
-        color = (30, i % 255, 100)  # simple gradient effect
-        pygame.draw.line(screen, color, (0, i), (WIDTH, i))
-
-def reset_game():
-    global player, enemies, score, game_over
-    player = pygame.Rect(WIDTH // 2, HEIGHT - 60, player_size, player_size)
-    enemies.clear()
-    for _ in range(num_enemies):
-        enemies.append(pygame.Rect(random.randint(0, WIDTH - enemy_size), random.randint(-200, -40), enemy_size, enemy_size))
-    score = 0
-    game_over = False
-
-# Background mode: 1=color, 2=gradient, 3=image
-bg_mode = 2  
-
-# Game loop
-while True:
-    # ---- Draw background ----
-    if bg_mode == 1:
-        screen.fill(GRAY)
-    elif bg_mode == 2:
-        draw_gradient()
-    elif bg_mode == 3 and bg_image:
-        screen.blit(bg_image, (0, 0))
-    else:
-        screen.fill(WHITE)
-
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            pygame.quit()
-            sys.exit()
+# Background image (only needed for bg_mode 3, must be in same folder)
+ASSET_DIR = os.path.dirname(os.path.abspath(__file__))
+BG_IMAGE = "background.png"
+
+
+class BackgroundGame(Game):
+    caption = "Day 29: Background Update 🎨"
+    size = (600, 400)
+    fps = 30
+    keys = (pygame.K_LEFT, pygame.K_RIGHT)
+
+    # Background mode: 1=color, 2=gradient, 3=image
+    bg_mode = 2
+
+    def __init__(self, screen):
+        super().__init__(screen)
+        WIDTH, HEIGHT = self.width, self.height
+
+        # Font
+        self.font = pygame.font.SysFont(None, 40)
 
+        # Player setup
+        self.player_size = 40
+
+        # Enemy setup
+        self.enemy_size = 40
+        self.num_enemies = 5
+        self.enemy_speed = 5
+        self.respawn_range = (-200, -40)  # y an enemy re-enters at, above the screen
+        self.enemies = []
+
+        # Buttons
+        button_size = (80, 60)
+        self.buttons = {
+            "left": pygame.Rect(20, HEIGHT - 70, *button_size),
+            "right": pygame.Rect(WIDTH - 100, HEIGHT - 70, *button_size),
+            "restart": pygame.Rect(WIDTH//2 - 80, HEIGHT//2 + 40, 160, 50),
+        }
+
+        self.assets = AssetManager(ASSET_DIR)
+        self.background = self.make_background(self.bg_mode)
+        self.reset()
+
+    def make_background(self, mode):
+        if mode == 1:
+            return Background(color=GRAY)
+        if mode == 2:
+            return Background(gradient=lambda y: (30, y % 255, 100))  # simple gradient effect
+        if mode == 3:
+            return Background(image=self.assets.scaled(BG_IMAGE, (self.width, self.height), alpha=False))
+        return Background(color=WHITE)
+
+    def reset(self):
+        self.player = pygame.Rect(self.width // 2, self.height - 60, self.player_size, self.player_size)
+        self.enemies.clear()
+        for _ in range(self.num_enemies):
+            self.enemies.append(pygame.Rect(random.randint(0, self.width - self.enemy_size), random.randint(*self.respawn_range), self.enemy_size, self.enemy_size))
+        self.score = 0
+        self.game_over = False
+
+    def counts(self):
+        return {"enemies": len(self.enemies)}
+
+    def step(self, inputs):
         # Handle restart
-        if game_over and event.type == pygame.MOUSEBUTTONDOWN:
-            mouse_pos = pygame.mouse.get_pos()
-            restart_btn = pygame.Rect(WIDTH//2 - 80, HEIGHT//2 + 40, 160, 50)
-            if restart_btn.collidepoint(mouse_pos):
-                reset_game()
-
-    keys = pygame.key.get_pressed()
-    if not game_over:
+        if self.game_over:
+            if "restart" in inputs.pressed:
+                self.reset()
+            return
+
         # Handle input
-        moving_left, moving_right = False, False
-        mouse_pressed = pygame.mouse.get_pressed()
-        if mouse_pressed[0]:  # left click
-            mouse_pos = pygame.mouse.get_pos()
-            if left_button.collidepoint(mouse_pos):
-                moving_left = True
-            if right_button.collidepoint(mouse_pos):
-                moving_right = True
+        moving_left = "left" in inputs.held
+        moving_right = "right" in inputs.held
 
         # Player movement
-        if keys[pygame.K_LEFT] or moving_left:
+        player = self.player
+        if pygame.K_LEFT in inputs.keys or moving_left:
             if player.left > 0:
                 player.x -= 5
-        if keys[pygame.K_RIGHT] or moving_right:
-            if player.right < WIDTH:
+        if pygame.K_RIGHT in inputs.keys or moving_right:
+            if player.right < self.width:
                 player.x += 5
 
         # Enemy movement
-        for enemy in enemies:
-            enemy.y += enemy_speed
-            if enemy.y > HEIGHT:
-                enemy.y = random.randint(-200, -40)
-                enemy.x = random.randint(0, WIDTH - enemy_size)
-                score += 1
+        for enemy in self.enemies:
+            enemy.y += self.enemy_speed
+            if enemy.y > self.height:
+                enemy.y = random.randint(*self.respawn_range)
+                enemy.x = random.randint(0, self.width - self.enemy_size)
+                self.score += 1
 
             if player.colliderect(enemy):
-                game_over = True
-
-        # Draw objects
-        pygame.draw.rect(screen, BLUE, player)
-        for enemy in enemies:
-            pygame.draw.rect(screen, RED, enemy)
-
-        # Buttons
-        pygame.draw.rect(screen, GREEN, left_button)
-        draw_text("←", font, WHITE, left_button.centerx, left_button.centery)
-        pygame.draw.rect(screen, GREEN, right_button)
-        draw_text("→", font, WHITE, right_button.centerx, right_button.centery)
-
-        # Score
-        draw_text(f"Score: {score}", font, WHITE, 10, 10, center=False)
-
-    else:
-        # Game Over
-        draw_text("GAME OVER", font, RED, WIDTH//2, HEIGHT//2 - 20)
-        restart_btn = pygame.Rect(WIDTH//2 - 80, HEIGHT//2 + 40, 160, 50)
-        pygame.draw.rect(screen, GREEN, restart_btn)
-        draw_text("Restart", font, WHITE, restart_btn.centerx, restart_btn.centery)
-        draw_text(f"Final Score: {score}", font, WHITE, WIDTH//2, HEIGHT//2 - 70)
-
-    pygame.display.flip()
-    clock.tick(30)
+                self.game_over = True
+
+    def render(self, surface):
+        font = self.font
+        WIDTH, HEIGHT = self.width, self.height
+
+        # ---- Draw background ----
+        self.background.draw(surface)
+
+        if not self.game_over:
+            # Draw objects
+            pygame.draw.rect(surface, BLUE, self.player)
+            for enemy in self.enemies:
+                pygame.draw.rect(surface, RED, enemy)
+
+            # Buttons
+            left_button, right_button = self.buttons["left"], self.buttons["right"]
+            pygame.draw.rect(surface, GREEN, left_button)
+            draw_text(surface, "←", font, WHITE, left_button.centerx, left_button.centery)
+            pygame.draw.rect(surface, GREEN, right_button)
+            draw_text(surface, "→", font, WHITE, right_button.centerx, right_button.centery)
+
+            # Score
+            draw_text(surface, f"Score: {self.score}", font, WHITE, 10, 10, center=False, dynamic=True)
+
+        else:
+            # Game Over
+            draw_text(surface, "GAME OVER", font, RED, WIDTH//2, HEIGHT//2 - 20)
+            restart_btn = self.buttons["restart"]
+            pygame.draw.rect(surface, GREEN, restart_btn)
+            draw_text(surface, "Restart", font, WHITE, restart_btn.centerx, restart_btn.centery)
+            draw_text(surface, f"Final Score: {self.score}", font, WHITE, WIDTH//2, HEIGHT//2 - 70)
+
+
+if __name__ == "__main__":
+    run(BackgroundGame)
@@ -1,16 +1,13 @@
 import pygame
 import random
 import sys
+import os
 
-pygame.init()
-
-# --- Setup ---
-WIDTH, HEIGHT = 480, 640
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Day 31: Collisions & Gravity")
-
-clock = pygame.time.Clock()
-font = pygame.font.Font(None, 40)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from wodi.game import Game, run
+from wodi.sweep import hits
+from wodi.text import text_cache
+from wodi.timestep import lerp_rect
 
 # --- Colors ---
 WHITE = (255, 255, 255)
@@ -20,131 +17,144 @@ GREEN = (0, 200, 0)
 BLACK = (0, 0, 0)
 GREY = (200, 200, 200)
 
-# --- Game Variables ---
-gravity = 0.8
-jump_strength = -14
-player_speed = 6
-enemy_speed = 5
-
-# --- Player Setup ---
-player_size = 40
-player = pygame.Rect(WIDTH//2, HEIGHT-100, player_size, player_size)
-player_vel_y = 0
-on_ground = True
-
-# --- Enemies ---
-enemy_size = 40
-enemies = [pygame.Rect(random.randint(0, WIDTH-enemy_size), -i*150, enemy_size, enemy_size) for i in range(5)]
-
-# --- Buttons ---
-btn_w, btn_h = 80, 80
-left_btn = pygame.Rect(30, HEIGHT-btn_h-30, btn_w, btn_h)
-right_btn = pygame.Rect(130, HEIGHT-btn_h-30, btn_w, btn_h)
-jump_btn = pygame.Rect(WIDTH-110, HEIGHT-btn_h-30, btn_w, btn_h)
-
-# --- Game State ---
-score = 0
-game_over = False
-
-# --- Helper Functions ---
-def reset_game():
-    global player, player_vel_y, on_ground, enemies, score, game_over
-    player.x = WIDTH//2
-    player.y = HEIGHT-100
-    player_vel_y = 0
-    on_ground = True
-    enemies = [pygame.Rect(random.randint(0, WIDTH-enemy_size), -i*150, enemy_size, enemy_size) for i in range(5)]
-    score = 0
-    game_over = False
-
-def draw_buttons():
-    pygame.draw.rect(screen, GREY, left_btn, border_radius=15)
-    pygame.draw.rect(screen, GREY, right_btn, border_radius=15)
-    pygame.draw.rect(screen, GREY, jump_btn, border_radius=15)
-    screen.blit(font.render("◀", True, BLACK), (left_btn.x+25, left_btn.y+25))
-    screen.blit(font.render("▶", True, BLACK), (right_btn.x+25, right_btn.y+25))
-    screen.blit(font.render("⬆", True, BLACK), (jump_btn.x+25, jump_btn.y+25))
-
-# --- Main Loop ---
-running = True
-while running:
-    screen.fill(WHITE)
-    dt = clock.tick(60)
-
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
-
-        if game_over and event.type == pygame.MOUSEBUTTONDOWN:
-            reset_game()
-
-    keys = pygame.key.get_pressed()
-    mouse = pygame.mouse.get_pressed()
-    mx, my = pygame.mouse.get_pos()
-
-    # --- Handle input ---
-    move_left = keys[pygame.K_LEFT] or (mouse[0] and left_btn.collidepoint(mx, my))
-    move_right = keys[pygame.K_RIGHT] or (mouse[0] and right_btn.collidepoint(mx, my))
-    jump_pressed = (keys[pygame.K_SPACE] or (mouse[0] and jump_btn.collidepoint(mx, my)))
-
-    if not game_over:
+
+class GravityDodgeGame(Game):
+    caption = "Day 31: Collisions & Gravity"
+    size = (480, 640)
+    fps = 60          # physics steps per second; gravity, jump_strength and speeds are per step
+    render_fps = 60   # 0 = uncapped
+    keys = (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_SPACE)
+
+    def __init__(self, screen):
+        super().__init__(screen)
+        WIDTH, HEIGHT = self.width, self.height
+        self.font = pygame.font.Font(None, 40)
+
+        # --- Game Variables ---
+        self.gravity = 0.8
+        self.jump_strength = -14
+        self.player_speed = 6
+        self.enemy_speed = 5
+        self.respawn_range = (-300, -40)  # y a fallen enemy re-enters at
+
+        # --- Player Setup ---
+        self.player_size = 40
+        self.player = pygame.Rect(WIDTH//2, HEIGHT-100, self.player_size, self.player_size)
+
+        # --- Enemies ---
+        self.enemy_size = 40
+        self.num_enemies = 5
+
+        # --- Buttons ---
+        btn_w, btn_h = 80, 80
+        self.buttons = {
+            "left": pygame.Rect(30, HEIGHT-btn_h-30, btn_w, btn_h),
+            "right": pygame.Rect(130, HEIGHT-btn_h-30, btn_w, btn_h),
+            "jump": pygame.Rect(WIDTH-110, HEIGHT-btn_h-30, btn_w, btn_h),
+        }
+        self.reset()
+
+    def reset(self):
+        WIDTH, HEIGHT = self.width, self.height
+        self.player.x = WIDTH//2
+        self.player.y = HEIGHT-100
+        self.player_vel_y = 0
+        self.on_ground = True
+        self.enemies = [pygame.Rect(random.randint(0, WIDTH-self.enemy_size), -i*150, self.enemy_size, self.enemy_size) for i in range(self.num_enemies)]
+        # Positions before the last physics step, for interpolated drawing
+        self.prev_player = self.player.copy()
+        self.prev_enemies = [enemy.copy() for enemy in self.enemies]
+        self.score = 0
+        self.game_over = False
+
+    def step(self, inputs):
+        if self.game_over:
+            if inputs.taps:
+                self.reset()
+            return
+
+        # --- Handle input ---
+        keys = inputs.keys
+        move_left = pygame.K_LEFT in keys or "left" in inputs.held
+        move_right = pygame.K_RIGHT in keys or "right" in inputs.held
+        jump_pressed = pygame.K_SPACE in keys or "jump" in inputs.held
+
+        player = self.player
+        self.prev_player = player.copy()
+        self.prev_enemies = [enemy.copy() for enemy in self.enemies]
+
         # Horizontal movement
         if move_left:
-            player.x -= player_speed
+            player.x -= self.player_speed
         if move_right:
-            player.x += player_speed
+            player.x += self.player_speed
 
         # Gravity
-        player_vel_y += gravity
-        player.y += player_vel_y
+        self.player_vel_y += self.gravity
+        player.y += self.player_vel_y
 
         # Ground collision
-        ground_y = HEIGHT - 60
+        ground_y = self.height - 60
         if player.bottom >= ground_y:
             player.bottom = ground_y
-            player_vel_y = 0
-            on_ground = True
+            self.player_vel_y = 0
+            self.on_ground = True
         else:
-            on_ground = False
+            self.on_ground = False
 
         # Jump
-        if jump_pressed and on_ground:
-            player_vel_y = jump_strength
-            on_ground = False
+        if jump_pressed and self.on_ground:
+            self.player_vel_y = self.jump_strength
+            self.on_ground = False
 
         # Enemies fall
-        for enemy in enemies:
-            enemy.y += enemy_speed
-            if enemy.top > HEIGHT:
-                enemy.x = random.randint(0, WIDTH-enemy_size)
-                enemy.y = random.randint(-300, -40)
-
-        # Collision detection
-        for enemy in enemies:
-            if player.colliderect(enemy):
-                game_over = True
+        for i, enemy in enumerate(self.enemies):
+            enemy.y += self.enemy_speed
+            if enemy.top > self.height:
+                enemy.x = random.randint(0, self.width-self.enemy_size)
+                enemy.y = random.randint(*self.respawn_range)
+                self.prev_enemies[i] = enemy.copy()  # don't interpolate across a respawn
+
+        # Collision detection, swept over the step so a fast enemy cannot fall through the player
+        for prev_enemy, enemy in zip(self.prev_enemies, self.enemies):
+            if hits(self.prev_player, player, prev_enemy, enemy):
+                self.game_over = True
 
         # Scoring
-        score += 1
-
-    # --- Draw ---
-    pygame.draw.rect(screen, BLUE, player)
-    for enemy in enemies:
-        pygame.draw.rect(screen, RED, enemy)
-
-    draw_buttons()
-
-    # --- HUD ---
-    if not game_over:
-        text = font.render(f"Score: {score//10}", True, BLACK)
-        screen.blit(text, (20, 20))
-    else:
-        over_text = font.render("GAME OVER", True, RED)
-        restart_text = font.render("Tap anywhere to restart", True, BLACK)
-        screen.blit(over_text, (WIDTH//2 - 100, HEIGHT//2 - 40))
-        screen.blit(restart_text, (WIDTH//2 - 170, HEIGHT//2 + 10))
+        self.score += 1
+
+    def draw_buttons(self, surface):
+        font = self.font
+        left_btn, right_btn, jump_btn = self.buttons["left"], self.buttons["right"], self.buttons["jump"]
+        pygame.draw.rect(surface, GREY, left_btn, border_radius=15)
+        pygame.draw.rect(surface, GREY, right_btn, border_radius=15)
+        pygame.draw.rect(surface, GREY, jump_btn, border_radius=15)
+        surface.blit(text_cache.render("◀", font, BLACK), (left_btn.x+25, left_btn.y+25))
+        surface.blit(text_cache.render("▶", font, BLACK), (right_btn.x+25, right_btn.y+25))
+        surface.blit(text_cache.render("⬆", font, BLACK), (jump_btn.x+25, jump_btn.y+25))
+
+    def render(self, surface):
+        surface.fill(WHITE)
+        font = self.font
+        WIDTH, HEIGHT = self.width, self.height
+
+        # --- Draw ---
+        alpha = 1 if self.game_over else self.alpha
+        pygame.draw.rect(surface, BLUE, lerp_rect(self.prev_player, self.player, alpha))
+        for prev, enemy in zip(self.prev_enemies, self.enemies):
+            pygame.draw.rect(surface, RED, lerp_rect(prev, enemy, alpha))
+
+        self.draw_buttons(surface)
+
+        # --- HUD ---
+        if not self.game_over:
+            text_cache.draw(surface, f"Score: {self.score//10}", font, BLACK, 20, 20, center=False, dynamic=True)
+        else:
+            over_text = text_cache.render("GAME OVER", font, RED)
+            restart_text = text_cache.render("Tap anywhere to restart", font, BLACK)
+            surface.blit(over_text, (WIDTH//2 - 100, HEIGHT//2 - 40))
+            surface.blit(restart_text, (WIDTH//2 - 170, HEIGHT//2 + 10))
 
-    pygame.display.flip()
 
-pygame.quit()
-sys.exit()
+if __name__ == "__main__":
+    run(GravityDodgeGame)
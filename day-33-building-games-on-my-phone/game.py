@@ -1,17 +1,14 @@
 import pygame
 import sys
 import random
+import os
 
-# Initialize Pygame
-pygame.init()
-
-# Screen setup
-WIDTH, HEIGHT = 600, 400
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Day 33: Platforms & Health Demo 🟦🟥")
-
-# Clock
-clock = pygame.time.Clock()
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from wodi.bvh import PlatformIndex
+from wodi.camera import Camera, StaticLayer
+from wodi.game import Game, run
+from wodi.text import draw_text
+from wodi.timestep import lerp_rect
 
 # Colors
 WHITE = (255, 255, 255)
@@ -21,156 +18,167 @@ GREEN = (0, 200, 0)
 BLACK = (0, 0, 0)
 YELLOW = (255, 255, 0)
 
-# Fonts
-font = pygame.font.SysFont(None, 36)
-
-# Player setup
-player_size = 40
-player_speed = 5
-player = pygame.Rect(WIDTH//2, HEIGHT-60, player_size, player_size)
-player_vel_y = 0
-gravity = 1
-jump_strength = -15
-on_ground = False
-
-# Enemy setup (static)
-enemy_size = 40
-enemy = pygame.Rect(WIDTH-100, HEIGHT-100, enemy_size, enemy_size)
-
-# Platforms
-platforms = [
-    pygame.Rect(100, HEIGHT-150, 150, 20),
-    pygame.Rect(300, HEIGHT-200, 150, 20),
-    pygame.Rect(50, HEIGHT-250, 150, 20),
-]
-
-# Health & score
-max_health = 3
-health = max_health
-score = 0
-
-# On-screen buttons
-button_size = 60
-left_button = pygame.Rect(10, HEIGHT - button_size - 10, button_size, button_size)
-right_button = pygame.Rect(WIDTH - button_size - 10, HEIGHT - button_size - 10, button_size, button_size)
-jump_button = pygame.Rect(WIDTH//2 - button_size//2, HEIGHT - button_size - 10, button_size, button_size)
-
-# Game variables
-game_over = False
-
-# Helper to draw text
-def draw_text(text, font, color, x, y, center=True):
-    label = font.render(text, True, color)
-    rect = label.get_rect()
-    if center:
-        rect.center = (x, y)
-    else:
-        rect.topleft = (x, y)
-    screen.blit(label, rect)
-
-# Reset game
-def reset_game():
-    global player, player_vel_y, health, score, game_over
-    player.x = WIDTH//2
-    player.y = HEIGHT-60
-    player_vel_y = 0
-    health = max_health
-    score = 0
-    game_over = False
-
-# Game loop
-while True:
-    screen.fill(WHITE)
-    keys = pygame.key.get_pressed()
-
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            pygame.quit()
-            sys.exit()
-
-        # On-screen button taps
-        if event.type == pygame.MOUSEBUTTONDOWN and not game_over:
-            mouse_pos = pygame.mouse.get_pos()
-            if left_button.collidepoint(mouse_pos):
-                player.x -= player_speed
-            if right_button.collidepoint(mouse_pos):
-                player.x += player_speed
-            if jump_button.collidepoint(mouse_pos) and on_ground:
-                player_vel_y = jump_strength
 
+class PlatformGame(Game):
+    caption = "Day 33: Platforms & Health Demo 🟦🟥"
+    size = (600, 400)
+    fps = 60          # physics steps per second; gravity, jump_strength and player_speed are per step
+    render_fps = 60   # 0 = uncapped
+    keys = (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP)
+
+    def __init__(self, screen):
+        super().__init__(screen)
+        WIDTH, HEIGHT = self.width, self.height
+
+        # Fonts
+        self.font = pygame.font.SysFont(None, 36)
+
+        # Player setup
+        self.player_size = 40
+        self.player_speed = 5
+        self.player = pygame.Rect(WIDTH//2, HEIGHT-60, self.player_size, self.player_size)
+        self.gravity = 1
+        self.jump_strength = -15
+        self.on_ground = False
+
+        # Enemy setup (static)
+        enemy_size = 40
+        self.enemy = pygame.Rect(WIDTH-100, HEIGHT-100, enemy_size, enemy_size)
+
+        # Platforms
+        self.platforms = [
+            pygame.Rect(100, HEIGHT-150, 150, 20),
+            pygame.Rect(300, HEIGHT-200, 150, 20),
+            pygame.Rect(50, HEIGHT-250, 150, 20),
+        ]
+        self.platform_index = PlatformIndex(self.platforms)
+        # Drawn once into cached chunk surfaces; render() blits the visible ones
+        self.platform_layer = StaticLayer((plat, BLACK) for plat in self.platforms)
+        self.camera = Camera((self.width, self.height))
+
+        # Health
+        self.max_health = 3
+
+        # On-screen buttons
+        button_size = 60
+        self.buttons = {
+            "left": pygame.Rect(10, HEIGHT - button_size - 10, button_size, button_size),
+            "right": pygame.Rect(WIDTH - button_size - 10, HEIGHT - button_size - 10, button_size, button_size),
+            "jump": pygame.Rect(WIDTH//2 - button_size//2, HEIGHT - button_size - 10, button_size, button_size),
+            "restart": pygame.Rect(WIDTH//2 - 80, HEIGHT//2 + 40, 160, 50),
+        }
+        self.reset()
+
+    def reset(self):
+        self.player.x = self.width//2
+        self.player.y = self.height-60
+        self.prev_player = self.player.copy()  # Position before the last step, for interpolation
+        self.player_vel_y = 0
+        self.health = self.max_health
+        self.score = 0
+        self.game_over = False
+
+    def step(self, inputs):
         # Restart
-        if game_over and event.type == pygame.MOUSEBUTTONDOWN:
-            mouse_pos = pygame.mouse.get_pos()
-            restart_btn = pygame.Rect(WIDTH//2 - 80, HEIGHT//2 + 40, 160, 50)
-            if restart_btn.collidepoint(mouse_pos):
-                reset_game()
+        if self.game_over:
+            if "restart" in inputs.pressed:
+                self.reset()
+            return
+
+        player = self.player
+        keys = inputs.keys
+        self.prev_player = player.copy()
+
+        # On-screen button taps
+        if "left" in inputs.pressed:
+            player.x -= self.player_speed
+        if "right" in inputs.pressed:
+            player.x += self.player_speed
+        if "jump" in inputs.pressed and self.on_ground:
+            self.player_vel_y = self.jump_strength
 
-    if not game_over:
         # Keyboard movement
-        if keys[pygame.K_LEFT] and player.left > 0:
-            player.x -= player_speed
-        if keys[pygame.K_RIGHT] and player.right < WIDTH:
-            player.x += player_speed
-        if keys[pygame.K_UP] and on_ground:
-            player_vel_y = jump_strength
+        if pygame.K_LEFT in keys and player.left > 0:
+            player.x -= self.player_speed
+        if pygame.K_RIGHT in keys and player.right < self.width:
+            player.x += self.player_speed
+        if pygame.K_UP in keys and self.on_ground:
+            self.player_vel_y = self.jump_strength
 
         # Gravity
-        player_vel_y += gravity
-        player.y += player_vel_y
+        self.player_vel_y += self.gravity
+        player.y += self.player_vel_y
 
         # Collision with platforms
-        on_ground = False
-        for plat in platforms:
-            if player.colliderect(plat) and player_vel_y >= 0:
+        self.on_ground = False
+        platforms = self.platforms
+        for i in self.platform_index.resting_on(player):
+            plat = platforms[i]
+            if player.colliderect(plat) and self.player_vel_y >= 0:
                 player.bottom = plat.top
-                player_vel_y = 0
-                on_ground = True
+                self.player_vel_y = 0
+                self.on_ground = True
+        if not self.on_ground and self.player_vel_y >= 0:
+            # A fast fall can pass a 20px platform between two steps; sweep the whole move
+            hit = self.platform_index.landing(self.prev_player, player)
+            if hit:
+                player.bottom = platforms[hit.index].top
+                self.player_vel_y = 0
+                self.on_ground = True
 
         # Floor collision
-        if player.bottom >= HEIGHT - 60:
-            player.bottom = HEIGHT - 60
-            player_vel_y = 0
-            on_ground = True
+        if player.bottom >= self.height - 60:
+            player.bottom = self.height - 60
+            self.player_vel_y = 0
+            self.on_ground = True
 
         # Collision with enemy
-        if player.colliderect(enemy):
-            health -= 1
-            player.x = WIDTH//2  # Reset player position
-            player.y = HEIGHT - 60
-            player_vel_y = 0
-            if health <= 0:
-                game_over = True
-
-        # Score: increase for staying alive each frame
-        score += 1
-
-    # Draw player and enemy
-    pygame.draw.rect(screen, BLUE, player)
-    pygame.draw.rect(screen, RED, enemy)
-
-    # Draw platforms
-    for plat in platforms:
-        pygame.draw.rect(screen, BLACK, plat)
-
-    # Draw on-screen buttons
-    pygame.draw.rect(screen, GREEN, left_button)
-    pygame.draw.rect(screen, GREEN, right_button)
-    pygame.draw.rect(screen, YELLOW, jump_button)
-    draw_text("←", font, WHITE, left_button.centerx, left_button.centery)
-    draw_text("→", font, WHITE, right_button.centerx, right_button.centery)
-    draw_text("↑", font, WHITE, jump_button.centerx, jump_button.centery)
-
-    # Draw score and health
-    draw_text(f"Score: {score}", font, BLACK, 10, 10, center=False)
-    draw_text(f"Health: {health}", font, RED, WIDTH - 10, 10, center=False)
-
-    # Game over screen
-    if game_over:
-        draw_text("GAME OVER", font, RED, WIDTH//2, HEIGHT//2 - 20)
-        draw_text(f"Final Score: {score}", font, BLACK, WIDTH//2, HEIGHT//2 - 70)
-        restart_btn = pygame.Rect(WIDTH//2 - 80, HEIGHT//2 + 40, 160, 50)
-        pygame.draw.rect(screen, GREEN, restart_btn)
-        draw_text("Restart", font, WHITE, restart_btn.centerx, restart_btn.centery)
-
-    pygame.display.flip()
-    clock.tick(60)
+        if player.colliderect(self.enemy):
+            self.health -= 1
+            player.x = self.width//2  # Reset player position
+            player.y = self.height - 60
+            self.player_vel_y = 0
+            self.prev_player = player.copy()
+            if self.health <= 0:
+                self.game_over = True
+
+        # Score: increase for staying alive each step
+        self.score += 1
+
+    def render(self, surface):
+        surface.fill(WHITE)
+        font = self.font
+        WIDTH, HEIGHT = self.width, self.height
+
+        # Draw player and enemy
+        alpha = 1 if self.game_over else self.alpha
+        pygame.draw.rect(surface, BLUE, lerp_rect(self.prev_player, self.player, alpha))
+        pygame.draw.rect(surface, RED, self.enemy)
+
+        # Draw platforms
+        self.camera.draw(surface, self.platform_layer)
+
+        # Draw on-screen buttons
+        left_button, right_button, jump_button = self.buttons["left"], self.buttons["right"], self.buttons["jump"]
+        pygame.draw.rect(surface, GREEN, left_button)
+        pygame.draw.rect(surface, GREEN, right_button)
+        pygame.draw.rect(surface, YELLOW, jump_button)
+        draw_text(surface, "←", font, WHITE, left_button.centerx, left_button.centery)
+        draw_text(surface, "→", font, WHITE, right_button.centerx, right_button.centery)
+        draw_text(surface, "↑", font, WHITE, jump_button.centerx, jump_button.centery)
+
+        # Draw score and health
+        draw_text(surface, f"Score: {self.score}", font, BLACK, 10, 10, center=False, dynamic=True)
+        draw_text(surface, f"Health: {self.health}", font, RED, WIDTH - 10, 10, center=False)
+
+        # Game over screen
+        if self.game_over:
+            draw_text(surface, "GAME OVER", font, RED, WIDTH//2, HEIGHT//2 - 20)
+            draw_text(surface, f"Final Score: {self.score}", font, BLACK, WIDTH//2, HEIGHT//2 - 70)
+            restart_btn = self.buttons["restart"]
+            pygame.draw.rect(surface, GREEN, restart_btn)
+            draw_text(surface, "Restart", font, WHITE, restart_btn.centerx, restart_btn.centery)
+
+
+if __name__ == "__main__":
+    run(PlatformGame)
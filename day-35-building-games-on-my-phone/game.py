@@ -1,13 +1,16 @@
 import pygame
 import sys
+import os
 
-pygame.init()
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from wodi.bvh import PlatformIndex
+from wodi.camera import Camera, StaticLayer
+from wodi.game import Game, run
+from wodi.text import draw_text
+from wodi.timestep import lerp_rect
 
 # === Screen setup ===
 WIDTH, HEIGHT = 600, 400
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Day 35: Player Class Upgrade 🚀")
-clock = pygame.time.Clock()
 
 # === Colors ===
 WHITE = (255, 255, 255)
@@ -16,21 +19,9 @@ RED = (255, 0, 0)
 GREEN = (0, 200, 0)
 BLUE = (0, 0, 255)
 
-# === Fonts ===
-font = pygame.font.SysFont(None, 36)
-
 # === Physics ===
 GRAVITY = 0.6
-
-# === Platforms ===
-platforms = [pygame.Rect(100, HEIGHT - 150, 400, 20)]
-
-# === Buttons ===
-button_size = 80
-button_y = HEIGHT - button_size - 30
-left_button = pygame.Rect(10, button_y, button_size, button_size)
-right_button = pygame.Rect(WIDTH - button_size - 10, button_y, button_size, button_size)
-jump_button = pygame.Rect(WIDTH // 2 - button_size // 2, button_y, button_size, button_size)
+PHYSICS_HZ = 60   # GRAVITY, speed and jump_force are per physics step
 
 
 # === PLAYER CLASS ===
@@ -40,6 +31,7 @@ class Player:
     def __init__(self, x, y):
         self.width, self.height = 40, 50
         self.rect = pygame.Rect(x, y, self.width, self.height)
+        self.prev_rect = self.rect.copy()
         self.vel_y = 0
         self.speed = 5
         self.jump_force = -12
@@ -70,13 +62,26 @@ class Player:
         self.rect.y += self.vel_y
 
     def check_collisions(self, platforms):
-        """Check and resolve collisions with platforms and ground."""
+        """Check and resolve collisions with platforms and ground.
+
+        platforms is the level's PlatformIndex, so only platforms near the
+        player are looked at. The fall since prev_rect is swept, so however
+        far one step moves the player, they land on the first platform top
+        they cross.
+        """
         self.on_ground = False
-        for plat in platforms:
+        for i in platforms.resting_on(self.rect):
+            plat = platforms.platforms[i]
             if self.rect.colliderect(plat) and self.vel_y >= 0:
                 self.rect.bottom = plat.top
                 self.vel_y = 0
                 self.on_ground = True
+        if not self.on_ground and self.vel_y >= 0:
+            hit = platforms.landing(self.prev_rect, self.rect)
+            if hit:
+                self.rect.bottom = platforms.platforms[hit.index].top
+                self.vel_y = 0
+                self.on_ground = True
 
         # Floor collision
         if self.rect.bottom > HEIGHT - 60:
@@ -85,6 +90,8 @@ class Player:
             self.on_ground = True
 
     def update(self, move_left, move_right, jump_pressed, platforms):
+        """Advance one fixed physics step."""
+        self.prev_rect = self.rect.copy()
         self.handle_input(move_left, move_right, jump_pressed)
         self.apply_gravity()
         self.check_collisions(platforms)
@@ -97,97 +104,94 @@ class Player:
             if self.frame_timer % 10 == 0:
                 self.current_frame = (self.current_frame + 1) % len(self.walk_frames)
 
-    def draw(self, surface):
+    def draw(self, surface, alpha=1):
+        """Draw between the last two physics steps; alpha comes from the FixedTimestep."""
+        pos = lerp_rect(self.prev_rect, self.rect, alpha).topleft
         if not self.on_ground:
-            surface.blit(self.jump_frame, self.rect.topleft)
+            surface.blit(self.jump_frame, pos)
         else:
-            surface.blit(self.walk_frames[self.current_frame], self.rect.topleft)
-
-
-# === Enemy setup ===
-enemy = pygame.Rect(WIDTH - 90, HEIGHT - 100, 40, 40)
-
-# === Player instance ===
-player = Player(WIDTH // 2, HEIGHT - 100)
-
-# === Game state ===
-move_left = move_right = jump_pressed = False
-game_over = False
-
-
-# === Helper Functions ===
-def draw_text(text, font, color, x, y, center=True):
-    label = font.render(text, True, color)
-    rect = label.get_rect(center=(x, y)) if center else label.get_rect(topleft=(x, y))
-    screen.blit(label, rect)
-
-
-def draw_ui():
-    # Buttons
-    pygame.draw.rect(screen, GREEN, left_button)
-    pygame.draw.rect(screen, GREEN, right_button)
-    pygame.draw.rect(screen, GREEN, jump_button)
-
-    draw_text("←", font, WHITE, *left_button.center)
-    draw_text("→", font, WHITE, *right_button.center)
-    draw_text("↑", font, WHITE, *jump_button.center)
-
-
-def reset_game():
-    global player, move_left, move_right, jump_pressed, game_over
-    player = Player(WIDTH // 2, HEIGHT - 100)
-    move_left = move_right = jump_pressed = False
-    game_over = False
-
+            surface.blit(self.walk_frames[self.current_frame], pos)
+
+
+# === GAME CLASS ===
+class PlayerClassGame(Game):
+    caption = "Day 35: Player Class Upgrade 🚀"
+    size = (WIDTH, HEIGHT)
+    fps = PHYSICS_HZ
+    render_fps = 60   # 0 = uncapped
+
+    def __init__(self, screen):
+        super().__init__(screen)
+
+        # === Fonts ===
+        self.font = pygame.font.SysFont(None, 36)
+
+        # === Platforms ===
+        self.platforms = [pygame.Rect(100, HEIGHT - 150, 400, 20)]
+        self.platform_index = PlatformIndex(self.platforms)
+        # Drawn once into cached chunk surfaces; render() blits the visible ones
+        self.platform_layer = StaticLayer((plat, BLACK) for plat in self.platforms)
+        self.camera = Camera((WIDTH, HEIGHT))
+
+        # === Enemy setup ===
+        self.enemy = pygame.Rect(WIDTH - 90, HEIGHT - 100, 40, 40)
+
+        # === Buttons ===
+        button_size = 80
+        button_y = HEIGHT - button_size - 30
+        self.buttons = {
+            "left": pygame.Rect(10, button_y, button_size, button_size),
+            "right": pygame.Rect(WIDTH - button_size - 10, button_y, button_size, button_size),
+            "jump": pygame.Rect(WIDTH // 2 - button_size // 2, button_y, button_size, button_size),
+            "restart": pygame.Rect(WIDTH // 2 - 80, HEIGHT // 2 + 40, 160, 50),
+        }
+        self.reset()
+
+    def reset(self):
+        self.player = Player(WIDTH // 2, HEIGHT - 100)
+        self.game_over = False
+
+    def step(self, inputs):
+        # Restart logic
+        if self.game_over:
+            if "restart" in inputs.held:
+                self.reset()
+            return
 
-# === MAIN GAME LOOP ===
-while True:
-    screen.fill(WHITE)
+        held = inputs.held
+        self.player.update("left" in held, "right" in held, "jump" in held, self.platform_index)
 
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            pygame.quit()
-            sys.exit()
+        # Check enemy collision
+        if self.player.rect.colliderect(self.enemy):
+            self.game_over = True
 
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            pos = pygame.mouse.get_pos()
-            if left_button.collidepoint(pos):
-                move_left = True
-            if right_button.collidepoint(pos):
-                move_right = True
-            if jump_button.collidepoint(pos):
-                jump_pressed = True
+    def draw_ui(self, surface):
+        # Buttons
+        left_button, right_button, jump_button = self.buttons["left"], self.buttons["right"], self.buttons["jump"]
+        pygame.draw.rect(surface, GREEN, left_button)
+        pygame.draw.rect(surface, GREEN, right_button)
+        pygame.draw.rect(surface, GREEN, jump_button)
 
-        if event.type == pygame.MOUSEBUTTONUP:
-            move_left = move_right = jump_pressed = False
+        draw_text(surface, "←", self.font, WHITE, *left_button.center)
+        draw_text(surface, "→", self.font, WHITE, *right_button.center)
+        draw_text(surface, "↑", self.font, WHITE, *jump_button.center)
 
-    # === Game logic ===
-    if not game_over:
-        player.update(move_left, move_right, jump_pressed, platforms)
+    def render(self, surface):
+        surface.fill(WHITE)
 
-        # Check enemy collision
-        if player.rect.colliderect(enemy):
-            game_over = True
+        # === Draw everything ===
+        self.camera.draw(surface, self.platform_layer)
 
-    # === Draw everything ===
-    for plat in platforms:
-        pygame.draw.rect(screen, BLACK, plat)
+        pygame.draw.rect(surface, RED, self.enemy)
+        self.player.draw(surface, 1 if self.game_over else self.alpha)
+        self.draw_ui(surface)
 
-    pygame.draw.rect(screen, RED, enemy)
-    player.draw(screen)
-    draw_ui()
+        if self.game_over:
+            draw_text(surface, "GAME OVER", self.font, RED, WIDTH // 2, HEIGHT // 2 - 20)
+            restart_btn = self.buttons["restart"]
+            pygame.draw.rect(surface, GREEN, restart_btn)
+            draw_text(surface, "Restart", self.font, WHITE, *restart_btn.center)
 
-    if game_over:
-        draw_text("GAME OVER", font, RED, WIDTH // 2, HEIGHT // 2 - 20)
-        restart_btn = pygame.Rect(WIDTH // 2 - 80, HEIGHT // 2 + 40, 160, 50)
-        pygame.draw.rect(screen, GREEN, restart_btn)
-        draw_text("Restart", font, WHITE, *restart_btn.center)
-
-        # Restart logic
-        mouse_pos = pygame.mouse.get_pos()
-        mouse_pressed = pygame.mouse.get_pressed()
-        if restart_btn.collidepoint(mouse_pos) and mouse_pressed[0]:
-            reset_game()
 
-    pygame.display.flip()
-    clock.tick(60)
+if __name__ == "__main__":
+    run(PlayerClassGame)
@@ -1,14 +1,11 @@
 import pygame
 import sys
+import os
 
-# Initialize Pygame
-pygame.init()
-
-# Full-screen setup
-screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
-WIDTH, HEIGHT = screen.get_size()
-pygame.display.set_caption("Day 36: Player Movement Demo 🚀")
-clock = pygame.time.Clock()
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from wodi.dirty import DirtyRenderer
+from wodi.game import Game, run
+from wodi.text import draw_text
 
 # Colors
 WHITE = (255, 255, 255)
@@ -19,13 +16,16 @@ GREEN = (0, 200, 0)
 DARK_GREEN = (0, 150, 0)
 LIGHT_GREEN = (0, 220, 0)
 
-# Fonts
-font = pygame.font.SysFont(None, 40)
-big_font = pygame.font.SysFont(None, 70)
-
 # Grid setup
 GRID_SIZE = 40
 
+# Gameplay area (top region)
+GAME_TOP = 80
+
+# On-screen movement buttons
+BUTTON_LABELS = [("left", "←"), ("right", "→"), ("up", "↑"), ("down", "↓")]
+
+
 # === PLAYER CLASS ===
 class Player:
     def __init__(self, x, y):
@@ -40,116 +40,120 @@ class Player:
         self.score += 1
 
     def draw(self, surface):
-        pygame.draw.rect(surface, self.color, self.rect)
-
-# Gameplay area (top region)
-GAME_TOP = 80
-GAME_BOTTOM = HEIGHT // 2 - 60
-GAME_HEIGHT = GAME_BOTTOM - GAME_TOP
-
-# Player starts centered in the gameplay zone
-player = Player(WIDTH // 2, GAME_TOP + GAME_HEIGHT // 2)
-
-# On-screen buttons (center region)
-button_size = 90
-button_spacing = 25
-button_y_center = HEIGHT // 2 + 80
-
-left_button = pygame.Rect(WIDTH//2 - button_size*2 - button_spacing, button_y_center, button_size, button_size)
-right_button = pygame.Rect(WIDTH//2 + button_size + button_spacing, button_y_center, button_size, button_size)
-up_button = pygame.Rect(WIDTH//2 - button_size//2, button_y_center - button_size - 15, button_size, button_size)
-down_button = pygame.Rect(WIDTH//2 - button_size//2, button_y_center + button_size + 15, button_size, button_size)
-
-# Movement flags
-move_left = move_right = move_up = move_down = False
-game_over = False
-
-# Helper function to draw text
-def draw_text(text, font, color, x, y, center=True):
-    label = font.render(text, True, color)
-    rect = label.get_rect()
-    if center:
-        rect.center = (x, y)
-    else:
-        rect.topleft = (x, y)
-    screen.blit(label, rect)
-
-# Reset function
-def reset_game():
-    global player, game_over
-    player.rect.x = WIDTH // 2
-    player.rect.y = GAME_TOP + GAME_HEIGHT // 2
-    player.score = 0
-    game_over = False
-
-# Game loop
-running = True
-while running:
-    screen.fill(WHITE)
-
-    # Event handling
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            pygame.quit()
-            sys.exit()
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            pos = pygame.mouse.get_pos()
-            if not game_over:
-                move_left = left_button.collidepoint(pos)
-                move_right = right_button.collidepoint(pos)
-                move_up = up_button.collidepoint(pos)
-                move_down = down_button.collidepoint(pos)
-            else:
-                restart_btn = pygame.Rect(WIDTH//2 - 100, GAME_TOP + GAME_HEIGHT//2 + 60, 200, 60)
-                if restart_btn.collidepoint(pos):
-                    reset_game()
-        if event.type == pygame.MOUSEBUTTONUP:
-            move_left = move_right = move_up = move_down = False
-        if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_ESCAPE:
-                pygame.quit()
-                sys.exit()
-
-    # Update player
-    if not game_over:
+        return pygame.draw.rect(surface, self.color, self.rect)
+
+
+# === GAME CLASS ===
+class MovementGame(Game):
+    caption = "Day 36: Player Movement Demo 🚀"
+    fps = 10
+
+    def __init__(self, screen):
+        super().__init__(screen)
+        WIDTH, HEIGHT = self.width, self.height
+
+        # Fonts
+        self.font = pygame.font.SysFont(None, 40)
+        self.big_font = pygame.font.SysFont(None, 70)
+
+        # Gameplay area (top region)
+        self.game_bottom = HEIGHT // 2 - 60
+        self.game_height = self.game_bottom - GAME_TOP
+
+        # Player starts centered in the gameplay zone
+        self.player = Player(WIDTH // 2, GAME_TOP + self.game_height // 2)
+
+        # On-screen buttons (center region)
+        self.button_size = button_size = 90
+        button_spacing = 25
+        button_y_center = HEIGHT // 2 + 80
+        self.buttons = {
+            "left": pygame.Rect(WIDTH//2 - button_size*2 - button_spacing, button_y_center, button_size, button_size),
+            "right": pygame.Rect(WIDTH//2 + button_size + button_spacing, button_y_center, button_size, button_size),
+            "up": pygame.Rect(WIDTH//2 - button_size//2, button_y_center - button_size - 15, button_size, button_size),
+            "down": pygame.Rect(WIDTH//2 - button_size//2, button_y_center + button_size + 15, button_size, button_size),
+            "restart": pygame.Rect(WIDTH//2 - 100, GAME_TOP + self.game_height//2 + 60, 200, 60),
+        }
+
+        # Only the player, score, pressed buttons and game over text are redrawn each frame
+        self.dirty = DirtyRenderer(self.draw_background)
+        self.reset()
+
+    def reset(self):
+        self.player.rect.x = self.width // 2
+        self.player.rect.y = GAME_TOP + self.game_height // 2
+        self.player.score = 0
+        self.game_over = False
+
+    def invalidate(self):
+        self.dirty.invalidate()
+
+    def step(self, inputs):
+        if self.game_over:
+            if "restart" in inputs.pressed:
+                self.reset()
+            return
+
+        # Update player
+        held = inputs.held
+        player = self.player
         dx = dy = 0
-        if move_left: dx = -1
-        if move_right: dx = 1
-        if move_up: dy = -1
-        if move_down: dy = 1
+        if "left" in held: dx = -1
+        if "right" in held: dx = 1
+        if "up" in held: dy = -1
+        if "down" in held: dy = 1
         if dx != 0 or dy != 0:
             player.move(dx, dy)
 
         # Game over if player hits gameplay boundaries
-        if (player.rect.left < 0 or player.rect.right > WIDTH or
-            player.rect.top < GAME_TOP or player.rect.bottom > GAME_BOTTOM):
-            game_over = True
-
-    # Draw gameplay area
-    pygame.draw.rect(screen, (230, 230, 230), (0, GAME_TOP, WIDTH, GAME_HEIGHT), 2)
-    player.draw(screen)
-    draw_text(f"Score: {player.score}", font, BLACK, 10, 10, center=False)
-
-    # Draw on-screen buttons (with pop animation)
-    for btn, label, active in [
-        (left_button, "←", move_left),
-        (right_button, "→", move_right),
-        (up_button, "↑", move_up),
-        (down_button, "↓", move_down)
-    ]:
+        if (player.rect.left < 0 or player.rect.right > self.width or
+            player.rect.top < GAME_TOP or player.rect.bottom > self.game_bottom):
+            self.game_over = True
+
+    def draw_button(self, surface, name, label, active):
+        btn = self.buttons[name]
         color = LIGHT_GREEN if active else DARK_GREEN
-        size = button_size + 8 if active else button_size
+        size = self.button_size + 8 if active else self.button_size
         scaled_btn = pygame.Rect(btn.centerx - size//2, btn.centery - size//2, size, size)
-        pygame.draw.rect(screen, color, scaled_btn, border_radius=12)
-        draw_text(label, font, WHITE, btn.centerx, btn.centery)
-
-    # Game over screen (in gameplay area)
-    if game_over:
-        draw_text("GAME OVER", big_font, RED, WIDTH//2, GAME_TOP + GAME_HEIGHT//2 - 30)
-        draw_text(f"Final Score: {player.score}", font, BLACK, WIDTH//2, GAME_TOP + GAME_HEIGHT//2 + 10)
-        restart_btn = pygame.Rect(WIDTH//2 - 100, GAME_TOP + GAME_HEIGHT//2 + 60, 200, 60)
-        pygame.draw.rect(screen, GREEN, restart_btn, border_radius=10)
-        draw_text("Restart", font, WHITE, restart_btn.centerx, restart_btn.centery)
-
-    pygame.display.flip()
-    clock.tick(10)
+        rect = pygame.draw.rect(surface, color, scaled_btn, border_radius=12)
+        draw_text(surface, label, self.font, WHITE, btn.centerx, btn.centery)
+        return rect
+
+    def draw_background(self, surface):
+        surface.fill(WHITE)
+
+        # Draw gameplay area
+        pygame.draw.rect(surface, (230, 230, 230), (0, GAME_TOP, self.width, self.game_height), 2)
+
+        # Draw on-screen buttons at rest
+        for name, label in BUTTON_LABELS:
+            self.draw_button(surface, name, label, False)
+
+    def render(self, surface):
+        dirty = self.dirty
+        dirty.begin(surface)
+        font, big_font = self.font, self.big_font
+        WIDTH, GAME_HEIGHT = self.width, self.game_height
+
+        dirty.mark(self.player.draw(surface))
+        dirty.mark(draw_text(surface, f"Score: {self.player.score}", font, BLACK, 10, 10, center=False, dynamic=True))
+
+        # Pressed buttons pop out over the resting ones, as soon as they are touched
+        held = () if self.game_over else self.latched.held
+        for name, label in BUTTON_LABELS:
+            if name in held:
+                dirty.mark(self.draw_button(surface, name, label, True))
+
+        # Game over screen (in gameplay area)
+        if self.game_over:
+            dirty.mark(draw_text(surface, "GAME OVER", big_font, RED, WIDTH//2, GAME_TOP + GAME_HEIGHT//2 - 30))
+            dirty.mark(draw_text(surface, f"Final Score: {self.player.score}", font, BLACK, WIDTH//2, GAME_TOP + GAME_HEIGHT//2 + 10))
+            restart_btn = self.buttons["restart"]
+            dirty.mark(pygame.draw.rect(surface, GREEN, restart_btn, border_radius=10))
+            draw_text(surface, "Restart", font, WHITE, restart_btn.centerx, restart_btn.centery)
+
+        return dirty.end()
+
+
+if __name__ == "__main__":
+    run(MovementGame)
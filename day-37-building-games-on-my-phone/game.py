@@ -1,15 +1,14 @@
 import pygame
 import sys
-import random
+import os
 
-# Initialize Pygame
-pygame.init()
-
-# Full-screen setup
-screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
-WIDTH, HEIGHT = screen.get_size()
-pygame.display.set_caption("Day 37: Obstacle Interaction Demo")
-clock = pygame.time.Clock()
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from wodi.batch import SpriteBatch
+from wodi.dirty import DirtyRenderer
+from wodi.game import Game, run
+from wodi.grid import OccupancyGrid
+from wodi.perf import perf
+from wodi.text import draw_text
 
 # Colors
 WHITE = (255, 255, 255)
@@ -20,17 +19,17 @@ GREEN = (0, 200, 0)
 DARK_GREEN = (0, 150, 0)
 OBSTACLE_COLOR = (200, 0, 0)
 
-# Fonts
-font = pygame.font.SysFont(None, 40)
-big_font = pygame.font.SysFont(None, 70)
-
 # Grid size
 GRID_SIZE = 40
 
 # Gameplay area (top region)
 GAME_TOP = 80
-GAME_BOTTOM = HEIGHT // 2 - 60
-GAME_HEIGHT = GAME_BOTTOM - GAME_TOP
+
+NUM_OBSTACLES = 5
+
+# On-screen movement buttons
+BUTTON_LABELS = [("left", "←"), ("right", "→"), ("up", "↑"), ("down", "↓")]
+
 
 # Player class
 class Player:
@@ -46,145 +45,151 @@ class Player:
         self.score += 1
 
     def draw(self, surface):
-        pygame.draw.rect(surface, self.color, self.rect)
-
-# Generate obstacles
-NUM_OBSTACLES = 5
-obstacles = []
-for _ in range(NUM_OBSTACLES):
-    ox = random.randint(0, WIDTH//GRID_SIZE - 1) * GRID_SIZE
-    oy = random.randint(GAME_TOP//GRID_SIZE, (GAME_BOTTOM//GRID_SIZE) - 1) * GRID_SIZE
-    obstacles.append(pygame.Rect(ox, oy, GRID_SIZE, GRID_SIZE))
-
-# Player starts centered in gameplay zone
-player = Player(WIDTH // 2, GAME_TOP + GAME_HEIGHT // 2)
-
-# On-screen buttons (center area)
-button_size = 90
-button_spacing = 25
-button_y_center = HEIGHT // 2 + 80
-
-left_button = pygame.Rect(WIDTH//2 - button_size*2 - button_spacing, button_y_center, button_size, button_size)
-right_button = pygame.Rect(WIDTH//2 + button_size + button_spacing, button_y_center, button_size, button_size)
-up_button = pygame.Rect(WIDTH//2 - button_size//2, button_y_center - button_size - 15, button_size, button_size)
-down_button = pygame.Rect(WIDTH//2 - button_size//2, button_y_center + button_size + 15, button_size, button_size)
-
-# Movement flags
-move_left = move_right = move_up = move_down = False
-game_over = False
-
-# Helper function to draw text
-def draw_text(text, font, color, x, y, center=True):
-    label = font.render(text, True, color)
-    rect = label.get_rect()
-    if center:
-        rect.center = (x, y)
-    else:
-        rect.topleft = (x, y)
-    screen.blit(label, rect)
-
-# Reset game
-def reset_game():
-    global player, game_over, obstacles
-    player.rect.x = WIDTH // 2
-    player.rect.y = GAME_TOP + GAME_HEIGHT // 2
-    player.score = 0
-    game_over = False
-    # Regenerate obstacles
-    obstacles.clear()
-    for _ in range(NUM_OBSTACLES):
-        ox = random.randint(0, WIDTH//GRID_SIZE - 1) * GRID_SIZE
-        oy = random.randint(GAME_TOP//GRID_SIZE, (GAME_BOTTOM//GRID_SIZE) - 1) * GRID_SIZE
-        obstacles.append(pygame.Rect(ox, oy, GRID_SIZE, GRID_SIZE))
-
-# Game loop
-running = True
-while running:
-    screen.fill(WHITE)
-
-    # Event handling
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            pygame.quit()
-            sys.exit()
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            pos = pygame.mouse.get_pos()
-            if not game_over:
-                move_left = left_button.collidepoint(pos)
-                move_right = right_button.collidepoint(pos)
-                move_up = up_button.collidepoint(pos)
-                move_down = down_button.collidepoint(pos)
-            else:
-                # Restart button
-                restart_btn = pygame.Rect(WIDTH//2 - 100, GAME_TOP + GAME_HEIGHT//2 + 60, 200, 60)
-                if restart_btn.collidepoint(pos):
-                    reset_game()
-        if event.type == pygame.MOUSEBUTTONUP:
-            move_left = move_right = move_up = move_down = False
-        if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_ESCAPE:
-                pygame.quit()
-                sys.exit()
-
-    # Update player
-    if not game_over:
+        return pygame.draw.rect(surface, self.color, self.rect)
+
+
+# Game class
+class ObstacleGame(Game):
+    caption = "Day 37: Obstacle Interaction Demo"
+    fps = 10
+
+    def __init__(self, screen):
+        super().__init__(screen)
+        WIDTH, HEIGHT = self.width, self.height
+
+        # Fonts
+        self.font = pygame.font.SysFont(None, 40)
+        self.big_font = pygame.font.SysFont(None, 70)
+
+        # Gameplay area (top region)
+        self.game_bottom = HEIGHT // 2 - 60
+        self.game_height = self.game_bottom - GAME_TOP
+
+        # Player starts centered in gameplay zone
+        self.player = Player(WIDTH // 2, GAME_TOP + self.game_height // 2)
+        self.obstacles = []
+
+        # Obstacles sit on the cells the player can step onto, so a collision is one cell lookup
+        play_area = pygame.Rect(0, GAME_TOP, WIDTH, self.game_height)
+        self.grid = OccupancyGrid.covering(play_area, self.player.rect.topleft, GRID_SIZE)
+
+        # On-screen buttons (center area)
+        button_size = 90
+        button_spacing = 25
+        button_y_center = HEIGHT // 2 + 80
+        self.buttons = {
+            "left": pygame.Rect(WIDTH//2 - button_size*2 - button_spacing, button_y_center, button_size, button_size),
+            "right": pygame.Rect(WIDTH//2 + button_size + button_spacing, button_y_center, button_size, button_size),
+            "up": pygame.Rect(WIDTH//2 - button_size//2, button_y_center - button_size - 15, button_size, button_size),
+            "down": pygame.Rect(WIDTH//2 - button_size//2, button_y_center + button_size + 15, button_size, button_size),
+            "restart": pygame.Rect(WIDTH//2 - 100, GAME_TOP + self.game_height//2 + 60, 200, 60),
+        }
+
+        # Only the player, obstacles, score, pressed buttons and game over text are redrawn each frame
+        self.dirty = DirtyRenderer(self.draw_background)
+        self.batch = SpriteBatch(("obstacles",))
+        self.reset()
+
+    def generate_obstacles(self):
+        # Drawn from the free cells only: no two obstacles overlap and none lands on the player
+        self.grid.clear()
+        self.obstacles[:] = [pygame.Rect(r) for r in self.grid.place(NUM_OBSTACLES, avoid=self.player.rect)]
+
+    def reset(self):
+        self.player.rect.x = self.width // 2
+        self.player.rect.y = GAME_TOP + self.game_height // 2
+        self.player.score = 0
+        self.game_over = False
+        # Regenerate obstacles
+        self.generate_obstacles()
+
+    def counts(self):
+        return {"obstacles": len(self.obstacles)}
+
+    def invalidate(self):
+        self.dirty.invalidate()
+
+    def step(self, inputs):
+        if self.game_over:
+            # Restart button
+            if "restart" in inputs.pressed:
+                self.reset()
+            return
+
+        # Update player
+        held = inputs.held
+        player = self.player
         dx = dy = 0
-        if move_left:
+        if "left" in held:
             dx = -1
-        if move_right:
+        if "right" in held:
             dx = 1
-        if move_up:
+        if "up" in held:
             dy = -1
-        if move_down:
+        if "down" in held:
             dy = 1
         if dx != 0 or dy != 0:
             player.move(dx, dy)
 
         # Game over if player hits gameplay boundaries
-        if (player.rect.left < 0 or player.rect.right > WIDTH or
-            player.rect.top < GAME_TOP or player.rect.bottom > GAME_BOTTOM):
-            game_over = True
-
-        # Check collisions with obstacles
-        for obs in obstacles:
-            if player.rect.colliderect(obs):
-                game_over = True
-                break
-
-    # Draw gameplay area outline
-    pygame.draw.rect(screen, (220, 220, 220), (0, GAME_TOP, WIDTH, GAME_HEIGHT), 2)
-
-    # Draw obstacles
-    for obs in obstacles:
-        pygame.draw.rect(screen, OBSTACLE_COLOR, obs)
-
-    # Draw player
-    player.draw(screen)
-
-    # Draw score
-    draw_text(f"Score: {player.score}", font, BLACK, 10, 10, center=False)
-
-    # Draw on-screen buttons
-    for btn, label in [
-        (left_button, "←"), (right_button, "→"),
-        (up_button, "↑"), (down_button, "↓")
-    ]:
-        color = DARK_GREEN
-        if ((btn == left_button and move_left) or
-            (btn == right_button and move_right) or
-            (btn == up_button and move_up) or
-            (btn == down_button and move_down)):
-            color = GREEN  # Brighten when pressed
-        pygame.draw.rect(screen, color, btn, border_radius=12)
-        draw_text(label, font, WHITE, btn.centerx, btn.centery)
-
-    # Game over screen
-    if game_over:
-        draw_text("GAME OVER", big_font, RED, WIDTH//2, GAME_TOP + GAME_HEIGHT//2 - 30)
-        draw_text(f"Final Score: {player.score}", font, BLACK, WIDTH//2, GAME_TOP + GAME_HEIGHT//2 + 10)
-        restart_btn = pygame.Rect(WIDTH//2 - 100, GAME_TOP + GAME_HEIGHT//2 + 60, 200, 60)
-        pygame.draw.rect(screen, GREEN, restart_btn, border_radius=10)
-        draw_text("Restart", font, WHITE, restart_btn.centerx, restart_btn.centery)
-
-    pygame.display.flip()
-    clock.tick(10)
+        if (player.rect.left < 0 or player.rect.right > self.width or
+            player.rect.top < GAME_TOP or player.rect.bottom > self.game_bottom):
+            self.game_over = True
+
+        with perf.zone("collision"):
+            # Check collisions with obstacles
+            if self.grid.at(player.rect) >= 0:
+                self.game_over = True
+
+    def draw_button(self, surface, name, label, pressed):
+        btn = self.buttons[name]
+        color = GREEN if pressed else DARK_GREEN  # Brighten when pressed
+        rect = pygame.draw.rect(surface, color, btn, border_radius=12)
+        draw_text(surface, label, self.font, WHITE, btn.centerx, btn.centery)
+        return rect
+
+    def draw_background(self, surface):
+        surface.fill(WHITE)
+
+        # Draw gameplay area outline
+        pygame.draw.rect(surface, (220, 220, 220), (0, GAME_TOP, self.width, self.game_height), 2)
+
+        # Draw on-screen buttons at rest
+        for name, label in BUTTON_LABELS:
+            self.draw_button(surface, name, label, False)
+
+    def render(self, surface):
+        dirty = self.dirty
+        dirty.begin(surface)
+        font, big_font = self.font, self.big_font
+        WIDTH, GAME_HEIGHT = self.width, self.game_height
+
+        # Draw obstacles in one batch
+        self.batch.rects("obstacles", OBSTACLE_COLOR, self.obstacles, (GRID_SIZE, GRID_SIZE))
+        self.batch.flush(surface, dirty)
+
+        # Draw player
+        dirty.mark(self.player.draw(surface))
+
+        # Draw score
+        dirty.mark(draw_text(surface, f"Score: {self.player.score}", font, BLACK, 10, 10, center=False, dynamic=True))
+
+        # Draw pressed buttons
+        held = () if self.game_over else self.latched.held
+        for name, label in BUTTON_LABELS:
+            if name in held:
+                dirty.mark(self.draw_button(surface, name, label, True))
+
+        # Game over screen
+        if self.game_over:
+            dirty.mark(draw_text(surface, "GAME OVER", big_font, RED, WIDTH//2, GAME_TOP + GAME_HEIGHT//2 - 30))
+            dirty.mark(draw_text(surface, f"Final Score: {self.player.score}", font, BLACK, WIDTH//2, GAME_TOP + GAME_HEIGHT//2 + 10))
+            restart_btn = self.buttons["restart"]
+            dirty.mark(pygame.draw.rect(surface, GREEN, restart_btn, border_radius=10))
+            draw_text(surface, "Restart", font, WHITE, restart_btn.centerx, restart_btn.centery)
+
+        return dirty.end()
+
+
+if __name__ == "__main__":
+    run(ObstacleGame)
@@ -1,13 +1,15 @@
 import pygame
 import sys
+import os
 
-pygame.init()
-
-# Full-screen
-screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
-WIDTH, HEIGHT = screen.get_size()
-pygame.display.set_caption("Day 38 - Obstacles & Bump Blast 🚀")
-clock = pygame.time.Clock()
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from wodi.batch import SpriteBatch
+from wodi.dirty import DirtyRenderer
+from wodi.effects import GlowBorder
+from wodi.game import Game, run
+from wodi.grid import OccupancyGrid
+from wodi.perf import perf
+from wodi.text import draw_text
 
 # Colors
 WHITE = (255, 255, 255)
@@ -19,23 +21,12 @@ GREEN = (0, 200, 0)
 DARK_GREEN = (0, 150, 0)
 YELLOW = (255, 255, 0)
 
-# Fonts
-font = pygame.font.SysFont(None, 40)
-big_font = pygame.font.SysFont(None, 70)
-
 GRID_SIZE = 40
 GAME_TOP = 80
-GAME_BOTTOM = HEIGHT // 2 - 60
-GAME_HEIGHT = GAME_BOTTOM - GAME_TOP
-
-# Obstacles
-obstacles = [
-    pygame.Rect(200, GAME_TOP + 50, GRID_SIZE, GRID_SIZE),
-    pygame.Rect(400, GAME_TOP + 150, GRID_SIZE, GRID_SIZE),
-    pygame.Rect(600, GAME_TOP + 100, GRID_SIZE, GRID_SIZE),
-    pygame.Rect(800, GAME_TOP + 200, GRID_SIZE, GRID_SIZE),
-]
-obstacle_flash = [0 for _ in obstacles]  # Timer for flash effect
+
+# On-screen movement buttons
+BUTTON_LABELS = [("left", "←"), ("right", "→"), ("up", "↑"), ("down", "↓")]
+
 
 # Player
 class Player:
@@ -51,129 +42,163 @@ class Player:
         self.rect.y += dy * GRID_SIZE
         self.score += 1
 
-    def draw(self, surface):
-        color = YELLOW if self.bump_timer > 0 else self.color
-        pygame.draw.rect(surface, color, self.rect)
+    def update(self):
         if self.bump_timer > 0:
             self.bump_timer -= 1
 
-player = Player(WIDTH // 2, GAME_TOP + GAME_HEIGHT // 2)
-
-# Buttons
-button_size = 90
-button_spacing = 25
-button_y_center = HEIGHT // 2 + 80
-left_button = pygame.Rect(WIDTH//2 - button_size*2 - button_spacing, button_y_center, button_size, button_size)
-right_button = pygame.Rect(WIDTH//2 + button_size + button_spacing, button_y_center, button_size, button_size)
-up_button = pygame.Rect(WIDTH//2 - button_size//2, button_y_center - button_size - 15, button_size, button_size)
-down_button = pygame.Rect(WIDTH//2 - button_size//2, button_y_center + button_size + 15, button_size, button_size)
-
-move_left = move_right = move_up = move_down = False
-game_over = False
-
-# Text helper
-def draw_text(text, font, color, x, y, center=True):
-    label = font.render(text, True, color)
-    rect = label.get_rect()
-    rect.center = (x, y) if center else (x, y)
-    screen.blit(label, rect)
-
-def reset_game():
-    global player, game_over, obstacle_flash
-    player.rect.x = WIDTH // 2
-    player.rect.y = GAME_TOP + GAME_HEIGHT // 2
-    player.score = 0
-    game_over = False
-    obstacle_flash = [0 for _ in obstacles]
-
-# Main loop
-running = True
-while running:
-    screen.fill(WHITE)
-
-    # Events
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            pygame.quit()
-            sys.exit()
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            pos = pygame.mouse.get_pos()
-            if not game_over:
-                move_left = left_button.collidepoint(pos)
-                move_right = right_button.collidepoint(pos)
-                move_up = up_button.collidepoint(pos)
-                move_down = down_button.collidepoint(pos)
-            else:
-                restart_btn = pygame.Rect(WIDTH//2 - 100, GAME_TOP + GAME_HEIGHT//2 + 60, 200, 60)
-                if restart_btn.collidepoint(pos):
-                    reset_game()
-        if event.type == pygame.MOUSEBUTTONUP:
-            move_left = move_right = move_up = move_down = False
-        if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_ESCAPE:
-                pygame.quit()
-                sys.exit()
-
-    # Update player
-    if not game_over:
+    def draw(self, surface):
+        color = YELLOW if self.bump_timer > 0 else self.color
+        return pygame.draw.rect(surface, color, self.rect)
+
+
+# Game
+class BumpGame(Game):
+    caption = "Day 38 - Obstacles & Bump Blast 🚀"
+    fps = 15  # faster for energy
+
+    def __init__(self, screen):
+        super().__init__(screen)
+        WIDTH, HEIGHT = self.width, self.height
+
+        # Fonts
+        self.font = pygame.font.SysFont(None, 40)
+        self.big_font = pygame.font.SysFont(None, 70)
+
+        self.game_bottom = HEIGHT // 2 - 60
+        self.game_height = self.game_bottom - GAME_TOP
+
+        # Obstacles
+        self.obstacles = [
+            pygame.Rect(200, GAME_TOP + 50, GRID_SIZE, GRID_SIZE),
+            pygame.Rect(400, GAME_TOP + 150, GRID_SIZE, GRID_SIZE),
+            pygame.Rect(600, GAME_TOP + 100, GRID_SIZE, GRID_SIZE),
+            pygame.Rect(800, GAME_TOP + 200, GRID_SIZE, GRID_SIZE),
+        ]
+
+        self.player = Player(WIDTH // 2, GAME_TOP + self.game_height // 2)
+
+        # Every cell the player can step onto, marked with the obstacle it would hit there
+        play_area = pygame.Rect(0, GAME_TOP, WIDTH, self.game_height)
+        self.grid = OccupancyGrid.covering(play_area, self.player.rect.topleft, GRID_SIZE)
+        for i, obs in enumerate(self.obstacles):
+            self.grid.add(obs, i)
+
+        # Buttons
+        button_size = 90
+        button_spacing = 25
+        button_y_center = HEIGHT // 2 + 80
+        self.buttons = {
+            "left": pygame.Rect(WIDTH//2 - button_size*2 - button_spacing, button_y_center, button_size, button_size),
+            "right": pygame.Rect(WIDTH//2 + button_size + button_spacing, button_y_center, button_size, button_size),
+            "up": pygame.Rect(WIDTH//2 - button_size//2, button_y_center - button_size - 15, button_size, button_size),
+            "down": pygame.Rect(WIDTH//2 - button_size//2, button_y_center + button_size + 15, button_size, button_size),
+            "restart": pygame.Rect(WIDTH//2 - 100, GAME_TOP + self.game_height//2 + 60, 200, 60),
+        }
+
+        # Only the glow border, player, obstacles, score, pressed buttons and game over text are redrawn each frame
+        self.dirty = DirtyRenderer(self.draw_background)
+        self.batch = SpriteBatch(("obstacles",))
+
+        # Pulsing glow: alpha climbs 50 -> 99 once a second
+        self.glow = GlowBorder((0, 255, 255), 6, [50 + i for i in range(50)], period=1000)
+        self.reset()
+
+    def reset(self):
+        self.player.rect.x = self.width // 2
+        self.player.rect.y = GAME_TOP + self.game_height // 2
+        self.player.score = 0
+        self.game_over = False
+        self.obstacle_flash = [0 for _ in self.obstacles]  # Timer for flash effect
+
+    def counts(self):
+        return {"obstacles": len(self.obstacles)}
+
+    def invalidate(self):
+        self.dirty.invalidate()
+
+    def step(self, inputs):
+        # Flash timers run down every tick, game over or not
+        self.player.update()
+        for i, flash in enumerate(self.obstacle_flash):
+            if flash > 0:
+                self.obstacle_flash[i] = flash - 1
+
+        if self.game_over:
+            if "restart" in inputs.pressed:
+                self.reset()
+            return
+
+        # Update player
+        held = inputs.held
+        player = self.player
         dx = dy = 0
-        if move_left: dx = -1
-        if move_right: dx = 1
-        if move_up: dy = -1
-        if move_down: dy = 1
+        if "left" in held: dx = -1
+        if "right" in held: dx = 1
+        if "up" in held: dy = -1
+        if "down" in held: dy = 1
         if dx != 0 or dy != 0:
             player.move(dx, dy)
 
         # Boundary collision
-        if player.rect.left < 0 or player.rect.right > WIDTH or player.rect.top < GAME_TOP or player.rect.bottom > GAME_BOTTOM:
+        if player.rect.left < 0 or player.rect.right > self.width or player.rect.top < GAME_TOP or player.rect.bottom > self.game_bottom:
             player.bump_timer = 5
-            game_over = True
+            self.game_over = True
 
-        # Obstacle collisions
-        for i, obs in enumerate(obstacles):
-            if player.rect.colliderect(obs):
+        with perf.zone("collision"):
+            # Obstacle collisions
+            i = self.grid.at(player.rect)
+            if i >= 0:
                 player.bump_timer = 5
-                obstacle_flash[i] = 5  # Flash obstacle
-                game_over = True
-                break
-
-    # Draw gameplay area with pulsing glow
-    glow_alpha = 50 + int(50 * (pygame.time.get_ticks() % 1000) / 1000)
-    glow_surf = pygame.Surface((WIDTH, GAME_HEIGHT), pygame.SRCALPHA)
-    pygame.draw.rect(glow_surf, (0, 255, 255, glow_alpha), (0, 0, WIDTH, GAME_HEIGHT), 6)
-    screen.blit(glow_surf, (0, GAME_TOP))
-
-    # Draw obstacles with flash
-    for i, obs in enumerate(obstacles):
-        color = ORANGE if obstacle_flash[i] > 0 else RED
-        pygame.draw.rect(screen, color, obs)
-        if obstacle_flash[i] > 0:
-            obstacle_flash[i] -= 1
-
-    # Draw player
-    player.draw(screen)
-
-    # Score animation
-    score_color = ORANGE if pygame.time.get_ticks() % 500 < 250 else BLACK
-    draw_text(f"Score: {player.score}", font, score_color, 10, 10, center=False)
-
-    # Draw buttons with pop effect
-    for btn, label, moving in [
-        (left_button, "←", move_left), (right_button, "→", move_right),
-        (up_button, "↑", move_up), (down_button, "↓", move_down)
-    ]:
-        pygame.draw.rect(screen, DARK_GREEN, btn, border_radius=12)
-        draw_text(label, font, WHITE, btn.centerx, btn.centery)
-        if moving:
-            pygame.draw.rect(screen, GREEN, btn.inflate(20, 20), border_radius=12, width=3)
-
-    # Game over screen
-    if game_over:
-        draw_text("GAME OVER", big_font, RED, WIDTH//2, GAME_TOP + GAME_HEIGHT//2 - 30)
-        draw_text(f"Final Score: {player.score}", font, BLACK, WIDTH//2, GAME_TOP + GAME_HEIGHT//2 + 10)
-        restart_btn = pygame.Rect(WIDTH//2 - 100, GAME_TOP + GAME_HEIGHT//2 + 60, 200, 60)
-        pygame.draw.rect(screen, GREEN, restart_btn, border_radius=10)
-        draw_text("Restart", font, WHITE, restart_btn.centerx, restart_btn.centery)
-
-    pygame.display.flip()
-    clock.tick(15)  # faster for energy
+                self.obstacle_flash[i] = 5  # Flash obstacle
+                self.game_over = True
+
+    def draw_background(self, surface):
+        surface.fill(WHITE)
+
+        # Draw buttons at rest
+        for name, label in BUTTON_LABELS:
+            btn = self.buttons[name]
+            pygame.draw.rect(surface, DARK_GREEN, btn, border_radius=12)
+            draw_text(surface, label, self.font, WHITE, btn.centerx, btn.centery)
+
+    def render(self, surface):
+        dirty = self.dirty
+        dirty.begin(surface)
+        font, big_font = self.font, self.big_font
+        WIDTH, GAME_HEIGHT = self.width, self.game_height
+
+        # Draw gameplay area with pulsing glow
+        dirty.mark_all(self.glow.draw(surface, (0, GAME_TOP, WIDTH, GAME_HEIGHT), pygame.time.get_ticks()))
+
+        # Draw obstacles with flash
+        batch = self.batch
+        for obs, flash in zip(self.obstacles, self.obstacle_flash):
+            batch.rect("obstacles", ORANGE if flash > 0 else RED, obs)
+        batch.flush(surface, dirty)
+
+        # Draw player
+        dirty.mark(self.player.draw(surface))
+
+        # Score animation
+        score_color = ORANGE if pygame.time.get_ticks() % 500 < 250 else BLACK
+        dirty.mark(draw_text(surface, f"Score: {self.player.score}", font, score_color, 10, 10, center=False, dynamic=True))
+
+        # Pop effect on pressed buttons
+        held = () if self.game_over else self.latched.held
+        for name, label in BUTTON_LABELS:
+            if name in held:
+                dirty.mark(pygame.draw.rect(surface, GREEN, self.buttons[name].inflate(20, 20), border_radius=12, width=3))
+
+        # Game over screen
+        if self.game_over:
+            dirty.mark(draw_text(surface, "GAME OVER", big_font, RED, WIDTH//2, GAME_TOP + GAME_HEIGHT//2 - 30))
+            dirty.mark(draw_text(surface, f"Final Score: {self.player.score}", font, BLACK, WIDTH//2, GAME_TOP + GAME_HEIGHT//2 + 10))
+            restart_btn = self.buttons["restart"]
+            dirty.mark(pygame.draw.rect(surface, GREEN, restart_btn, border_radius=10))
+            draw_text(surface, "Restart", font, WHITE, restart_btn.centerx, restart_btn.centery)
+
+        return dirty.end()
+
+
+if __name__ == "__main__":
+    run(BumpGame)
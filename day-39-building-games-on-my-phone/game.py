@@ -1,14 +1,13 @@
 import pygame
 import sys
 import random
+import os
 
-pygame.init()
-
-# Full-screen setup
-screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
-WIDTH, HEIGHT = screen.get_size()
-pygame.display.set_caption("Day 39 - Dynamic Obstacles & Feedback 🚀")
-clock = pygame.time.Clock()
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from wodi.dirty import DirtyRenderer
+from wodi.game import Game, run
+from wodi.perf import perf
+from wodi.text import draw_text
 
 # Colors
 WHITE = (255, 255, 255)
@@ -20,29 +19,13 @@ YELLOW = (255, 255, 0)
 ORANGE = (255, 165, 0)
 PURPLE = (150, 0, 150)
 
-# Fonts
-font = pygame.font.SysFont(None, 40)
-big_font = pygame.font.SysFont(None, 70)
-
 # Grid setup
 GRID_SIZE = 40
 GAME_TOP = 80
-GAME_BOTTOM = HEIGHT // 2 - 60
-GAME_HEIGHT = GAME_BOTTOM - GAME_TOP
-
-# Moving obstacles setup
-moving_obstacles = []
-moving_velocities = []
-
-for _ in range(5):
-    x = random.randint(0, WIDTH - GRID_SIZE)
-    y = random.randint(GAME_TOP, GAME_BOTTOM - GRID_SIZE)
-    rect = pygame.Rect(x, y, GRID_SIZE, GRID_SIZE)
-    moving_obstacles.append(rect)
-    # Random initial velocities: -2, -1, 1, or 2
-    vx = random.choice([-2, -1, 1, 2])
-    vy = random.choice([-2, -1, 1, 2])
-    moving_velocities.append([vx, vy])
+
+# On-screen movement buttons
+BUTTON_LABELS = [("left", "←"), ("right", "→"), ("up", "↑"), ("down", "↓")]
+
 
 # Player class
 class Player:
@@ -58,114 +41,121 @@ class Player:
         self.rect.y += dy * GRID_SIZE
         self.score += 1
 
-    def draw(self, surface):
-        color = YELLOW if self.bump_timer > 0 else self.color
-        pygame.draw.rect(surface, color, self.rect)
+    def update(self):
         if self.bump_timer > 0:
             self.bump_timer -= 1
 
-player = Player(WIDTH // 2, GAME_TOP + GAME_HEIGHT // 2)
-
-# On-screen buttons
-button_size = 90
-button_spacing = 25
-button_y_center = HEIGHT // 2 + 80
-
-left_button = pygame.Rect(WIDTH//2 - button_size*2 - button_spacing, button_y_center, button_size, button_size)
-right_button = pygame.Rect(WIDTH//2 + button_size + button_spacing, button_y_center, button_size, button_size)
-up_button = pygame.Rect(WIDTH//2 - button_size//2, button_y_center - button_size - 15, button_size, button_size)
-down_button = pygame.Rect(WIDTH//2 - button_size//2, button_y_center + button_size + 15, button_size, button_size)
-
-move_left = move_right = move_up = move_down = False
-game_over = False
-
-def draw_text(text, font, color, x, y, center=True):
-    label = font.render(text, True, color)
-    rect = label.get_rect()
-    if center:
-        rect.center = (x, y)
-    else:
-        rect.topleft = (x, y)
-    screen.blit(label, rect)
-
-def reset_game():
-    global player, game_over, moving_obstacles, moving_velocities
-    player.rect.x = WIDTH // 2
-    player.rect.y = GAME_TOP + GAME_HEIGHT // 2
-    player.score = 0
-    game_over = False
-
-    # Reset obstacles
-    moving_obstacles.clear()
-    moving_velocities.clear()
-    for _ in range(5):
-        x = random.randint(0, WIDTH - GRID_SIZE)
-        y = random.randint(GAME_TOP, GAME_BOTTOM - GRID_SIZE)
-        rect = pygame.Rect(x, y, GRID_SIZE, GRID_SIZE)
-        moving_obstacles.append(rect)
-        vx = random.choice([-2, -1, 1, 2])
-        vy = random.choice([-2, -1, 1, 2])
-        moving_velocities.append([vx, vy])
-
-running = True
-while running:
-    screen.fill(WHITE)
-
-    # Event handling
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            pygame.quit()
-            sys.exit()
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            pos = pygame.mouse.get_pos()
-            if not game_over:
-                move_left = left_button.collidepoint(pos)
-                move_right = right_button.collidepoint(pos)
-                move_up = up_button.collidepoint(pos)
-                move_down = down_button.collidepoint(pos)
-            else:
-                restart_btn = pygame.Rect(WIDTH//2 - 100, GAME_TOP + GAME_HEIGHT//2 + 60, 200, 60)
-                if restart_btn.collidepoint(pos):
-                    reset_game()
-        if event.type == pygame.MOUSEBUTTONUP:
-            move_left = move_right = move_up = move_down = False
-        if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_ESCAPE:
-                pygame.quit()
-                sys.exit()
-
-    # Update player
-    if not game_over:
+    def draw(self, surface):
+        color = YELLOW if self.bump_timer > 0 else self.color
+        return pygame.draw.rect(surface, color, self.rect)
+
+
+# Game class
+class MovingObstacleGame(Game):
+    caption = "Day 39 - Dynamic Obstacles & Feedback 🚀"
+    fps = 12
+
+    def __init__(self, screen):
+        super().__init__(screen)
+        WIDTH, HEIGHT = self.width, self.height
+
+        # Fonts
+        self.font = pygame.font.SysFont(None, 40)
+        self.big_font = pygame.font.SysFont(None, 70)
+
+        self.game_bottom = HEIGHT // 2 - 60
+        self.game_height = self.game_bottom - GAME_TOP
+
+        # Moving obstacles setup
+        self.moving_obstacles = []
+        self.moving_velocities = []
+
+        self.player = Player(WIDTH // 2, GAME_TOP + self.game_height // 2)
+
+        # On-screen buttons
+        button_size = 90
+        button_spacing = 25
+        button_y_center = HEIGHT // 2 + 80
+        self.buttons = {
+            "left": pygame.Rect(WIDTH//2 - button_size*2 - button_spacing, button_y_center, button_size, button_size),
+            "right": pygame.Rect(WIDTH//2 + button_size + button_spacing, button_y_center, button_size, button_size),
+            "up": pygame.Rect(WIDTH//2 - button_size//2, button_y_center - button_size - 15, button_size, button_size),
+            "down": pygame.Rect(WIDTH//2 - button_size//2, button_y_center + button_size + 15, button_size, button_size),
+            "restart": pygame.Rect(WIDTH//2 - 100, GAME_TOP + self.game_height//2 + 60, 200, 60),
+        }
+
+        # Only the player, obstacles, score, pressed buttons and game over text are redrawn each frame
+        self.dirty = DirtyRenderer(self.draw_background)
+        self.reset()
+
+    def reset(self):
+        self.player.rect.x = self.width // 2
+        self.player.rect.y = GAME_TOP + self.game_height // 2
+        self.player.score = 0
+        self.game_over = False
+
+        # Reset obstacles
+        self.moving_obstacles.clear()
+        self.moving_velocities.clear()
+        for _ in range(5):
+            x = random.randint(0, self.width - GRID_SIZE)
+            y = random.randint(GAME_TOP, self.game_bottom - GRID_SIZE)
+            rect = pygame.Rect(x, y, GRID_SIZE, GRID_SIZE)
+            self.moving_obstacles.append(rect)
+            # Random initial velocities: -2, -1, 1, or 2
+            vx = random.choice([-2, -1, 1, 2])
+            vy = random.choice([-2, -1, 1, 2])
+            self.moving_velocities.append([vx, vy])
+
+    def counts(self):
+        return {"obstacles": len(self.moving_obstacles)}
+
+    def invalidate(self):
+        self.dirty.invalidate()
+
+    def step(self, inputs):
+        self.player.update()
+
+        if self.game_over:
+            if "restart" in inputs.pressed:
+                self.reset()
+            return
+
+        # Update player
+        held = inputs.held
+        player = self.player
         dx = dy = 0
-        if move_left: dx = -1
-        if move_right: dx = 1
-        if move_up: dy = -1
-        if move_down: dy = 1
+        if "left" in held: dx = -1
+        if "right" in held: dx = 1
+        if "up" in held: dy = -1
+        if "down" in held: dy = 1
         if dx != 0 or dy != 0:
             player.move(dx, dy)
 
         # Boundary collision
-        if (player.rect.left < 0 or player.rect.right > WIDTH or
-            player.rect.top < GAME_TOP or player.rect.bottom > GAME_BOTTOM):
-            game_over = True
-
-        # Obstacle collision
-        for obs in moving_obstacles:
-            if player.rect.colliderect(obs):
-                player.bump_timer = 5
-                game_over = True
-                break
+        if (player.rect.left < 0 or player.rect.right > self.width or
+            player.rect.top < GAME_TOP or player.rect.bottom > self.game_bottom):
+            self.game_over = True
+
+        with perf.zone("collision"):
+            # Obstacle collision
+            for obs in self.moving_obstacles:
+                if player.rect.colliderect(obs):
+                    player.bump_timer = 5
+                    self.game_over = True
+                    break
 
         # Update moving obstacles dynamically
-        for i, obs in enumerate(moving_obstacles):
+        moving_velocities = self.moving_velocities
+        for i, obs in enumerate(self.moving_obstacles):
             obs.x += moving_velocities[i][0]
             obs.y += moving_velocities[i][1]
 
             # Bounce off walls with slight random adjustment
-            if obs.left < 0 or obs.right > WIDTH:
+            if obs.left < 0 or obs.right > self.width:
                 moving_velocities[i][0] *= -1
                 moving_velocities[i][0] += random.choice([-1, 0, 1])
-            if obs.top < GAME_TOP or obs.bottom > GAME_BOTTOM:
+            if obs.top < GAME_TOP or obs.bottom > self.game_bottom:
                 moving_velocities[i][1] *= -1
                 moving_velocities[i][1] += random.choice([-1, 0, 1])
 
@@ -173,39 +163,50 @@ while running:
             moving_velocities[i][0] = max(-3, min(3, moving_velocities[i][0]))
             moving_velocities[i][1] = max(-3, min(3, moving_velocities[i][1]))
 
-    # Draw gameplay area
-    pygame.draw.rect(screen, (200, 200, 255), (0, GAME_TOP, WIDTH, GAME_HEIGHT), 4)
-
-    # Draw moving obstacles
-    for obs in moving_obstacles:
-        pygame.draw.rect(screen, PURPLE, obs)
-
-    # Draw player
-    player.draw(screen)
-
-    # Draw score
-    draw_text(f"Score: {player.score}", font, ORANGE, 10, 10, center=False)
-
-    # Draw on-screen buttons
-    for btn, label in [
-        (left_button, "←"), (right_button, "→"),
-        (up_button, "↑"), (down_button, "↓")
-    ]:
-        pygame.draw.rect(screen, DARK_GREEN, btn, border_radius=12)
-        draw_text(label, font, WHITE, btn.centerx, btn.centery)
-        if ((btn == left_button and move_left) or
-            (btn == right_button and move_right) or
-            (btn == up_button and move_up) or
-            (btn == down_button and move_down)):
-            pygame.draw.rect(screen, GREEN, btn.inflate(15, 15), border_radius=12, width=3)
-
-    # Game over screen
-    if game_over:
-        draw_text("GAME OVER", big_font, PURPLE, WIDTH//2, GAME_TOP + GAME_HEIGHT//2 - 30)
-        draw_text(f"Final Score: {player.score}", font, BLACK, WIDTH//2, GAME_TOP + GAME_HEIGHT//2 + 10)
-        restart_btn = pygame.Rect(WIDTH//2 - 100, GAME_TOP + GAME_HEIGHT//2 + 60, 200, 60)
-        pygame.draw.rect(screen, GREEN, restart_btn, border_radius=10)
-        draw_text("Restart", font, WHITE, restart_btn.centerx, restart_btn.centery)
-
-    pygame.display.flip()
-    clock.tick(12)
+    def draw_background(self, surface):
+        surface.fill(WHITE)
+
+        # Draw gameplay area
+        pygame.draw.rect(surface, (200, 200, 255), (0, GAME_TOP, self.width, self.game_height), 4)
+
+        # Draw on-screen buttons at rest
+        for name, label in BUTTON_LABELS:
+            btn = self.buttons[name]
+            pygame.draw.rect(surface, DARK_GREEN, btn, border_radius=12)
+            draw_text(surface, label, self.font, WHITE, btn.centerx, btn.centery)
+
+    def render(self, surface):
+        dirty = self.dirty
+        dirty.begin(surface)
+        font, big_font = self.font, self.big_font
+        WIDTH, GAME_HEIGHT = self.width, self.game_height
+
+        # Draw moving obstacles
+        for obs in self.moving_obstacles:
+            dirty.mark(pygame.draw.rect(surface, PURPLE, obs))
+
+        # Draw player
+        dirty.mark(self.player.draw(surface))
+
+        # Draw score
+        dirty.mark(draw_text(surface, f"Score: {self.player.score}", font, ORANGE, 10, 10, center=False, dynamic=True))
+
+        # Highlight pressed buttons
+        held = () if self.game_over else self.latched.held
+        for name, label in BUTTON_LABELS:
+            if name in held:
+                dirty.mark(pygame.draw.rect(surface, GREEN, self.buttons[name].inflate(15, 15), border_radius=12, width=3))
+
+        # Game over screen
+        if self.game_over:
+            dirty.mark(draw_text(surface, "GAME OVER", big_font, PURPLE, WIDTH//2, GAME_TOP + GAME_HEIGHT//2 - 30))
+            dirty.mark(draw_text(surface, f"Final Score: {self.player.score}", font, BLACK, WIDTH//2, GAME_TOP + GAME_HEIGHT//2 + 10))
+            restart_btn = self.buttons["restart"]
+            dirty.mark(pygame.draw.rect(surface, GREEN, restart_btn, border_radius=10))
+            draw_text(surface, "Restart", font, WHITE, restart_btn.centerx, restart_btn.centery)
+
+        return dirty.end()
+
+
+if __name__ == "__main__":
+    run(MovingObstacleGame)
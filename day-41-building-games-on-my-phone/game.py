@@ -1,14 +1,17 @@
 import pygame
 import sys
 import random
-
-pygame.init()
-
-# Full-screen setup
-screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
-WIDTH, HEIGHT = screen.get_size()
-pygame.display.set_caption("Day 41 - Shooting Game")
-clock = pygame.time.Clock()
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from wodi.batch import SpriteBatch
+from wodi.game import Game, run
+from wodi.perf import perf
+from wodi.pool import Pool
+from wodi.spatial import SpatialHash
+from wodi.spawn import SpawnScheduler, Wave
+from wodi.sweep import sweep
+from wodi.text import draw_text
 
 # Colors
 WHITE = (255, 255, 255)
@@ -21,15 +24,10 @@ ORANGE = (255, 165, 0)
 BLUE = (0, 0, 255)
 PURPLE = (150, 0, 150)
 
-# Fonts
-font = pygame.font.SysFont(None, 40)
-big_font = pygame.font.SysFont(None, 70)
-
 # Grid setup
 GRID_SIZE = 40
 GAME_TOP = 80
-GAME_BOTTOM = HEIGHT // 2 - 60
-GAME_HEIGHT = GAME_BOTTOM - GAME_TOP
+
 
 # Player setup
 class Player:
@@ -43,197 +41,226 @@ class Player:
         self.rect.x += dx * GRID_SIZE
         self.rect.y += dy * GRID_SIZE
 
+    def update(self):
+        if self.bump_timer > 0:
+            self.bump_timer -= 1
+
     def draw(self, surface):
         color = YELLOW if self.bump_timer > 0 else self.color
         pygame.draw.rect(surface, color, self.rect)
-        if self.bump_timer > 0:
-            self.bump_timer -= 1
 
-player = Player(WIDTH // 2, GAME_TOP + GAME_HEIGHT // 2)
 
-# Enemy setup
+# Enemy setup (pooled: spawn() re-arms an existing enemy)
 class Enemy:
+    __slots__ = ("rect", "vx", "vy", "index")
+
     def __init__(self):
+        self.rect = pygame.Rect(0, 0, GRID_SIZE, GRID_SIZE)
+        self.vx = self.vy = 0
+
+    def spawn(self, width, game_bottom):
         side = random.choice(['top','bottom','left','right'])
         if side == 'top':
-            self.rect = pygame.Rect(random.randint(0, WIDTH - GRID_SIZE), GAME_TOP, GRID_SIZE, GRID_SIZE)
+            self.rect.topleft = (random.randint(0, width - GRID_SIZE), GAME_TOP)
             self.vx, self.vy = 0, random.randint(1,2)
         elif side == 'bottom':
-            self.rect = pygame.Rect(random.randint(0, WIDTH - GRID_SIZE), GAME_BOTTOM - GRID_SIZE, GRID_SIZE, GRID_SIZE)
+            self.rect.topleft = (random.randint(0, width - GRID_SIZE), game_bottom - GRID_SIZE)
             self.vx, self.vy = 0, -random.randint(1,2)
         elif side == 'left':
-            self.rect = pygame.Rect(0, random.randint(GAME_TOP, GAME_BOTTOM - GRID_SIZE), GRID_SIZE, GRID_SIZE)
+            self.rect.topleft = (0, random.randint(GAME_TOP, game_bottom - GRID_SIZE))
             self.vx, self.vy = random.randint(1,2), 0
         else:  # right
-            self.rect = pygame.Rect(WIDTH - GRID_SIZE, random.randint(GAME_TOP, GAME_BOTTOM - GRID_SIZE), GRID_SIZE, GRID_SIZE)
+            self.rect.topleft = (width - GRID_SIZE, random.randint(GAME_TOP, game_bottom - GRID_SIZE))
             self.vx, self.vy = -random.randint(1,2), 0
 
     def update(self):
         self.rect.x += self.vx
         self.rect.y += self.vy
 
-    def draw(self, surface):
-        pygame.draw.rect(surface, RED, self.rect)
-
-enemies = []
-SPAWN_EVENT = pygame.USEREVENT + 1
-pygame.time.set_timer(SPAWN_EVENT, 1000)  # spawn an enemy every second
 
-# Bullet setup
+# Bullet setup (pooled like Enemy)
 class Bullet:
-    def __init__(self, x, y):
-        self.rect = pygame.Rect(x, y, 10, 10)
+    __slots__ = ("rect", "vy", "index")
+
+    def __init__(self):
+        self.rect = pygame.Rect(0, 0, 10, 10)
         self.vy = -5
 
+    def spawn(self, x, y):
+        self.rect.topleft = (x, y)
+
     def update(self):
         self.rect.y += self.vy
 
-    def draw(self, surface):
-        pygame.draw.rect(surface, BLUE, self.rect)
-
-bullets = []
-
-# On-screen buttons
-button_size = 90
-button_spacing = 25
-button_y_center = HEIGHT // 2 + 80
-
-left_button = pygame.Rect(WIDTH//2 - button_size*2 - button_spacing, button_y_center, button_size, button_size)
-right_button = pygame.Rect(WIDTH//2 + button_size + button_spacing, button_y_center, button_size, button_size)
-up_button = pygame.Rect(WIDTH//2 - button_size//2, button_y_center - button_size - 15, button_size, button_size)
-down_button = pygame.Rect(WIDTH//2 - button_size//2, button_y_center + button_size + 15, button_size, button_size)
-shoot_button = pygame.Rect(WIDTH//2 - button_size//2, button_y_center, button_size, button_size)
-
-move_left = move_right = move_up = move_down = shoot = False
-score = 0
-game_over = False
-
-def draw_text(text, font, color, x, y, center=True):
-    label = font.render(text, True, color)
-    rect = label.get_rect()
-    if center:
-        rect.center = (x, y)
-    else:
-        rect.topleft = (x, y)
-    screen.blit(label, rect)
-
-def reset_game():
-    global player, enemies, bullets, score, game_over
-    player.rect.x = WIDTH // 2
-    player.rect.y = GAME_TOP + GAME_HEIGHT // 2
-    enemies = []
-    bullets = []
-    score = 0
-    game_over = False
-
-running = True
-while running:
-    screen.fill(WHITE)
-
-    # Event handling
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            pygame.quit()
-            sys.exit()
-        if event.type == SPAWN_EVENT and not game_over:
-            enemies.append(Enemy())
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            pos = pygame.mouse.get_pos()
-            if not game_over:
-                move_left = left_button.collidepoint(pos)
-                move_right = right_button.collidepoint(pos)
-                move_up = up_button.collidepoint(pos)
-                move_down = down_button.collidepoint(pos)
-                shoot = shoot_button.collidepoint(pos)
-                if shoot:
-                    bullets.append(Bullet(player.rect.centerx-5, player.rect.top))
-            else:
-                restart_btn = pygame.Rect(WIDTH//2 - 100, GAME_TOP + GAME_HEIGHT//2 + 60, 200, 60)
-                if restart_btn.collidepoint(pos):
-                    reset_game()
-        if event.type == pygame.MOUSEBUTTONUP:
-            move_left = move_right = move_up = move_down = shoot = False
-        if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_ESCAPE:
-                pygame.quit()
-                sys.exit()
-
-    # Update player
-    if not game_over:
+
+# Game setup
+class ShootingGame(Game):
+    caption = "Day 41 - Shooting Game"
+    fps = 30
+    # One enemy a second for 30 s, one every 2/3 s for 30 s, then two a second
+    waves = (Wave(30, ticks=900), Wave(20, ticks=900), Wave(30, 2))
+    max_enemies = 128    # pool sizes; a spawn or shot past these is skipped
+    max_bullets = 128
+
+    def __init__(self, screen):
+        super().__init__(screen)
+        WIDTH, HEIGHT = self.width, self.height
+
+        # Fonts
+        self.font = pygame.font.SysFont(None, 40)
+        self.big_font = pygame.font.SysFont(None, 70)
+
+        self.game_bottom = HEIGHT // 2 - 60
+        self.game_height = self.game_bottom - GAME_TOP
+
+        self.player = Player(WIDTH // 2, GAME_TOP + self.game_height // 2)
+        self.screen_rect = pygame.Rect(0, 0, WIDTH, HEIGHT)
+
+        # Every enemy and bullet is allocated here, once
+        self.enemies = Pool(Enemy, self.max_enemies)
+        self.bullets = Pool(Bullet, self.max_bullets)
+        self.bullet_grid = SpatialHash(GRID_SIZE)
+        self.spawner = SpawnScheduler(self.waves, self.max_enemies)
+        self.batch = SpriteBatch(("enemies", "bullets"))
+
+        # On-screen buttons
+        button_size = 90
+        button_spacing = 25
+        button_y_center = HEIGHT // 2 + 80
+        self.buttons = {
+            "left": pygame.Rect(WIDTH//2 - button_size*2 - button_spacing, button_y_center, button_size, button_size),
+            "right": pygame.Rect(WIDTH//2 + button_size + button_spacing, button_y_center, button_size, button_size),
+            "up": pygame.Rect(WIDTH//2 - button_size//2, button_y_center - button_size - 15, button_size, button_size),
+            "down": pygame.Rect(WIDTH//2 - button_size//2, button_y_center + button_size + 15, button_size, button_size),
+            "shoot": pygame.Rect(WIDTH//2 - button_size//2, button_y_center, button_size, button_size),
+            "restart": pygame.Rect(WIDTH//2 - 100, GAME_TOP + self.game_height//2 + 60, 200, 60),
+        }
+        self.reset()
+
+    def reset(self):
+        self.player.rect.x = self.width // 2
+        self.player.rect.y = GAME_TOP + self.game_height // 2
+        self.enemies.clear()
+        self.bullets.clear()
+        self.spawner.reset()
+        self.score = 0
+        self.game_over = False
+
+    def counts(self):
+        return {"enemies": len(self.enemies), "bullets": len(self.bullets)}
+
+    def step(self, inputs):
+        player = self.player
+        player.update()
+
+        if self.game_over:
+            if "restart" in inputs.pressed:
+                self.reset()
+            return
+
+        # Spawn on game time, at most one enemy a tick and never past the pool
+        for _ in range(self.spawner.due(len(self.enemies))):
+            self.enemies.acquire().spawn(self.width, self.game_bottom)
+
+        if "shoot" in inputs.pressed:
+            bullet = self.bullets.acquire()
+            if bullet is not None:
+                bullet.spawn(player.rect.centerx-5, player.rect.top)
+
+        # Update player
+        held = inputs.held
         dx = dy = 0
-        if move_left: dx = -1
-        if move_right: dx = 1
-        if move_up: dy = -1
-        if move_down: dy = 1
+        if "left" in held: dx = -1
+        if "right" in held: dx = 1
+        if "up" in held: dy = -1
+        if "down" in held: dy = 1
         if dx != 0 or dy != 0:
             player.move(dx, dy)
 
         # Boundary collision
-        if (player.rect.left < 0 or player.rect.right > WIDTH or
-            player.rect.top < GAME_TOP or player.rect.bottom > GAME_BOTTOM):
-            game_over = True
+        if (player.rect.left < 0 or player.rect.right > self.width or
+            player.rect.top < GAME_TOP or player.rect.bottom > self.game_bottom):
+            self.game_over = True
 
-        # Update bullets
-        for b in bullets[:]:
+        # Update bullets (backwards, so releasing swaps in one already visited)
+        bullets = self.bullets
+        for b in reversed(bullets.active):
             b.update()
             if b.rect.bottom < GAME_TOP:
-                bullets.remove(b)
-
-        # Update enemies
-        for e in enemies[:]:
-            e.update()
-            # Collision with player
-            if player.rect.colliderect(e.rect):
-                player.bump_timer = 5
-                game_over = True
-            # Collision with bullets
-            for b in bullets[:]:
-                if e.rect.colliderect(b.rect):
-                    enemies.remove(e)
-                    bullets.remove(b)
-                    score += 1
-                    break
-
-    # Draw gameplay area
-    pygame.draw.rect(screen, (200, 200, 255), (0, GAME_TOP, WIDTH, GAME_HEIGHT), 4)
-
-    # Draw enemies
-    for e in enemies:
-        e.draw(screen)
-
-    # Draw bullets
-    for b in bullets:
-        b.draw(screen)
-
-    # Draw player
-    player.draw(screen)
-
-    # Draw score
-    draw_text(f"Score: {score}", font, ORANGE, 10, 10, center=False)
-
-    # Draw on-screen buttons
-    for btn, label in [
-        (left_button, "←"), (right_button, "→"),
-        (up_button, "↑"), (down_button, "↓"),
-        (shoot_button, "●")
-    ]:
-        pygame.draw.rect(screen, DARK_GREEN, btn, border_radius=12)
-        draw_text(label, font, WHITE, btn.centerx, btn.centery)
-        if ((btn == left_button and move_left) or
-            (btn == right_button and move_right) or
-            (btn == up_button and move_up) or
-            (btn == down_button and move_down) or
-            (btn == shoot_button and shoot)):
-            pygame.draw.rect(screen, GREEN, btn.inflate(15, 15), border_radius=12, width=3)
-
-    # Game over screen
-    if game_over:
-        draw_text("GAME OVER", big_font, RED, WIDTH//2, GAME_TOP + GAME_HEIGHT//2 - 30)
-        draw_text(f"Final Score: {score}", font, BLACK, WIDTH//2, GAME_TOP + GAME_HEIGHT//2 + 10)
-        restart_btn = pygame.Rect(WIDTH//2 - 100, GAME_TOP + GAME_HEIGHT//2 + 60, 200, 60)
-        pygame.draw.rect(screen, GREEN, restart_btn, border_radius=10)
-        draw_text("Restart", font, WHITE, restart_btn.centerx, restart_btn.centery)
-
-    pygame.display.flip()
-    clock.tick(30)
-
+                bullets.release(b)
+
+        with perf.zone("collision"):
+            # Bullets are indexed by the whole stretch they covered this tick
+            bullet_grid = self.bullet_grid
+            bullet_grid.clear()
+            for b in bullets.active:
+                bullet_grid.insert(b, b.rect.union(b.rect.move(0, -b.vy)))
+
+            # Update enemies
+            enemies = self.enemies
+            for e in reversed(enemies.active):
+                e.update()
+                # Collision with player
+                if player.rect.colliderect(e.rect):
+                    player.bump_timer = 5
+                    self.game_over = True
+                # Collision with bullets in neighbouring cells only, swept over the
+                # tick so a bullet cannot skip through an enemy it passed. A bullet
+                # is released the moment it scores (index -1), so the pool changes
+                # in the same order on every run and replays hash the same
+                e_start = e.rect.move(-e.vx, -e.vy)
+                for b in bullet_grid.query(e_start.union(e.rect)):
+                    if b.index >= 0 and sweep(b.rect.move(0, -b.vy), 0, b.vy, e_start, e.vx, e.vy):
+                        bullets.release(b)
+                        self.score += 1
+                        enemies.release(e)
+                        break
+                else:
+                    # Gone off screen for good: nothing can reach it any more
+                    if not self.screen_rect.colliderect(e.rect):
+                        enemies.release(e)
+
+    def render(self, surface):
+        surface.fill(WHITE)
+        font, big_font = self.font, self.big_font
+        WIDTH, GAME_HEIGHT = self.width, self.game_height
+
+        # Draw gameplay area
+        pygame.draw.rect(surface, (200, 200, 255), (0, GAME_TOP, WIDTH, GAME_HEIGHT), 4)
+
+        # Draw enemies and bullets: one cached sprite each, one blits() call per layer
+        batch = self.batch
+        batch.rects("enemies", RED, [e.rect for e in self.enemies], (GRID_SIZE, GRID_SIZE))
+        batch.rects("bullets", BLUE, [b.rect for b in self.bullets], (10, 10))
+        batch.flush(surface)
+
+        # Draw player
+        self.player.draw(surface)
+
+        # Draw score
+        draw_text(surface, f"Score: {self.score}", font, ORANGE, 10, 10, center=False, dynamic=True)
+
+        # Draw on-screen buttons
+        held = () if self.game_over else self.latched.held
+        for name, label in [
+            ("left", "←"), ("right", "→"),
+            ("up", "↑"), ("down", "↓"),
+            ("shoot", "●")
+        ]:
+            btn = self.buttons[name]
+            pygame.draw.rect(surface, DARK_GREEN, btn, border_radius=12)
+            draw_text(surface, label, font, WHITE, btn.centerx, btn.centery)
+            if name in held:
+                pygame.draw.rect(surface, GREEN, btn.inflate(15, 15), border_radius=12, width=3)
+
+        # Game over screen
+        if self.game_over:
+            draw_text(surface, "GAME OVER", big_font, RED, WIDTH//2, GAME_TOP + GAME_HEIGHT//2 - 30)
+            draw_text(surface, f"Final Score: {self.score}", font, BLACK, WIDTH//2, GAME_TOP + GAME_HEIGHT//2 + 10)
+            restart_btn = self.buttons["restart"]
+            pygame.draw.rect(surface, GREEN, restart_btn, border_radius=10)
+            draw_text(surface, "Restart", font, WHITE, restart_btn.centerx, restart_btn.centery)
+
+
+if __name__ == "__main__":
+    run(ShootingGame)
@@ -1,14 +1,16 @@
 import pygame
 import sys
 import random
+import os
 
-pygame.init()
-
-# Full-screen setup
-screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
-WIDTH, HEIGHT = screen.get_size()
-pygame.display.set_caption("Day 42: Shooting Game")
-clock = pygame.time.Clock()
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from wodi.assets import AssetManager
+from wodi.batch import SpriteBatch
+from wodi.entities import EntityStore, EntityView
+from wodi.game import Game, run
+from wodi.perf import perf
+from wodi.spawn import SpawnScheduler, Wave
+from wodi.text import draw_text
 
 # Colors
 WHITE = (255, 255, 255)
@@ -19,192 +21,193 @@ RED = (255, 0, 0)
 BLUE = (0, 0, 255)
 ORANGE = (255, 165, 0)
 
-# Fonts
-font = pygame.font.SysFont(None, 40)
-big_font = pygame.font.SysFont(None, 70)
-
 # Grid setup
 GRID_SIZE = 40
 GAME_TOP = 80
-GAME_BOTTOM = HEIGHT // 2 - 60
-GAME_HEIGHT = GAME_BOTTOM - GAME_TOP
 
-# Load & scale images
-player_img = pygame.image.load("player.png")
-player_img = pygame.transform.scale(player_img, (GRID_SIZE, GRID_SIZE))
+# Images sit next to this file
+ASSET_DIR = os.path.dirname(os.path.abspath(__file__))
 
-enemy_img = pygame.image.load("enemy.png")
-enemy_img = pygame.transform.scale(enemy_img, (GRID_SIZE, GRID_SIZE))
 
 # Player setup
 class Player:
-    def __init__(self, x, y):
+    def __init__(self, x, y, image):
         self.rect = pygame.Rect(x, y, GRID_SIZE, GRID_SIZE)
         self.speed = GRID_SIZE
+        self.image = image
 
     def move(self, dx, dy):
         self.rect.x += dx * GRID_SIZE
         self.rect.y += dy * GRID_SIZE
 
     def draw(self, surface):
-        surface.blit(player_img, self.rect)
+        surface.blit(self.image, self.rect)
 
-player = Player(WIDTH // 2, GAME_TOP + GAME_HEIGHT // 2)
 
 # Enemy setup
-class Enemy:
-    def __init__(self):
+class Enemy(EntityView):
+    __slots__ = ()
+
+    def __init__(self, store, width, game_bottom):
         side = random.choice(['top','bottom','left','right'])
         if side == 'top':
-            self.rect = pygame.Rect(random.randint(0, WIDTH - GRID_SIZE), GAME_TOP, GRID_SIZE, GRID_SIZE)
-            self.vx, self.vy = 0, random.randint(1,2)
+            x, y = random.randint(0, width - GRID_SIZE), GAME_TOP
+            vx, vy = 0, random.randint(1,2)
         elif side == 'bottom':
-            self.rect = pygame.Rect(random.randint(0, WIDTH - GRID_SIZE), GAME_BOTTOM - GRID_SIZE, GRID_SIZE, GRID_SIZE)
-            self.vx, self.vy = 0, -random.randint(1,2)
+            x, y = random.randint(0, width - GRID_SIZE), game_bottom - GRID_SIZE
+            vx, vy = 0, -random.randint(1,2)
         elif side == 'left':
-            self.rect = pygame.Rect(0, random.randint(GAME_TOP, GAME_BOTTOM - GRID_SIZE), GRID_SIZE, GRID_SIZE)
-            self.vx, self.vy = random.randint(1,2), 0
+            x, y = 0, random.randint(GAME_TOP, game_bottom - GRID_SIZE)
+            vx, vy = random.randint(1,2), 0
         else:
-            self.rect = pygame.Rect(WIDTH - GRID_SIZE, random.randint(GAME_TOP, GAME_BOTTOM - GRID_SIZE), GRID_SIZE, GRID_SIZE)
-            self.vx, self.vy = -random.randint(1,2), 0
-
-    def update(self):
-        self.rect.x += self.vx
-        self.rect.y += self.vy
-
-    def draw(self, surface):
-        surface.blit(enemy_img, self.rect)
+            x, y = width - GRID_SIZE, random.randint(GAME_TOP, game_bottom - GRID_SIZE)
+            vx, vy = -random.randint(1,2), 0
+        super().__init__(store, x, y, GRID_SIZE, GRID_SIZE, vx, vy)
 
-enemies = []
-SPAWN_EVENT = pygame.USEREVENT + 1
-pygame.time.set_timer(SPAWN_EVENT, 1000)
 
 # Bullet setup
-class Bullet:
-    def __init__(self, x, y):
-        self.rect = pygame.Rect(x, y, 10, 10)
-        self.vy = -5
-
-    def update(self):
-        self.rect.y += self.vy
-
-    def draw(self, surface):
-        pygame.draw.rect(surface, BLUE, self.rect)
-
-bullets = []
-
-# Buttons
-button_size = 90
-button_y_center = HEIGHT // 2 + 80
-button_spacing = 25
-
-left_button = pygame.Rect(WIDTH//2 - button_size*2 - button_spacing, button_y_center, button_size, button_size)
-right_button = pygame.Rect(WIDTH//2 + button_size + button_spacing, button_y_center, button_size, button_size)
-up_button = pygame.Rect(WIDTH//2 - button_size//2, button_y_center - button_size - 15, button_size, button_size)
-down_button = pygame.Rect(WIDTH//2 - button_size//2, button_y_center + button_size + 15, button_size, button_size)
-shoot_button = pygame.Rect(WIDTH//2 - button_size//2, button_y_center, button_size, button_size)
-
-move_left = move_right = move_up = move_down = shoot = False
-score = 0
-game_over = False
-
-def draw_text(text, font, color, x, y, center=True):
-    label = font.render(text, True, color)
-    rect = label.get_rect(center=(x,y)) if center else label.get_rect(topleft=(x,y))
-    screen.blit(label, rect)
-
-def reset_game():
-    global player, enemies, bullets, score, game_over
-    player.rect.x = WIDTH // 2
-    player.rect.y = GAME_TOP + GAME_HEIGHT // 2
-    enemies = []
-    bullets = []
-    score = 0
-    game_over = False
-
-running = True
-while running:
-    screen.fill(WHITE)
-
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            pygame.quit(); sys.exit()
-        if event.type == SPAWN_EVENT and not game_over:
-            enemies.append(Enemy())
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            pos = pygame.mouse.get_pos()
-            if not game_over:
-                move_left = left_button.collidepoint(pos)
-                move_right = right_button.collidepoint(pos)
-                move_up = up_button.collidepoint(pos)
-                move_down = down_button.collidepoint(pos)
-                shoot = shoot_button.collidepoint(pos)
-                if shoot:
-                    bullets.append(Bullet(player.rect.centerx-5, player.rect.top))
-            else:
-                restart = pygame.Rect(WIDTH//2 - 100, GAME_TOP + GAME_HEIGHT//2 + 60, 200, 60)
-                if restart.collidepoint(pos):
-                    reset_game()
-
-        if event.type == pygame.MOUSEBUTTONUP:
-            move_left = move_right = move_up = move_down = shoot = False
-
-        if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_ESCAPE:
-                pygame.quit(); sys.exit()
-
-    if not game_over:
+class Bullet(EntityView):
+    __slots__ = ()
+
+    def __init__(self, store, x, y):
+        super().__init__(store, x, y, 10, 10, 0, -5)
+
+
+# Game setup
+class ShootingGame(Game):
+    caption = "Day 42: Shooting Game"
+    fps = 30
+    # One enemy a second for 30 s, one every 2/3 s for 30 s, then two a second
+    waves = (Wave(30, ticks=900), Wave(20, ticks=900), Wave(30, 2))
+    max_enemies = 128  # live enemies; spawns past this are dropped
+
+    def __init__(self, screen):
+        super().__init__(screen)
+        WIDTH, HEIGHT = self.width, self.height
+
+        # Fonts
+        self.font = pygame.font.SysFont(None, 40)
+        self.big_font = pygame.font.SysFont(None, 70)
+
+        self.game_bottom = HEIGHT // 2 - 60
+        self.game_height = self.game_bottom - GAME_TOP
+
+        # Load, convert & scale images
+        self.assets = AssetManager(ASSET_DIR)
+        player_img = self.assets.scaled("player.png", (GRID_SIZE, GRID_SIZE))
+        self.enemy_img = self.assets.scaled("enemy.png", (GRID_SIZE, GRID_SIZE))
+
+        self.player = Player(WIDTH // 2, GAME_TOP + self.game_height // 2, player_img)
+
+        # Enemy and bullet positions live in NumPy arrays; the classes are views onto a row
+        self.enemies = EntityStore()
+        self.bullets = EntityStore()
+        self.spawner = SpawnScheduler(self.waves, self.max_enemies)
+        self.batch = SpriteBatch(("enemies", "bullets"))
+
+        # Buttons
+        button_size = 90
+        button_y_center = HEIGHT // 2 + 80
+        button_spacing = 25
+        self.buttons = {
+            "left": pygame.Rect(WIDTH//2 - button_size*2 - button_spacing, button_y_center, button_size, button_size),
+            "right": pygame.Rect(WIDTH//2 + button_size + button_spacing, button_y_center, button_size, button_size),
+            "up": pygame.Rect(WIDTH//2 - button_size//2, button_y_center - button_size - 15, button_size, button_size),
+            "down": pygame.Rect(WIDTH//2 - button_size//2, button_y_center + button_size + 15, button_size, button_size),
+            "shoot": pygame.Rect(WIDTH//2 - button_size//2, button_y_center, button_size, button_size),
+            "restart": pygame.Rect(WIDTH//2 - 100, GAME_TOP + self.game_height//2 + 60, 200, 60),
+        }
+        self.reset()
+
+    def reset(self):
+        self.player.rect.x = self.width // 2
+        self.player.rect.y = GAME_TOP + self.game_height // 2
+        self.enemies.clear()
+        self.bullets.clear()
+        self.spawner.reset()
+        self.score = 0
+        self.game_over = False
+
+    def counts(self):
+        return {"enemies": len(self.enemies), "bullets": len(self.bullets)}
+
+    def step(self, inputs):
+        if self.game_over:
+            if "restart" in inputs.pressed:
+                self.reset()
+            return
+
+        player, enemies, bullets = self.player, self.enemies, self.bullets
+
+        # Spawn on game time, at most one enemy a tick and never past max_enemies
+        for _ in range(self.spawner.due(len(enemies))):
+            Enemy(enemies, self.width, self.game_bottom)
+
+        if "shoot" in inputs.pressed:
+            Bullet(bullets, player.rect.centerx-5, player.rect.top)
+
+        held = inputs.held
         dx = dy = 0
-        if move_left: dx = -1
-        if move_right: dx = 1
-        if move_up: dy = -1
-        if move_down: dy = 1
+        if "left" in held: dx = -1
+        if "right" in held: dx = 1
+        if "up" in held: dy = -1
+        if "down" in held: dy = 1
         if dx or dy: player.move(dx, dy)
 
-        if (player.rect.left < 0 or player.rect.right > WIDTH or
-            player.rect.top < GAME_TOP or player.rect.bottom > GAME_BOTTOM):
-            game_over = True
-
-        for bullet in bullets[:]:
-            bullet.update()
-            if bullet.rect.bottom < GAME_TOP:
-                bullets.remove(bullet)
-
-        for enemy in enemies[:]:
-            enemy.update()
-            if player.rect.colliderect(enemy.rect):
-                game_over = True
-            for bullet in bullets[:]:
-                if enemy.rect.colliderect(bullet.rect):
-                    enemies.remove(enemy)
-                    bullets.remove(bullet)
-                    score += 1
-                    break
-
-    pygame.draw.rect(screen, (200,200,255), (0, GAME_TOP, WIDTH, GAME_HEIGHT), 4)
-
-    for e in enemies: e.draw(screen)
-    for b in bullets: b.draw(screen)
-    player.draw(screen)
-
-    draw_text(f"Score: {score}", font, ORANGE, 10, 10, center=False)
-
-    for btn, label in [
-        (left_button, "←"), (right_button, "→"),
-        (up_button, "↑"), (down_button, "↓"),
-        (shoot_button, "●")
-    ]:
-        pygame.draw.rect(screen, DARK_GREEN, btn, border_radius=12)
-        draw_text(label, font, WHITE, btn.centerx, btn.centery)
-
-    if game_over:
-        draw_text("GAME OVER", big_font, RED, WIDTH//2, GAME_TOP + GAME_HEIGHT//2 - 30)
-        draw_text(f"Final Score: {score}", font, BLACK, WIDTH//2, GAME_TOP + GAME_HEIGHT//2 + 10)
-        restart = pygame.Rect(WIDTH//2 - 100, GAME_TOP + GAME_HEIGHT//2 + 60, 200, 60)
-        pygame.draw.rect(screen, GREEN, restart, border_radius=10)
-        draw_text("Restart", font, WHITE, restart.centerx, restart.centery)
-
-    pygame.display.flip()
-    clock.tick(30)
-
-
+        if (player.rect.left < 0 or player.rect.right > self.width or
+            player.rect.top < GAME_TOP or player.rect.bottom > self.game_bottom):
+            self.game_over = True
+
+        # One vectorised step each for movement, culling and overlap tests
+        bullets.move()
+        bullets.cull(top=GAME_TOP)
+        enemies.move()
+        enemies.cull(left=0, top=0, right=self.width, bottom=self.height)
+        if enemies.collide_rect(player.rect).any():
+            self.game_over = True
+
+        with perf.zone("collision"):
+            hit_enemies, hit_bullets = enemies.overlap_pairs(bullets, GRID_SIZE)
+            for e, b in zip(hit_enemies.tolist(), hit_bullets.tolist()):
+                if enemies.alive[e] and bullets.alive[b]:
+                    enemies.kill(e)
+                    bullets.kill(b)
+                    self.score += 1
+            enemies.compact()
+            bullets.compact()
+
+    def render(self, surface):
+        surface.fill(WHITE)
+        font, big_font = self.font, self.big_font
+        WIDTH, GAME_HEIGHT = self.width, self.game_height
+
+        pygame.draw.rect(surface, (200,200,255), (0, GAME_TOP, WIDTH, GAME_HEIGHT), 4)
+
+        # Positions come straight out of the stores; one blits() call per layer
+        batch = self.batch
+        batch.images("enemies", self.enemy_img, self.enemies.live_positions())
+        batch.rects("bullets", BLUE, self.bullets.live_positions(), (10, 10))
+        batch.flush(surface)
+        self.player.draw(surface)
+
+        draw_text(surface, f"Score: {self.score}", font, ORANGE, 10, 10, center=False, dynamic=True)
+
+        for name, label in [
+            ("left", "←"), ("right", "→"),
+            ("up", "↑"), ("down", "↓"),
+            ("shoot", "●")
+        ]:
+            btn = self.buttons[name]
+            pygame.draw.rect(surface, DARK_GREEN, btn, border_radius=12)
+            draw_text(surface, label, font, WHITE, btn.centerx, btn.centery)
+
+        if self.game_over:
+            draw_text(surface, "GAME OVER", big_font, RED, WIDTH//2, GAME_TOP + GAME_HEIGHT//2 - 30)
+            draw_text(surface, f"Final Score: {self.score}", font, BLACK, WIDTH//2, GAME_TOP + GAME_HEIGHT//2 + 10)
+            restart = self.buttons["restart"]
+            pygame.draw.rect(surface, GREEN, restart, border_radius=10)
+            draw_text(surface, "Restart", font, WHITE, restart.centerx, restart.centery)
+
+
+if __name__ == "__main__":
+    run(ShootingGame)
@@ -0,0 +1 @@
+"""Shared helpers for the WodiGames day-N games."""
@@ -0,0 +1,68 @@
+"""Images loaded once, converted to the display format, with scaled copies cached."""
+
+import os
+
+import pygame
+
+
+class AssetManager:
+    """Loads images relative to `root` and caches them by path and by (path, size).
+
+    hits and misses count one lookup per image() or scaled() call; loading
+    the source image for a new scaled size is part of that scaled() miss.
+
+    Images are run through convert_alpha() (or convert() for opaque ones) as
+    soon as a display exists, so blits are straight copies instead of a
+    per-pixel format conversion. A missing or unreadable file raises at load
+    time rather than leaving the game to run without the image.
+    """
+
+    def __init__(self, root="."):
+        self.root = root
+        self.hits = 0
+        self.misses = 0
+        self._images = {}
+        self._scaled = {}
+
+    def path(self, name):
+        return os.path.join(self.root, name)
+
+    def _convert(self, surface, alpha):
+        if pygame.display.get_surface() is None:
+            return surface
+        return surface.convert_alpha() if alpha else surface.convert()
+
+    def _load(self, name, alpha):
+        """The converted image and whether it was cached already; leaves the counters alone."""
+        key = (self.path(name), alpha)
+        surface = self._images.get(key)
+        if surface is not None:
+            return surface, True
+        surface = self._images[key] = self._convert(pygame.image.load(key[0]), alpha)
+        return surface, False
+
+    def image(self, name, alpha=True):
+        surface, cached = self._load(name, alpha)
+        if cached:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return surface
+
+    def scaled(self, name, size, alpha=True):
+        key = (self.path(name), tuple(size), alpha)
+        surface = self._scaled.get(key)
+        if surface is not None:
+            self.hits += 1
+            return surface
+        self.misses += 1
+        surface = self._scaled[key] = pygame.transform.scale(self._load(name, alpha)[0], size)
+        return surface
+
+    def clear(self):
+        self._images.clear()
+        self._scaled.clear()
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses,
+                "images": len(self._images), "scaled": len(self._scaled)}
@@ -0,0 +1,78 @@
+"""Backgrounds rendered once into a display-format surface and blitted every frame."""
+
+import pygame
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def _channels(color, shape):
+    return numpy.stack([numpy.broadcast_to(c, shape) for c in color], axis=-1).astype(numpy.uint8)
+
+
+def render_gradient(size, row_color):
+    """Vertical gradient where row_color(y) gives the (r, g, b) of row y.
+
+    With NumPy available row_color is called once with an array of rows, so it
+    should stick to arithmetic that works on both ints and arrays.
+    """
+    width, height = size
+    if numpy is not None:
+        ys = numpy.arange(height)
+        rows = _channels(row_color(ys), ys.shape)
+        pixels = numpy.broadcast_to(rows[numpy.newaxis, :, :], (width, height, 3))
+        return pygame.surfarray.make_surface(numpy.ascontiguousarray(pixels))
+    surface = pygame.Surface(size)
+    for y in range(height):
+        pygame.draw.line(surface, row_color(y), (0, y), (width, y))
+    return surface
+
+
+def render_field(size, pixel_color):
+    """Arbitrary gradient where pixel_color(x, y) gives the (r, g, b) of each pixel."""
+    width, height = size
+    if numpy is not None:
+        xs = numpy.arange(width)[:, numpy.newaxis]
+        ys = numpy.arange(height)[numpy.newaxis, :]
+        return pygame.surfarray.make_surface(_channels(pixel_color(xs, ys), (width, height)))
+    surface = pygame.Surface(size)
+    for x in range(width):
+        for y in range(height):
+            surface.set_at((x, y), pixel_color(x, y))
+    return surface
+
+
+class Background:
+    """A solid color, gradient, field or image background cached per screen size."""
+
+    def __init__(self, color=None, gradient=None, field=None, image=None):
+        if color is None and gradient is None and field is None and image is None:
+            raise ValueError("Background needs a color, gradient, field or image")
+        self.color = color
+        self.gradient = gradient
+        self.field = field
+        self.image = image
+        self._surface = None
+
+    def build(self, size):
+        if self.gradient is not None:
+            surface = render_gradient(size, self.gradient)
+        elif self.field is not None:
+            surface = render_field(size, self.field)
+        else:
+            surface = pygame.transform.scale(self.image, size)
+        return surface.convert() if pygame.display.get_surface() else surface
+
+    def invalidate(self):
+        self._surface = None
+
+    def draw(self, surface):
+        if self.color is not None:
+            surface.fill(self.color)
+            return
+        size = surface.get_size()
+        if self._surface is None or self._surface.get_size() != size:
+            self._surface = self.build(size)
+        surface.blit(self._surface, (0, 0))
@@ -0,0 +1,212 @@
+"""Monte Carlo balance sweeps: play thousands of seeded headless runs per parameter set on a process pool.
+
+    python -m wodi.balance day-28-building-games-on-my-phone/game.py \\
+        --set enemy_speed 3 5 7 --set respawn_range "(-150, -40)" "(-300, -40)" \\
+        --runs 2000 --policy dodge --output day28-balance.json
+
+Every combination of the --set values is one parameter set. Each is played
+--runs times, with seeds seed, seed+1, ... The seeds are the same for every
+set, so two sets differ only by their parameters. A parameter is any
+attribute the game sets in __init__. It is assigned before reset(), so
+values read by reset(), such as num_enemies, apply too.
+
+A run steps the game without rendering until game_over or --max-ticks.
+Runs are sent to the workers in chunks, and each worker builds the game
+once per chunk, so the sweep scales with the number of processes.
+"""
+
+import argparse
+import ast
+import itertools
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from wodi.headless import DEFAULT_SIZE, idle_policy, load_game, random_policy  # sets the dummy SDL drivers
+import pygame
+
+from wodi.game import open_screen
+from wodi.input import NO_INPUT, Inputs
+
+PERCENTILES = (10, 25, 50, 75, 90)
+
+
+def dodge_policy(rng=None):
+    """Scripted agent for the falling-enemy games: step away from the nearest enemy coming down on the player.
+
+    Holds "left" or "right" towards the side with more room, or nothing when
+    no enemy above the player overlaps its column.
+    """
+
+    def policy(game, frame):
+        player = game.player
+        column = player.inflate(player.width, 0)
+        threats = [e for e in game.enemies
+                   if e.bottom <= player.bottom and e.right > column.left and e.left < column.right]
+        if not threats:
+            return NO_INPUT
+        nearest = max(threats, key=lambda e: e.bottom)
+        if nearest.centerx > player.centerx or (nearest.centerx == player.centerx and player.centerx > game.width // 2):
+            name = "left" if player.left > 0 else "right"
+        else:
+            name = "right" if player.right < game.width else "left"
+        return Inputs(frozenset([name]), frozenset(), (), frozenset())
+
+    return policy
+
+
+def shoot_policy(rng=None, every=2):
+    """Scripted agent for the shooting games: stand still and tap "shoot" every `every` ticks."""
+    shoot = Inputs(frozenset(["shoot"]), frozenset(["shoot"]), (), frozenset())
+
+    def policy(game, frame):
+        return shoot if frame % every == 0 else NO_INPUT
+
+    return policy
+
+
+POLICIES = {
+    "idle": lambda rng: idle_policy,
+    "random": lambda rng: random_policy(rng=rng),
+    "dodge": dodge_policy,
+    "shoot": shoot_policy,
+}
+
+# Per worker process: the loaded game class and its screen
+_worker = {}
+
+
+def _init_worker(path):
+    pygame.init()
+    game_cls = load_game(path)
+    _worker["game_cls"] = game_cls
+    _worker["screen"] = open_screen(game_cls, DEFAULT_SIZE)
+
+
+def play(game, policy, max_ticks):
+    """Step game until game over or max_ticks; returns (ticks survived, score, reached max_ticks)."""
+    for tick in range(max_ticks):
+        game.step(policy(game, tick))
+        if game.game_over:
+            return tick + 1, game.score, False
+    return max_ticks, game.score, True
+
+
+def run_chunk(params, seeds, policy_name, max_ticks):
+    """Play one run per seed with params applied; runs in a worker process."""
+    game = _worker["game_cls"](_worker["screen"])
+    for name, value in params:
+        if not hasattr(game, name):
+            raise AttributeError(f"{type(game).__name__} has no parameter {name!r}")
+        setattr(game, name, value)
+    results = []
+    for seed in seeds:
+        random.seed(seed)
+        game.reset()
+        policy = POLICIES[policy_name](random.Random(seed))
+        results.append(play(game, policy, max_ticks))
+    return results
+
+
+def distribution(values):
+    ordered = sorted(values)
+    last = len(ordered) - 1
+    summary = {f"p{p}": ordered[round(last * p / 100)] for p in PERCENTILES}
+    summary["mean"] = round(sum(ordered) / len(ordered), 3)
+    summary["min"], summary["max"] = ordered[0], ordered[-1]
+    return summary
+
+
+def summarise(results, fps):
+    ticks = [r[0] for r in results]
+    return {
+        "runs": len(results),
+        "survived": round(sum(r[2] for r in results) / len(results), 4),
+        "seconds": {k: round(v / fps, 3) for k, v in distribution(ticks).items()},
+        "score": distribution([r[1] for r in results]),
+    }
+
+
+def parameter_sets(grid):
+    """Every combination of grid's values, as tuples of (name, value) pairs."""
+    names = list(grid)
+    return [tuple(zip(names, values)) for values in itertools.product(*(grid[n] for n in names))]
+
+
+def sweep(path, grid, runs, policy="random", max_ticks=3600, seed=0, workers=None, chunk=None):
+    """Play `runs` seeded runs of every parameter set in grid and summarise each.
+
+    grid maps attribute names to the values to try. Returns a report dict
+    with one entry per parameter set plus the wall time and runs per second.
+    """
+    workers = workers or os.cpu_count() or 1
+    sets = parameter_sets(grid)
+    seeds = list(range(seed, seed + runs))
+    # Enough chunks to keep every worker busy to the end, few enough to amortise building the game
+    chunk = chunk or max(1, min(250, len(sets) * runs // (workers * 8)))
+    tasks = [(params, seeds[i:i + chunk]) for params in sets for i in range(0, runs, chunk)]
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(os.path.abspath(path),)) as pool:
+        futures = [pool.submit(run_chunk, params, chunk_seeds, policy, max_ticks) for params, chunk_seeds in tasks]
+        results = {params: [] for params in sets}
+        for (params, _), future in zip(tasks, futures):
+            results[params].extend(future.result())
+    seconds = time.perf_counter() - start
+
+    game_cls = load_game(path)
+    return {
+        "game": game_cls.caption,
+        "policy": policy,
+        "max_ticks": max_ticks,
+        "seed": seed,
+        "workers": workers,
+        "seconds": round(seconds, 3),
+        "runs_per_second": round(len(sets) * runs / seconds, 1),
+        "sets": [{"params": dict(params), **summarise(results[params], game_cls.fps)} for params in sets],
+    }
+
+
+def print_report(report):
+    print(f"{report['game']}: {len(report['sets'])} parameter sets, policy {report['policy']}, "
+          f"{report['workers']} workers, {report['seconds']:.1f}s ({report['runs_per_second']:.0f} runs/sec)")
+    print(f"  {'parameters':<40} {'survived':>8} {'p10 s':>7} {'p50 s':>7} {'p90 s':>7} "
+          f"{'p10 score':>9} {'p50 score':>9} {'p90 score':>9}")
+    for s in report["sets"]:
+        params = ", ".join(f"{k}={v!r}" for k, v in s["params"].items())
+        sec, score = s["seconds"], s["score"]
+        print(f"  {params:<40} {s['survived']:8.1%} {sec['p10']:7.1f} {sec['p50']:7.1f} {sec['p90']:7.1f} "
+              f"{score['p10']:9} {score['p50']:9} {score['p90']:9}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("game", help="path to a day-N game.py")
+    parser.add_argument("--set", nargs="+", action="append", default=[], metavar=("NAME", "VALUE"),
+                        help="a parameter and the Python literals to try for it; repeatable")
+    parser.add_argument("--runs", type=int, default=1000, help="seeded runs per parameter set")
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="random")
+    parser.add_argument("--max-ticks", type=int, default=3600, help="ticks before a run counts as survived")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first run")
+    parser.add_argument("--workers", type=int, help="processes (default: one per CPU)")
+    parser.add_argument("--output", metavar="PATH", help="write the report as JSON")
+    args = parser.parse_args(argv)
+
+    grid = {}
+    for name, *values in args.set:
+        if not values:
+            parser.error(f"--set {name} needs at least one value")
+        grid[name] = [ast.literal_eval(v) for v in values]
+    report = sweep(args.game, grid, args.runs, args.policy, args.max_ticks, args.seed, args.workers)
+    print_report(report)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"report written to {args.output}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+"""Batched sprite drawing: queue (image, dest) pairs per layer and blit each layer in one call."""
+
+import pygame
+
+_solids = {}
+
+
+def solid(color, size):
+    """A cached opaque surface filled with color.
+
+    Blitting it draws exactly the pixels pygame.draw.rect(surface, color, rect)
+    would for a rect of that size, so a crowd of same-coloured rects becomes
+    one texture blitted many times.
+    """
+    key = (tuple(color), tuple(size))
+    surface = _solids.get(key)
+    if surface is None:
+        surface = pygame.Surface(size)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        surface.fill(color)
+        _solids[key] = surface
+    return surface
+
+
+class SpriteBatch:
+    """Draw calls collected per layer during render and submitted with one Surface.blits() each.
+
+        batch.rects("enemies", RED, enemy_rects)
+        batch.image("player", player_image, player.rect)
+        batch.flush(surface)
+
+    Layers are drawn in the order they were named in the constructor, and
+    each layer in the order its sprites were added.
+    """
+
+    def __init__(self, layers):
+        self.layers = {name: [] for name in layers}
+
+    def __len__(self):
+        return sum(len(queue) for queue in self.layers.values())
+
+    def image(self, layer, image, dest):
+        self.layers[layer].append((image, dest))
+
+    def images(self, layer, image, dests):
+        """Queue the same image at every dest (a rect or an (x, y) pair)."""
+        self.layers[layer].extend([(image, dest) for dest in dests])
+
+    def rect(self, layer, color, rect):
+        rect = pygame.Rect(rect)
+        self.layers[layer].append((solid(color, rect.size), rect.topleft))
+
+    def rects(self, layer, color, rects, size=None):
+        """Queue solid rects of one colour; pass size when they all share it to skip per-rect lookups."""
+        if size is None:
+            self.layers[layer].extend([(solid(color, rect.size), rect.topleft) for rect in rects])
+        else:
+            self.images(layer, solid(color, size), rects)
+
+    def flush(self, surface, dirty=None):
+        """Blit and empty every layer; returns the number of sprites drawn.
+
+        With a wodi.dirty.DirtyRenderer, the area each blit touched is marked on it.
+        Under pygame-ce, layers that need no rects back go through fblits().
+        """
+        drawn = 0
+        fblits = getattr(surface, "fblits", None)
+        for queue in self.layers.values():
+            if not queue:
+                continue
+            if dirty is None:
+                if fblits is not None:
+                    fblits(queue)
+                else:
+                    surface.blits(queue, doreturn=False)
+            else:
+                dirty.mark_all(surface.blits(queue))
+            drawn += len(queue)
+            queue.clear()
+        return drawn
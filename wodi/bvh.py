@@ -0,0 +1,109 @@
+"""Bounding volume hierarchy over a level's static platforms."""
+
+from wodi.sweep import landing
+
+LEAF_SIZE = 4
+
+
+class PlatformIndex:
+    """An AABB tree built once from a list of rects that never move.
+
+    Each node is a flat tuple (left, top, right, bottom, first_child,
+    second_child, items), where items holds the platform indices of a leaf
+    and is None otherwise. Queries descend only into boxes that can matter,
+    so they cost O(log n) plus the platforms found instead of a scan over
+    every platform. Results are platform indices, in list order.
+    """
+
+    def __init__(self, platforms, leaf_size=LEAF_SIZE):
+        self.platforms = list(platforms)
+        self.leaf_size = leaf_size
+        self.nodes = []
+        if self.platforms:
+            self._build(list(range(len(self.platforms))))
+
+    def __len__(self):
+        return len(self.platforms)
+
+    def _build(self, items):
+        """Append the subtree over `items` and return its node number."""
+        rects = self.platforms
+        left = min(rects[i].left for i in items)
+        top = min(rects[i].top for i in items)
+        right = max(rects[i].right for i in items)
+        bottom = max(rects[i].bottom for i in items)
+        node = len(self.nodes)
+        self.nodes.append(None)
+        if len(items) <= self.leaf_size:
+            self.nodes[node] = (left, top, right, bottom, 0, 0, tuple(sorted(items)))
+            return node
+
+        # Split at the median centre along the box's longer side
+        if right - left >= bottom - top:
+            items.sort(key=lambda i: rects[i].centerx)
+        else:
+            items.sort(key=lambda i: rects[i].centery)
+        half = len(items) // 2
+        first = self._build(items[:half])
+        second = self._build(items[half:])
+        self.nodes[node] = (left, top, right, bottom, first, second, None)
+        return node
+
+    def overlapping(self, rect):
+        """Indices of the platforms rect overlaps (colliderect), in list order."""
+        if not self.nodes:
+            return []
+        left, top, right, bottom = rect.left, rect.top, rect.right, rect.bottom
+        nodes, rects = self.nodes, self.platforms
+        found = []
+        stack = [0]
+        while stack:
+            l, t, r, b, first, second, items = nodes[stack.pop()]
+            if l >= right or r <= left or t >= bottom or b <= top:
+                continue
+            if items is None:
+                stack.append(first)
+                stack.append(second)
+            else:
+                found.extend(i for i in items if rects[i].colliderect(rect))
+        found.sort()
+        return found
+
+    def ground_below(self, rect):
+        """Index of the highest platform whose top is at or below rect.bottom and which
+        shares some of rect's columns, or -1. Ties go to the earlier platform."""
+        if not self.nodes:
+            return -1
+        left, right, floor = rect.left, rect.right, rect.bottom
+        nodes, rects = self.nodes, self.platforms
+        best, best_top = -1, None
+        stack = [0]
+        while stack:
+            l, t, r, b, first, second, items = nodes[stack.pop()]
+            # Nothing in this box lies below the rect, or nothing can beat the best so far
+            if l >= right or r <= left or b < floor or (best_top is not None and t > best_top):
+                continue
+            if items is None:
+                # Higher box on top of the stack: a good early answer prunes more
+                if nodes[first][1] < nodes[second][1]:
+                    first, second = second, first
+                stack.append(first)
+                stack.append(second)
+                continue
+            for i in items:
+                plat = rects[i]
+                if plat.top >= floor and plat.left < right and plat.right > left:
+                    if best_top is None or plat.top < best_top or (plat.top == best_top and i < best):
+                        best, best_top = i, plat.top
+        return best
+
+    def resting_on(self, rect):
+        """overlapping() for ground checks: also returns platforms rect could touch once it
+        has been snapped up onto one of them, so platforms can be resolved in list order."""
+        return self.overlapping(rect.union(rect.move(0, -rect.height)))
+
+    def landing(self, prev, rect):
+        """wodi.sweep.landing() against only the platforms near the move; index is into platforms."""
+        near = self.overlapping(prev.union(rect))
+        hit = landing(prev, rect, [self.platforms[i] for i in near])
+        return hit._replace(index=near[hit.index]) if hit else None
@@ -0,0 +1,115 @@
+"""A scrolling camera, and level geometry pre-rendered into cached chunk surfaces.
+
+Static geometry is drawn once into CHUNK_PX-square surfaces; each frame the
+camera blits only the chunks overlapping its view, so a level costs a
+handful of blits however many platforms it holds. A chunk is redrawn only
+after invalidate() says something in it changed.
+
+Chunk surfaces use an RLE colour key rather than per-pixel alpha: blitting
+two mostly-empty 512x512 chunks costs about as much as one draw.rect, where
+alpha blending would cost ~80 times more.
+"""
+
+import pygame
+
+CHUNK_PX = 512
+TRANSPARENT = (255, 0, 255)
+
+
+def keyed_surface(size):
+    """A blank chunk surface, all TRANSPARENT."""
+    surface = pygame.Surface(size)
+    surface.fill(TRANSPARENT)
+    return surface
+
+
+def finish_surface(surface):
+    """Convert a drawn chunk for fast blitting once a display exists, and key out TRANSPARENT."""
+    if pygame.display.get_surface() is not None:
+        surface = surface.convert()
+    surface.set_colorkey(TRANSPARENT, pygame.RLEACCEL)
+    return surface
+
+
+class Camera:
+    """The part of the world shown on screen: `rect` in world pixels, kept inside `bounds`."""
+
+    def __init__(self, size, bounds=None):
+        self.rect = pygame.Rect((0, 0), size)
+        self.bounds = bounds
+
+    def follow(self, target):
+        """Centre the view on target (a world rect), without leaving bounds."""
+        self.rect.center = target.center
+        if self.bounds is not None:
+            self.rect.clamp_ip(self.bounds)
+
+    def to_screen(self, rect):
+        return rect.move(-self.rect.x, -self.rect.y)
+
+    def to_world(self, pos):
+        return pos[0] + self.rect.x, pos[1] + self.rect.y
+
+    def draw(self, surface, layer):
+        """Blit the chunks of `layer` that overlap the view; returns how many were drawn.
+
+        layer is anything with visible(view) -> [(chunk surface, world topleft)],
+        such as StaticLayer or wodi.tilemap.TileMap.
+        """
+        x, y = self.rect.topleft
+        chunks = layer.visible(self.rect)
+        surface.blits([(chunk, (left - x, top - y)) for chunk, (left, top) in chunks], doreturn=False)
+        return len(chunks)
+
+
+class StaticLayer:
+    """Solid-colour rects that do not move (platforms, walls), drawn into chunk surfaces on demand."""
+
+    def __init__(self, shapes=(), chunk_px=CHUNK_PX):
+        self.chunk_px = chunk_px
+        self.shapes = []
+        self._chunks = {}    # (cx, cy) -> indices into shapes
+        self._surfaces = {}  # (cx, cy) -> cached surface
+        self.redraws = 0
+        for rect, color in shapes:
+            self.add(rect, color)
+
+    def _coords(self, rect):
+        size = self.chunk_px
+        return [(cx, cy)
+                for cy in range(rect.top // size, (rect.bottom - 1) // size + 1)
+                for cx in range(rect.left // size, (rect.right - 1) // size + 1)]
+
+    def add(self, rect, color):
+        rect = pygame.Rect(rect)
+        self.shapes.append((rect, color))
+        for key in self._coords(rect):
+            self._chunks.setdefault(key, []).append(len(self.shapes) - 1)
+            self._surfaces.pop(key, None)
+
+    def invalidate(self, rect=None):
+        """Redraw the chunks touching rect (every chunk if None) on their next use."""
+        if rect is None:
+            self._surfaces.clear()
+        else:
+            for key in self._coords(rect):
+                self._surfaces.pop(key, None)
+
+    def surface(self, cx, cy):
+        surface = self._surfaces.get((cx, cy))
+        if surface is None:
+            size = self.chunk_px
+            surface = keyed_surface((size, size))
+            area = pygame.Rect(cx * size, cy * size, size, size)
+            for i in self._chunks.get((cx, cy), ()):
+                rect, color = self.shapes[i]
+                # Clip first: fill() shifts a rect hanging off the left edge instead of cutting it
+                surface.fill(color, rect.clip(area).move(-area.x, -area.y))
+            surface = self._surfaces[(cx, cy)] = finish_surface(surface)
+            self.redraws += 1
+        return surface
+
+    def visible(self, view):
+        size = self.chunk_px
+        return [(self.surface(cx, cy), (cx * size, cy * size))
+                for cx, cy in self._coords(view) if (cx, cy) in self._chunks]
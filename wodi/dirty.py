@@ -0,0 +1,58 @@
+"""Dirty-rectangle rendering: redraw and upload only the parts of the screen that changed."""
+
+import pygame
+
+
+class DirtyRenderer:
+    """Keeps the static scene in a background surface and tracks what is drawn over it.
+
+    draw_background(surface) paints everything that never changes. Each frame:
+
+        dirty.begin(surface)               # restores the background under last frame's rects
+        dirty.mark(pygame.draw.rect(...))  # anything drawn on top
+        return dirty.end()                 # rects for pygame.display.update()
+    """
+
+    def __init__(self, draw_background):
+        self.draw_background = draw_background
+        self.background = None
+        self.surface = None
+        self._previous = []
+        self._current = []
+        self._full = True
+
+    def invalidate(self):
+        """Rebuild the background and repaint the whole screen next frame."""
+        self.background = None
+
+    def begin(self, surface):
+        if self.background is None or self.background.get_size() != surface.get_size():
+            self.background = surface.copy()
+            self.draw_background(self.background)
+            self._full = True
+        if self._full or surface is not self.surface:
+            surface.blit(self.background, (0, 0))
+            self._full = True
+        else:
+            for rect in self._previous:
+                surface.blit(self.background, rect, rect)
+        self.surface = surface
+
+    def mark(self, rect):
+        self._current.append(pygame.Rect(rect))
+        return rect
+
+    def mark_all(self, rects):
+        for rect in rects:
+            self.mark(rect)
+
+    def end(self):
+        if self._full:
+            dirty = [self.surface.get_rect()]
+        else:
+            # Old and new positions both need uploading; things that stayed put only once
+            dirty = list({tuple(rect): rect for rect in self._previous + self._current}.values())
+        self._previous = self._current
+        self._current = []
+        self._full = False
+        return dirty
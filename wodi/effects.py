@@ -0,0 +1,54 @@
+"""Overlay effects drawn from surfaces allocated once per size instead of every frame."""
+
+import pygame
+
+
+class GlowBorder:
+    """A rect outline whose opacity pulses with the clock.
+
+    The outline is four solid strips built once for a given rect size; each
+    frame only their surface alpha changes, looked up in `alphas` by the
+    phase of get_ticks() within `period` milliseconds.
+    """
+
+    def __init__(self, color, width, alphas, period=1000):
+        self.color = color
+        self.width = width
+        self.alphas = alphas
+        self.period = period
+        self._size = None
+        self._strips = []
+        self._alpha = None
+
+    def build(self, size):
+        w, h = size
+        width = self.width
+        # Top and bottom span the full width, sides fit between them so no pixel is blended twice
+        offsets = [
+            pygame.Rect(0, 0, w, width),
+            pygame.Rect(0, h - width, w, width),
+            pygame.Rect(0, width, width, h - 2 * width),
+            pygame.Rect(w - width, width, width, h - 2 * width),
+        ]
+        self._strips = []
+        for offset in offsets:
+            strip = pygame.Surface(offset.size)
+            strip.fill(self.color)
+            self._strips.append((strip, offset))
+        self._size = size
+        self._alpha = None
+
+    def alpha_at(self, ticks):
+        return self.alphas[(ticks % self.period) * len(self.alphas) // self.period]
+
+    def draw(self, surface, rect, ticks):
+        """Blend the outline of rect onto surface; returns the rects it touched."""
+        rect = pygame.Rect(rect)
+        if rect.size != self._size:
+            self.build(rect.size)
+        alpha = self.alpha_at(ticks)
+        if alpha != self._alpha:
+            for strip, _ in self._strips:
+                strip.set_alpha(alpha)
+            self._alpha = alpha
+        return surface.blits([(strip, offset.move(rect.topleft)) for strip, offset in self._strips])
@@ -0,0 +1,191 @@
+"""Python port of experiments/rust/enemy_sim.rs: enemies drifting around a box and bouncing off its edges.
+
+Every tick each enemy moves by its velocity, then a velocity component
+flips sign if that coordinate is now at or beyond a wall (<= 0 or >=
+the world's width/height). Positions are never clamped, so an enemy can
+sit a step outside the box for one tick, exactly as in the Rust prototype.
+The day-39 obstacles bounce the same way but also jitter and clamp their
+velocity; that part is not simulated here.
+
+Three engines run the same rules:
+
+    python  lists and a loop per enemy, the reference
+    numpy   int32 arrays, one vectorised update per tick
+    numba   the reference loop compiled with numba.njit (if numba is installed)
+
+    python -m wodi.enemysim             # the Rust demo's output, for diffing
+    python -m wodi.enemysim --engine numpy
+    python -m wodi.enemysim --check     # every engine against the reference
+"""
+
+import argparse
+import random
+import sys
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+class PythonSim:
+    """Enemy positions and velocities in plain lists."""
+
+    def __init__(self, x, y, vx, vy, width, height):
+        self.x, self.y = list(x), list(y)
+        self.vx, self.vy = list(vx), list(vy)
+        self.width, self.height = width, height
+
+    def __len__(self):
+        return len(self.x)
+
+    def step(self, ticks=1):
+        x, y, vx, vy = self.x, self.y, self.vx, self.vy
+        width, height = self.width, self.height
+        for _ in range(ticks):
+            for i in range(len(x)):
+                x[i] += vx[i]
+                y[i] += vy[i]
+                if x[i] <= 0 or x[i] >= width:
+                    vx[i] = -vx[i]
+                if y[i] <= 0 or y[i] >= height:
+                    vy[i] = -vy[i]
+
+    def state(self):
+        """(x, y, vx, vy) as lists of ints."""
+        return list(self.x), list(self.y), list(self.vx), list(self.vy)
+
+
+class NumpySim(PythonSim):
+    """Enemy positions and velocities in int32 arrays, like the Rust struct's i32 fields."""
+
+    def __init__(self, x, y, vx, vy, width, height):
+        self.x, self.y, self.vx, self.vy = (numpy.array(v, dtype=numpy.int32) for v in (x, y, vx, vy))
+        self.width, self.height = width, height
+        self._flip = numpy.empty(len(self.x), dtype=bool)
+
+    def step(self, ticks=1):
+        x, y, vx, vy, flip = self.x, self.y, self.vx, self.vy, self._flip
+        width, height = self.width, self.height
+        for _ in range(ticks):
+            x += vx
+            y += vy
+            numpy.less_equal(x, 0, out=flip)
+            flip |= x >= width
+            numpy.negative(vx, out=vx, where=flip)
+            numpy.less_equal(y, 0, out=flip)
+            flip |= y >= height
+            numpy.negative(vy, out=vy, where=flip)
+
+    def state(self):
+        return self.x.tolist(), self.y.tolist(), self.vx.tolist(), self.vy.tolist()
+
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def _step_compiled(x, y, vx, vy, width, height, ticks):
+        # Tick by tick like the Rust loop; numba turns the inner loop into SIMD over enemies
+        for _ in range(ticks):
+            for i in range(len(x)):
+                x[i] += vx[i]
+                y[i] += vy[i]
+                if x[i] <= 0 or x[i] >= width:
+                    vx[i] = -vx[i]
+                if y[i] <= 0 or y[i] >= height:
+                    vy[i] = -vy[i]
+
+
+class NumbaSim(NumpySim):
+    """NumpySim's arrays stepped by a numba-compiled loop; the first step() pays for compiling it."""
+
+    def __init__(self, *args):
+        if numba is None:
+            raise RuntimeError("the numba engine needs numba installed")
+        super().__init__(*args)
+
+    def step(self, ticks=1):
+        _step_compiled(self.x, self.y, self.vx, self.vy, numpy.int32(self.width), numpy.int32(self.height), ticks)
+
+
+ENGINES = {"python": PythonSim}
+if numpy is not None:
+    ENGINES["numpy"] = NumpySim
+    if numba is not None:
+        ENGINES["numba"] = NumbaSim
+
+
+def random_enemies(count, width, height, seed=0):
+    """count enemies at random spots inside the box, each velocity component one of -2, -1, 1, 2 as on day 39."""
+    rng = random.Random(seed)
+    x = [rng.randint(1, width - 1) for _ in range(count)]
+    y = [rng.randint(1, height - 1) for _ in range(count)]
+    vx = [rng.choice((-2, -1, 1, 2)) for _ in range(count)]
+    vy = [rng.choice((-2, -1, 1, 2)) for _ in range(count)]
+    return x, y, vx, vy
+
+
+# Enemy count -> ticks compared, in a day-39-sized box
+CHECK_TICKS = {10: 2000, 1000: 300, 100000: 10}
+CHECK_SIZE = (1080, 880)
+
+
+def check(ticks=CHECK_TICKS, batches=(1, 2, 7)):
+    """Raise AssertionError unless every engine matches the python reference tick for tick.
+
+    For each enemy count the reference is stepped one tick at a time.
+    Every engine, the reference included, is stepped in runs of k ticks
+    for each k in batches and must match its full state (positions and
+    velocities) after every run. So step(k) is checked against k single
+    steps as well as against the other engines. Returns the engines checked.
+    """
+    width, height = CHECK_SIZE
+    for count, total in ticks.items():
+        enemies = random_enemies(count, width, height, seed=count)
+        for name, cls in ENGINES.items():
+            for k in batches:
+                reference = PythonSim(*enemies, width, height)
+                sim = cls(*enemies, width, height)
+                for done in range(k, total + 1, k):
+                    for _ in range(k):
+                        reference.step()
+                    sim.step(k)
+                    if sim.state() != reference.state():
+                        raise AssertionError(f"{name} step({k}) diverges from single python steps "
+                                             f"by tick {done} with {count} enemies")
+    return list(ENGINES)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the enemy_sim.rs demo and print what it prints.")
+    parser.add_argument("--engine", choices=sorted(ENGINES), default="python")
+    parser.add_argument("--check", action="store_true", help="cross-check every engine instead")
+    args = parser.parse_args(argv)
+
+    if args.check:
+        skipped = sorted({"numpy", "numba"} - set(ENGINES))
+        if skipped:
+            print(f"not installed, skipped: {', '.join(skipped)}")
+        engines = check()
+        print(f"trajectories identical across {', '.join(engines)}")
+        return
+
+    # The three enemies and 100x50 world from enemy_sim.rs
+    sim = ENGINES[args.engine]([10, 40, 70], [10, 20, 35], [1, -1, 1], [1, 1, -1], 100, 50)
+    print("Starting enemy simulation...\n")
+    for tick in range(30):
+        print(f"Tick {tick}")
+        # Rust prints each enemy right after updating it; enemies are independent, so stepping all first prints the same
+        sim.step()
+        for x, y in zip(*sim.state()[:2]):
+            print(f"Enemy at ({x}, {y})")
+        print("---")
+    print("Simulation ended.")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,209 @@
+"""Struct-of-arrays entity storage with vectorised movement, culling and overlap tests."""
+
+import numpy
+import pygame
+
+FIELDS = ("x", "y", "vx", "vy", "w", "h")
+
+
+class EntityStore:
+    """Keeps every entity's position, velocity and size in contiguous NumPy arrays.
+
+    Rows [0, count) are in use; killed rows stay until compact() packs the live
+    ones to the front, preserving their order. The views of dropped rows go on
+    free_views for the next EntityView of the same class to reuse.
+    """
+
+    def __init__(self, capacity=256):
+        self.count = 0
+        self.alive = numpy.zeros(capacity, dtype=bool)
+        for name in FIELDS:
+            setattr(self, name, numpy.zeros(capacity, dtype=numpy.float64))
+        self.views = [None] * capacity
+        self.free_views = []
+
+    def __len__(self):
+        return int(self.alive[:self.count].sum())
+
+    @property
+    def capacity(self):
+        return len(self.alive)
+
+    def _grow(self):
+        capacity = self.capacity * 2
+        for name in FIELDS + ("alive",):
+            old = getattr(self, name)
+            new = numpy.zeros(capacity, dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+        self.views.extend([None] * (capacity - len(self.views)))
+
+    def spawn(self, view, x, y, w, h, vx=0, vy=0):
+        if self.count == self.capacity:
+            self._grow()
+        i = self.count
+        self.x[i], self.y[i], self.w[i], self.h[i] = x, y, w, h
+        self.vx[i], self.vy[i] = vx, vy
+        self.alive[i] = True
+        self.views[i] = view
+        self.count += 1
+        return i
+
+    def kill(self, index):
+        self.alive[index] = False
+
+    def clear(self):
+        self.alive[:self.count] = False
+        self.free_views.extend(view for view in self.views[:self.count] if view is not None)
+        self.views[:self.count] = [None] * self.count
+        self.count = 0
+
+    def move(self):
+        n = self.count
+        self.x[:n] += self.vx[:n]
+        self.y[:n] += self.vy[:n]
+
+    def cull(self, left=None, top=None, right=None, bottom=None):
+        """Kill every entity lying entirely beyond one of the given bounds."""
+        n = self.count
+        out = numpy.zeros(n, dtype=bool)
+        if left is not None:
+            out |= self.x[:n] + self.w[:n] < left
+        if top is not None:
+            out |= self.y[:n] + self.h[:n] < top
+        if right is not None:
+            out |= self.x[:n] > right
+        if bottom is not None:
+            out |= self.y[:n] > bottom
+        self.alive[:n] &= ~out
+        return out
+
+    def collide_rect(self, rect):
+        """Mask of live entities overlapping rect."""
+        n = self.count
+        return (self.alive[:n]
+                & (self.x[:n] < rect.right) & (rect.left < self.x[:n] + self.w[:n])
+                & (self.y[:n] < rect.bottom) & (rect.top < self.y[:n] + self.h[:n]))
+
+    def overlap_pairs(self, other, cell_size):
+        """Index arrays (i, j) of every overlapping live pair between self and other.
+
+        Both stores are bucketed into cell_size cells; entities no larger than a
+        cell can only touch entities whose cell is one of the nine around theirs.
+        """
+        mine = numpy.flatnonzero(self.alive[:self.count])
+        theirs = numpy.flatnonzero(other.alive[:other.count])
+        empty = numpy.zeros(0, dtype=numpy.intp)
+        if not len(mine) or not len(theirs):
+            return empty, empty
+
+        their_cx = numpy.floor_divide(other.x[theirs], cell_size).astype(numpy.int64)
+        their_cy = numpy.floor_divide(other.y[theirs], cell_size).astype(numpy.int64)
+        keys = (their_cx << 32) + their_cy
+        order = numpy.argsort(keys, kind="stable")
+        keys = keys[order]
+        theirs = theirs[order]
+
+        my_cx = numpy.floor_divide(self.x[mine], cell_size).astype(numpy.int64)
+        my_cy = numpy.floor_divide(self.y[mine], cell_size).astype(numpy.int64)
+        # Querying in key order keeps searchsorted walking the keys forwards
+        order = numpy.argsort((my_cx << 32) + my_cy, kind="stable")
+        mine, my_cx, my_cy = mine[order], my_cx[order], my_cy[order]
+        found_i, found_j = [], []
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                query = ((my_cx + dx) << 32) + (my_cy + dy)
+                lo = numpy.searchsorted(keys, query, "left")
+                hi = numpy.searchsorted(keys, query, "right")
+                counts = hi - lo
+                total = int(counts.sum())
+                if not total:
+                    continue
+                starts = numpy.repeat(lo - numpy.cumsum(counts) + counts, counts)
+                found_i.append(numpy.repeat(mine, counts))
+                found_j.append(theirs[starts + numpy.arange(total)])
+        if not found_i:
+            return empty, empty
+        i = numpy.concatenate(found_i)
+        j = numpy.concatenate(found_j)
+        hit = ((self.x[i] < other.x[j] + other.w[j]) & (other.x[j] < self.x[i] + self.w[i])
+               & (self.y[i] < other.y[j] + other.h[j]) & (other.y[j] < self.y[i] + self.h[i]))
+        i, j = i[hit], j[hit]
+        order = numpy.lexsort((j, i))
+        return i[order], j[order]
+
+    def compact(self):
+        """Pack live rows to the front and renumber their views."""
+        n = self.count
+        keep = numpy.flatnonzero(self.alive[:n])
+        if len(keep) == n:
+            return
+        k = len(keep)
+        views = self.views
+        self.free_views.extend(views[i] for i in numpy.flatnonzero(~self.alive[:n]).tolist() if views[i] is not None)
+        for name in FIELDS:
+            column = getattr(self, name)
+            column[:k] = column[keep]
+        self.alive[:k] = True
+        self.alive[k:n] = False
+        # Rows before the first dead one keep their index
+        start = int(numpy.argmax(keep != numpy.arange(k))) if k and keep[-1] != k - 1 else k
+        moved = [views[i] for i in keep[start:].tolist()]
+        views[start:n] = moved + [None] * (n - k)
+        for index, view in enumerate(moved, start):
+            view.index = index
+        self.count = k
+
+    def live_positions(self):
+        """(x, y) of every live entity truncated to ints like EntityView.rect, for batched drawing."""
+        live = numpy.flatnonzero(self.alive[:self.count])
+        return list(zip(self.x[live].astype(int).tolist(), self.y[live].astype(int).tolist()))
+
+    def live_views(self):
+        views = self.views
+        return [views[i] for i in numpy.flatnonzero(self.alive[:self.count])]
+
+
+class EntityView:
+    """Thin object handle onto one row of an EntityStore.
+
+    Constructing one reuses a view the store has dropped when there is one,
+    so a view must not be kept around after its row is killed.
+    """
+
+    __slots__ = ("store", "index")
+
+    def __new__(cls, store, *args, **kwargs):
+        free = store.free_views
+        if free and type(free[-1]) is cls:
+            return free.pop()
+        return super().__new__(cls)
+
+    def __init__(self, store, x, y, w, h, vx=0, vy=0):
+        self.store = store
+        self.index = store.spawn(self, x, y, w, h, vx, vy)
+
+    @property
+    def alive(self):
+        return bool(self.store.alive[self.index])
+
+    @property
+    def rect(self):
+        s, i = self.store, self.index
+        return pygame.Rect(int(s.x[i]), int(s.y[i]), int(s.w[i]), int(s.h[i]))
+
+    @property
+    def vx(self):
+        return self.store.vx[self.index]
+
+    @property
+    def vy(self):
+        return self.store.vy[self.index]
+
+    def update(self):
+        s, i = self.store, self.index
+        s.x[i] += s.vx[i]
+        s.y[i] += s.vy[i]
+
+    def kill(self):
+        self.store.kill(self.index)
@@ -0,0 +1,152 @@
+"""Common Game object for the day-N games and the windowed runner that drives it."""
+
+import os
+import random
+import sys
+
+import pygame
+
+from wodi.input import NO_INPUT, InputMapper
+from wodi.pacing import Pacer
+from wodi.perf import perf
+from wodi.replay import Recorder
+from wodi.timestep import FixedTimestep
+
+
+class Game:
+    """One game's state; step() advances it one tick and render() draws it.
+
+    Subclasses set caption/size/fps, fill self.buttons with their on-screen
+    button rects (name -> Rect) and never touch the display or the clock, so
+    the same object runs in a window or headless. render() may return the
+    list of rects it changed, and only those are pushed to the display.
+
+    self.latched is the newest input, taken just before render(); drawing
+    feedback such as pressed buttons from it shows a touch on the next frame
+    instead of after the next tick.
+    """
+
+    caption = "WodiGames"
+    size = None        # None opens a fullscreen window
+    fps = 30           # simulation ticks per second
+    render_fps = None  # frame cap for drawing, None = same as fps, 0 = uncapped
+    keys = ()          # key codes the game reads, for scripted input
+
+    def __init__(self, screen):
+        self.width, self.height = screen.get_size()
+        self.buttons = {}
+        self.alpha = 1.0  # fraction of a tick to interpolate moving objects by
+        self.latched = NO_INPUT
+
+    def reset(self):
+        pass
+
+    def counts(self):
+        """Entity counts for the performance overlay, e.g. {"enemies": 12}."""
+        return {}
+
+    def invalidate(self):
+        """Forget cached screen contents; the next render() repaints everything."""
+
+    def step(self, inputs):
+        raise NotImplementedError
+
+    def render(self, surface):
+        raise NotImplementedError
+
+
+def open_screen(game_cls, size=None):
+    size = game_cls.size or size
+    if size is None:
+        return pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+    return pygame.display.set_mode(size)
+
+
+def run(game_cls, pacing=None, late_latch=None, probe=None):
+    """Open a window and play game_cls until the window is closed or Esc is pressed.
+
+    pacing picks a wodi.pacing mode (default $WODI_PACING or "tick").
+    late_latch polls input a second time after the update, right before
+    drawing (default on if $WODI_LATE_LATCH is set). probe, if given, is told
+    about every event, tick, render and flip; see wodi.latency.
+
+    random is seeded from $WODI_SEED, or freshly if unset, and with
+    $WODI_RECORD=path every tick's input is saved there on exit for
+    wodi.replay.
+    """
+    pacing = pacing or os.environ.get("WODI_PACING", "tick")
+    if late_latch is None:
+        late_latch = bool(os.environ.get("WODI_LATE_LATCH"))
+    pygame.init()
+    screen = open_screen(game_cls)
+    pygame.display.set_caption(game_cls.caption)
+    seed = int(os.environ["WODI_SEED"]) if "WODI_SEED" in os.environ else int.from_bytes(os.urandom(4), "little")
+    random.seed(seed)
+    game = game_cls(screen)
+    record_path = os.environ.get("WODI_RECORD")
+    recorder = Recorder(game, seed) if record_path else None
+    stepper = FixedTimestep(game.fps)
+    render_fps = game.fps if game.render_fps is None else game.render_fps
+    pacer = Pacer(render_fps, pacing)
+    mapper = InputMapper(game.buttons, screen.get_size())
+    if probe:
+        probe.start(game)
+
+    def poll():
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
+                if perf.trace_path:
+                    perf.export()
+                if recorder:
+                    recorder.save(record_path)
+                pygame.quit()
+                sys.exit()
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                if perf.visible:
+                    perf.visible = False
+                    game.invalidate()
+                else:
+                    perf.enable(overlay=True)
+            if probe:
+                probe.on_event(event)
+            mapper.handle(event)
+
+    while True:
+        frame_time = pacer.wait()
+        with perf.zone("events"):
+            poll()
+
+        with perf.zone("update"):
+            # Taps wait for the next tick if this frame runs none
+            for _ in range(stepper.advance(frame_time)):
+                inputs = mapper.snapshot()
+                if recorder:
+                    recorder.record(inputs)
+                game.step(inputs)
+                mapper.consume()
+                if probe:
+                    probe.on_step()
+            game.alpha = stepper.alpha
+
+        if late_latch:
+            with perf.zone("latch"):
+                poll()
+        game.latched = mapper.snapshot()
+        if probe:
+            probe.on_render()
+
+        with perf.zone("draw"):
+            dirty = game.render(screen)
+            if perf.visible:
+                overlay = perf.draw(screen)
+                if dirty is not None:
+                    dirty.append(overlay)
+
+        with perf.zone("present"):
+            if dirty is None:
+                pygame.display.flip()
+            else:
+                pygame.display.update(dirty)
+        if probe:
+            probe.on_flip()
+        perf.end_frame(game.counts() if perf.visible else None)
@@ -0,0 +1,91 @@
+"""Occupancy grid over the cells a grid-stepping player can stand on."""
+
+import random
+
+import numpy
+
+
+class OccupancyGrid:
+    """A cols x rows array of cells, `cell` px square, whose top-left cell starts at `origin`.
+
+    Each cell holds -1 when free or the index of the first obstacle overlapping
+    it. Lay the grid on the player's lattice (see covering()) and at() answers
+    "what does the player hit" with one array lookup however many obstacles
+    there are; obstacles themselves may sit anywhere.
+    """
+
+    def __init__(self, origin, cols, rows, cell):
+        self.left, self.top = origin
+        self.cols, self.rows = cols, rows
+        self.cell = cell
+        self.owner = numpy.full((rows, cols), -1, dtype=numpy.int32)
+
+    @classmethod
+    def covering(cls, area, anchor, cell):
+        """Every whole cell inside `area` on the lattice through point `anchor`."""
+        left = area.left + (anchor[0] - area.left) % cell
+        top = area.top + (anchor[1] - area.top) % cell
+        return cls((left, top), (area.right - left) // cell, (area.bottom - top) // cell, cell)
+
+    def clear(self):
+        self.owner.fill(-1)
+
+    def rect(self, col, row):
+        return (self.left + col * self.cell, self.top + row * self.cell, self.cell, self.cell)
+
+    def _span(self, rect):
+        """Column and row ranges of the cells rect overlaps, clipped to the grid."""
+        size = self.cell
+        x0 = max((rect[0] - self.left) // size, 0)
+        x1 = min((rect[0] + rect[2] - 1 - self.left) // size + 1, self.cols)
+        y0 = max((rect[1] - self.top) // size, 0)
+        y1 = min((rect[1] + rect[3] - 1 - self.top) // size + 1, self.rows)
+        return x0, x1, y0, y1
+
+    def add(self, rect, index):
+        """Mark every cell rect overlaps, keeping the lower index where obstacles share a cell."""
+        x0, x1, y0, y1 = self._span(rect)
+        if x0 >= x1 or y0 >= y1:
+            return
+        block = self.owner[y0:y1, x0:x1]
+        numpy.copyto(block, index, where=(block < 0) | (block > index))
+
+    def at(self, rect):
+        """Lowest obstacle index in the cells rect overlaps, or -1.
+
+        Exact for rects on the lattice, such as the player; for other rects
+        it may report an obstacle that only shares a cell with them.
+        """
+        x0, x1, y0, y1 = self._span(rect)
+        if x1 - x0 == 1 and y1 - y0 == 1:
+            return int(self.owner[y0, x0])
+        if x0 >= x1 or y0 >= y1:
+            return -1
+        block = self.owner[y0:y1, x0:x1]
+        taken = block[block >= 0]
+        return int(taken.min()) if taken.size else -1
+
+    def place(self, count, avoid=None, rng=random):
+        """Occupy up to `count` random free cells, numbering them after the highest index in use.
+
+        Only free cells are drawn from, so placement never overlaps and costs
+        O(free cells) rather than retrying until a free cell turns up. Cells
+        overlapping `avoid` (e.g. the player's start) are left free.
+        Returns the new obstacles' rects in index order.
+        """
+        owner = self.owner
+        if avoid is not None:
+            x0, x1, y0, y1 = self._span(avoid)
+            saved = owner[y0:y1, x0:x1].copy()
+            owner[y0:y1, x0:x1] = numpy.where(saved < 0, -2, saved)
+        free = numpy.flatnonzero(owner.ravel() == -1)
+        if avoid is not None:
+            owner[y0:y1, x0:x1] = saved
+
+        first = int(owner.max()) + 1 if owner.size else 0
+        rects = []
+        for i, pick in enumerate(rng.sample(range(len(free)), min(count, len(free)))):
+            row, col = divmod(int(free[pick]), self.cols)
+            owner[row, col] = first + i
+            rects.append(self.rect(col, row))
+        return rects
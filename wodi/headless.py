@@ -0,0 +1,124 @@
+"""Run a game without a window, as fast as the CPU allows.
+
+    python -m wodi.headless day-41-building-games-on-my-phone/game.py --frames 10000
+"""
+
+import argparse
+import importlib.util
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+
+from wodi.game import Game, open_screen
+from wodi.input import NO_INPUT, Inputs
+from wodi.perf import perf
+from wodi.replay import Recorder
+
+# Fullscreen games get a typical phone screen when there is no real display
+DEFAULT_SIZE = (720, 1280)
+
+
+def load_game(path):
+    """Import a day-N game.py and return the Game subclass it defines."""
+    path = os.path.abspath(path)
+    name = "wodi_game_" + os.path.basename(os.path.dirname(path)).replace("-", "_")
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    for value in vars(module).values():
+        if isinstance(value, type) and issubclass(value, Game) and value.__module__ == name:
+            return value
+    raise ValueError(f"{path} does not define a Game subclass")
+
+
+def idle_policy(game, frame):
+    return NO_INPUT
+
+
+def random_policy(rate=0.2, rng=None):
+    """Tap a random button on roughly `rate` of frames and hold it until the next tap."""
+    rng = rng or random.Random(0)
+    state = {"held": frozenset(), "keys": frozenset()}
+
+    def policy(game, frame):
+        if rng.random() >= rate:
+            return Inputs(state["held"], frozenset(), (), state["keys"])
+        names = sorted(game.buttons)
+        pressed = frozenset()
+        taps = ()
+        if names:
+            name = rng.choice(names)
+            pressed = frozenset([name])
+            taps = (game.buttons[name].center,)
+        keys = frozenset(rng.sample(game.keys, rng.randint(0, len(game.keys))))
+        state["held"], state["keys"] = pressed, keys
+        return Inputs(pressed, pressed, taps, keys)
+
+    return policy
+
+
+def run_headless(game_cls, frames, policy=None, size=DEFAULT_SIZE, render=True, seed=None, record=None):
+    """Step (and optionally render) game_cls for `frames` ticks with no throttling.
+
+    With record=path the run is saved as a wodi.replay recording.
+    """
+    pygame.init()
+    screen = open_screen(game_cls, size)
+    if seed is None and record:
+        seed = int.from_bytes(os.urandom(4), "little")
+    if seed is not None:
+        random.seed(seed)
+    game = game_cls(screen)
+    policy = policy or idle_policy
+    recorder = Recorder(game, seed) if record else None
+
+    start = time.perf_counter()
+    for frame in range(frames):
+        with perf.zone("update"):
+            inputs = policy(game, frame)
+            if recorder:
+                recorder.record(inputs)
+            game.step(inputs)
+        if render:
+            with perf.zone("draw"):
+                game.latched = inputs
+                game.render(screen)
+        perf.end_frame()
+    seconds = time.perf_counter() - start
+    if recorder:
+        recorder.save(record)
+    return {"frames": frames, "seconds": seconds, "fps": frames / seconds if seconds else float("inf")}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("game", help="path to a day-N game.py")
+    parser.add_argument("--frames", type=int, default=5000)
+    parser.add_argument("--policy", choices=["idle", "random"], default="random")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-render", action="store_true", help="time game logic only")
+    parser.add_argument("--trace", metavar="PATH", help="write a Chrome trace of the perf zones")
+    parser.add_argument("--record", metavar="PATH", help="save the run as a wodi.replay recording")
+    args = parser.parse_args(argv)
+    if args.trace:
+        perf.enable(overlay=False, trace_path=args.trace)
+
+    game_cls = load_game(args.game)
+    policy = random_policy(rng=random.Random(args.seed)) if args.policy == "random" else idle_policy
+    result = run_headless(game_cls, args.frames, policy, render=not args.no_render, seed=args.seed,
+                          record=args.record)
+    print(f"{game_cls.caption}: {result['frames']} frames in {result['seconds']:.2f}s "
+          f"({result['fps']:.0f} frames/sec)")
+    if args.trace:
+        print(f"trace written to {perf.export()}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+"""Touch, mouse and keyboard events turned into per-frame button actions."""
+
+from collections import namedtuple
+
+import pygame
+
+# held: buttons under a held pointer, pressed: buttons tapped since the last step,
+# taps: tap positions since the last step, keys: key codes currently held down
+Inputs = namedtuple("Inputs", "held pressed taps keys")
+NO_INPUT = Inputs(frozenset(), frozenset(), (), frozenset())
+
+NOTHING = frozenset()
+
+
+class ButtonIndex:
+    """Button rects bucketed into a coarse grid once, so a point is tested against
+    only the one or two buttons overlapping its cell."""
+
+    def __init__(self, buttons, cell_size=64):
+        self.cell_size = cell_size
+        self._cells = {}
+        for name, rect in buttons.items():
+            for cx in range(rect.left // cell_size, (rect.right - 1) // cell_size + 1):
+                for cy in range(rect.top // cell_size, (rect.bottom - 1) // cell_size + 1):
+                    self._cells.setdefault((cx, cy), []).append((name, rect))
+
+    def at(self, pos):
+        candidates = self._cells.get((pos[0] // self.cell_size, pos[1] // self.cell_size))
+        if not candidates:
+            return NOTHING
+        return frozenset(name for name, rect in candidates if rect.collidepoint(pos))
+
+
+class InputMapper:
+    """Tracks every pointer (the mouse and each finger) from events alone.
+
+    handle() every event as it arrives; snapshot() gives the game an immutable
+    Inputs, and consume() clears the one-shot taps once a step has seen them.
+    Several fingers can hold different buttons at once, e.g. move and shoot.
+    """
+
+    def __init__(self, buttons, size):
+        self.index = ButtonIndex(buttons)
+        self.width, self.height = size
+        self._pointers = {}  # pointer id -> buttons under it
+        self._held = NOTHING
+        self._pressed = set()
+        self._taps = []
+        self._keys = set()
+        self._snapshot = NO_INPUT
+
+    def _changed(self):
+        self._snapshot = None
+
+    def _down(self, pointer, pos):
+        under = self.index.at(pos)
+        self._pointers[pointer] = under
+        self._held = self._held | under
+        self._pressed |= under
+        self._taps.append(pos)
+        self._changed()
+
+    def _move(self, pointer, pos):
+        under = self.index.at(pos)
+        if self._pointers.get(pointer, under) != under:
+            # Sliding onto a button holds it without pressing it
+            self._pointers[pointer] = under
+            self._held = frozenset().union(*self._pointers.values())
+            self._changed()
+
+    def _up(self, pointer):
+        if self._pointers.pop(pointer, None) is not None:
+            self._held = frozenset().union(*self._pointers.values())
+            self._changed()
+
+    def _finger(self, event):
+        return (event.touch_id, event.finger_id), (int(event.x * self.width), int(event.y * self.height))
+
+    def handle(self, event):
+        kind = event.type
+        if kind == pygame.FINGERDOWN:
+            self._down(*self._finger(event))
+        elif kind == pygame.FINGERMOTION:
+            self._move(*self._finger(event))
+        elif kind == pygame.FINGERUP:
+            self._up(self._finger(event)[0])
+        # SDL also reports touches as mouse events; the finger events above already cover them
+        elif getattr(event, "touch", False):
+            return
+        elif kind == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            self._down("mouse", event.pos)
+        elif kind == pygame.MOUSEMOTION and "mouse" in self._pointers:
+            self._move("mouse", event.pos)
+        elif kind == pygame.MOUSEBUTTONUP and event.button == 1:
+            self._up("mouse")
+        elif kind == pygame.KEYDOWN:
+            self._keys.add(event.key)
+            self._changed()
+        elif kind == pygame.KEYUP:
+            self._keys.discard(event.key)
+            self._changed()
+
+    def snapshot(self):
+        if self._snapshot is None:
+            self._snapshot = Inputs(self._held, frozenset(self._pressed), tuple(self._taps), frozenset(self._keys))
+        return self._snapshot
+
+    def consume(self):
+        """Drop taps a step has already acted on; held buttons and keys carry over."""
+        if self._pressed or self._taps:
+            self._pressed.clear()
+            self._taps.clear()
+            self._changed()
@@ -0,0 +1,54 @@
+"""Input-to-flip latency probe for wodi.game.run.
+
+Every press (mouse button, finger or key down) is timestamped when the
+runner reads it, or earlier if the event carries an `injected_at`
+perf_counter stamp, as benchmarks/bench_latency.py does. Two latencies are
+kept per press, each ending at the first flip after:
+
+    tick      a game.step() that was given the press
+    feedback  a game.render() whose game.latched input included it
+
+Pass a probe to run(game_cls, probe=LatencyProbe()).
+"""
+
+import time
+
+import pygame
+
+PRESS_EVENTS = (pygame.MOUSEBUTTONDOWN, pygame.FINGERDOWN, pygame.KEYDOWN)
+
+
+class LatencyProbe:
+    def __init__(self):
+        self.game = None
+        self.waiting_tick = []
+        self.waiting_render = []
+        self.ticked = []
+        self.rendered = []
+        self.tick = []      # seconds, one per press
+        self.feedback = []
+
+    def start(self, game):
+        self.game = game
+
+    def on_event(self, event):
+        if event.type not in PRESS_EVENTS:
+            return
+        stamp = getattr(event, "injected_at", None) or time.perf_counter()
+        self.waiting_tick.append(stamp)
+        self.waiting_render.append(stamp)
+
+    def on_step(self):
+        self.ticked += self.waiting_tick
+        self.waiting_tick.clear()
+
+    def on_render(self):
+        self.rendered += self.waiting_render
+        self.waiting_render.clear()
+
+    def on_flip(self):
+        now = time.perf_counter()
+        self.tick += [now - t for t in self.ticked]
+        self.feedback += [now - t for t in self.rendered]
+        self.ticked.clear()
+        self.rendered.clear()
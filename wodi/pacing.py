@@ -0,0 +1,61 @@
+"""Frame pacing: how the runner waits out the rest of each frame.
+
+Clock.tick() sleeps with SDL_Delay, which can wake a few milliseconds late
+on a busy phone, so frames arrive unevenly. The other modes trade CPU for
+steadier frames:
+
+    tick      Clock.tick, cheapest, least accurate
+    busy      Clock.tick_busy_loop, spins for the whole wait and burns a core
+    adaptive  sleeps most of the wait and spins only the last stretch; the
+              spin margin follows how late sleep() has been waking up
+"""
+
+import time
+
+import pygame
+
+MODES = ("tick", "busy", "adaptive")
+
+MIN_MARGIN = 0.0005
+MAX_MARGIN = 0.004
+
+
+class Pacer:
+    """Waits until the next frame is due; wait() returns the seconds since the last frame."""
+
+    def __init__(self, fps, mode="tick"):
+        if mode not in MODES:
+            raise ValueError(f"unknown pacing mode {mode!r}, expected one of {', '.join(MODES)}")
+        self.fps = fps
+        self.mode = mode
+        self.clock = pygame.time.Clock()
+        self.period = 1 / fps if fps else 0.0
+        self.margin = MAX_MARGIN / 2
+        self.oversleep = 0.0  # running average of how late sleep() wakes up
+        self.last = None
+
+    def wait(self):
+        if self.mode == "tick":
+            return self.clock.tick(self.fps) / 1000
+        if self.mode == "busy":
+            return self.clock.tick_busy_loop(self.fps) / 1000
+
+        now = time.perf_counter()
+        if self.last is None:
+            self.last = now
+            return 0.0
+        deadline = self.last + self.period
+        nap = deadline - now - self.margin
+        if nap > 0:
+            time.sleep(nap)
+            late = time.perf_counter() - (now + nap)
+            self.oversleep += (max(late, 0.0) - self.oversleep) * 0.1
+            self.margin = min(max(self.oversleep * 2, MIN_MARGIN), MAX_MARGIN)
+        while time.perf_counter() < deadline:
+            pass
+
+        now = time.perf_counter()
+        frame_time = now - self.last
+        # A frame that ran long starts a new schedule instead of rushing the next ones
+        self.last = deadline if now - deadline < self.period else now
+        return frame_time
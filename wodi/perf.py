@@ -0,0 +1,149 @@
+"""Named timing zones, an on-screen performance overlay and Chrome-trace export.
+
+    from wodi.perf import perf
+
+    with perf.zone("collision"):
+        ...
+
+Zones cost one attribute check while the profiler is off. Set WODI_PERF=1
+to start with the overlay showing (F3 toggles it in the windowed runner) and
+WODI_PERF_TRACE=trace.json to also record every zone for chrome://tracing.
+"""
+
+import json
+import os
+import time
+from collections import deque
+
+import pygame
+
+from wodi.text import draw_text
+
+_now = time.perf_counter_ns
+
+
+class _NullZone:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+NULL_ZONE = _NullZone()
+
+
+class _Zone:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = _now()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.record(self.name, self.start, _now())
+        return False
+
+
+class Profiler:
+    """Per-frame zone timings, frame-time history and entity counts."""
+
+    def __init__(self, history=120):
+        self.enabled = False
+        self.visible = False
+        self.trace_path = None
+        self.frame_times = deque(maxlen=history)  # ms
+        self.zones = {}   # zone name -> ms spent in it last frame
+        self.counts = {}
+        self.events = []
+        self._current = {}
+        self._frame_start = None
+        self._origin = _now()
+        self._font = None
+
+    def enable(self, overlay=True, trace_path=None):
+        self.enabled = True
+        self.visible = overlay
+        self.trace_path = trace_path or self.trace_path
+
+    def disable(self):
+        self.enabled = False
+        self.visible = False
+        self._frame_start = None
+
+    def zone(self, name):
+        if not self.enabled:
+            return NULL_ZONE
+        return _Zone(self, name)
+
+    def record(self, name, start, end):
+        self._current[name] = self._current.get(name, 0) + end - start
+        if self.trace_path:
+            self.events.append({"name": name, "ph": "X", "pid": 0, "tid": 0,
+                                "ts": (start - self._origin) / 1000, "dur": (end - start) / 1000})
+
+    def end_frame(self, counts=None):
+        """Close the current frame: zone totals become the ones shown and a new frame starts."""
+        if not self.enabled:
+            return
+        now = _now()
+        if self._frame_start is not None:
+            self.frame_times.append((now - self._frame_start) / 1e6)
+        self._frame_start = now
+        self.zones = {name: ns / 1e6 for name, ns in self._current.items()}
+        self._current.clear()
+        if counts is not None:
+            self.counts = counts
+
+    @property
+    def fps(self):
+        if not self.frame_times:
+            return 0.0
+        return 1000 * len(self.frame_times) / sum(self.frame_times)
+
+    def draw(self, surface, x=10, y=50):
+        """Draw the overlay panel and return its rect."""
+        if self._font is None:
+            self._font = pygame.font.SysFont(None, 22)
+        font = self._font
+        line = font.get_linesize()
+        lines = [f"FPS {self.fps:5.1f}"]
+        lines += [f"{name:<10} {ms:6.2f} ms" for name, ms in self.zones.items()]
+        lines += [f"{name:<10} {count:6d}" for name, count in self.counts.items()]
+        graph_w, graph_h = self.frame_times.maxlen, 40
+        panel = pygame.Rect(x, y, max(graph_w, 160) + 10, graph_h + line * len(lines) + 15)
+        surface.fill((0, 0, 0), panel)
+
+        # Frame-time graph: one bar per frame, the line marks 33 ms (30 FPS)
+        base = panel.top + 5 + graph_h
+        for i, ms in enumerate(self.frame_times):
+            h = min(graph_h, int(ms * graph_h / 50))
+            color = (0, 200, 0) if ms <= 1000 / 30 else (255, 80, 0)
+            surface.fill(color, (panel.left + 5 + i, base - h, 1, h))
+        mark = base - int((1000 / 30) * graph_h / 50)
+        surface.fill((120, 120, 120), (panel.left + 5, mark, graph_w, 1))
+
+        ty = base + 5
+        for text in lines:
+            draw_text(surface, text, font, (255, 255, 255), panel.left + 5, ty, center=False, dynamic=True)
+            ty += line
+        return panel
+
+    def export(self, path=None):
+        """Write the recorded zones as a Chrome trace (chrome://tracing, Perfetto)."""
+        path = path or self.trace_path
+        with open(path, "w") as f:
+            json.dump({"traceEvents": self.events, "displayTimeUnit": "ms"}, f)
+        return path
+
+
+perf = Profiler()
+
+if os.environ.get("WODI_PERF") or os.environ.get("WODI_PERF_TRACE"):
+    perf.enable(overlay=bool(os.environ.get("WODI_PERF")), trace_path=os.environ.get("WODI_PERF_TRACE"))
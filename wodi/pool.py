@@ -0,0 +1,51 @@
+"""Fixed-capacity object pools so steady-state play allocates nothing."""
+
+
+class Pool:
+    """`capacity` objects built up front and handed out from a free list.
+
+    Pooled objects need an `index` attribute (a __slots__ entry is enough):
+    it is the object's position in `active`, which lets release() swap the
+    last active object into the hole in O(1). Releasing while looping over
+    `active` is safe when the loop runs backwards, e.g. reversed(pool.active).
+    """
+
+    def __init__(self, factory, capacity):
+        self.capacity = capacity
+        self.active = []
+        self.free = [factory() for _ in range(capacity)]
+        for obj in self.free:
+            obj.index = -1
+
+    def __len__(self):
+        return len(self.active)
+
+    def __iter__(self):
+        return iter(self.active)
+
+    def acquire(self):
+        """An unused object, or None when all of them are active."""
+        if not self.free:
+            return None
+        obj = self.free.pop()
+        obj.index = len(self.active)
+        self.active.append(obj)
+        return obj
+
+    def release(self, obj):
+        index = obj.index
+        if index < 0:
+            return
+        active = self.active
+        last = active.pop()
+        if last is not obj:
+            active[index] = last
+            last.index = index
+        obj.index = -1
+        self.free.append(obj)
+
+    def clear(self):
+        for obj in self.active:
+            obj.index = -1
+        self.free.extend(self.active)
+        self.active.clear()
@@ -0,0 +1,280 @@
+"""Record a game's seed and per-tick input, and replay it headless to check it still plays out the same.
+
+    WODI_RECORD=run.wodr python day-41-building-games-on-my-phone/game.py
+    python -m wodi.headless day-41-building-games-on-my-phone/game.py --frames 18000 --record run.wodr
+    python -m wodi.replay run.wodr
+
+A recording is a small header (format version, seed, screen size, tick
+rate, game directory, button names and key codes), the final score and a
+SHA-1 of the game state after the last tick, then the zlib-compressed ticks.
+Each tick stores the held/pressed buttons and held keys as bitmasks plus any
+tap positions; runs of identical ticks without taps are stored once with a
+repeat count, so idle stretches cost nothing.
+"""
+
+import argparse
+import hashlib
+import inspect
+import os
+import random
+import struct
+import sys
+import time
+import zlib
+
+import pygame
+
+from wodi.assets import AssetManager
+from wodi.background import Background
+from wodi.batch import SpriteBatch
+from wodi.camera import Camera, StaticLayer
+from wodi.dirty import DirtyRenderer
+from wodi.effects import GlowBorder
+from wodi.input import ButtonIndex, Inputs
+from wodi.pool import Pool
+from wodi.spatial import SpatialHash
+from wodi.text import GlyphAtlas, TextCache
+
+MAGIC = b"WODR"
+VERSION = 1
+HEADER = struct.Struct("<4sBQHHH")  # magic, version, seed, width, height, fps
+FOOTER = struct.Struct("<IBq20s")   # ticks, has score, score, state hash
+TICK = struct.Struct("<HHHHB")      # repeat, held, pressed, keys, tap count
+TAP = struct.Struct("<hh")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Drawing helpers and derived indexes; they never feed back into step()
+UNHASHED_TYPES = (pygame.Surface, pygame.font.Font, AssetManager, Background, ButtonIndex, Camera,
+                  DirtyRenderer, GlowBorder, GlyphAtlas, SpatialHash, SpriteBatch, StaticLayer, TextCache)
+UNHASHED_ATTRS = frozenset(["latched", "alpha"])
+
+
+def plain(value, seen=None):
+    """value as nested tuples of numbers and strings, in a deterministic order."""
+    if seen is None:
+        seen = {}
+    if value is None or isinstance(value, (bool, int, str)):
+        return value
+    if isinstance(value, float):
+        return repr(value)
+    if isinstance(value, pygame.Rect):
+        return ("Rect",) + tuple(value)
+    if isinstance(value, UNHASHED_TYPES) or callable(value):
+        return None
+    if isinstance(value, Pool):
+        # Only the live objects, in update order; the free list is allocator bookkeeping
+        return ("Pool",) + tuple(plain(obj, seen) for obj in value.active)
+    if hasattr(value, "tobytes") and hasattr(value, "dtype"):  # NumPy arrays
+        return ("array", value.dtype.str, value.shape, hashlib.sha1(value.tobytes()).hexdigest())
+    if id(value) in seen:
+        return ("seen", seen[id(value)])
+    seen[id(value)] = len(seen)
+    if isinstance(value, (list, tuple)):
+        return tuple(plain(item, seen) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return ("set",) + tuple(sorted(repr(plain(item, seen)) for item in value))
+    if isinstance(value, dict):
+        return ("dict",) + tuple((plain(k, seen), plain(v, seen)) for k, v in value.items())
+
+    fields = dict(getattr(value, "__dict__", {}))
+    for cls in type(value).__mro__:
+        for name in getattr(cls, "__slots__", ()):
+            if hasattr(value, name):
+                fields[name] = getattr(value, name)
+    return (type(value).__name__,) + tuple(
+        (name, plain(field, seen)) for name, field in fields.items() if name not in UNHASHED_ATTRS)
+
+
+def state_hash(game):
+    """SHA-1 of everything step() can change, ignoring what only drawing uses.
+
+    A Pool counts as its active objects in order; which objects sit on its
+    free list, and in what order, makes no difference.
+    """
+    return hashlib.sha1(repr(plain(game)).encode()).digest()
+
+
+def score_of(game):
+    score = getattr(game, "score", None)
+    if score is None:
+        score = getattr(getattr(game, "player", None), "score", None)
+    return score
+
+
+def game_dir(game_cls):
+    # Game modules loaded by wodi.headless are not in sys.modules, so go by a method's code
+    return os.path.basename(os.path.dirname(os.path.abspath(inspect.getfile(game_cls.step))))
+
+
+class Recorder:
+    """Collects one game's ticks; save() writes them out with the final score and state hash."""
+
+    def __init__(self, game, seed, name=None):
+        self.game = game
+        self.seed = seed
+        self.name = name or game_dir(type(game))
+        self.buttons = sorted(game.buttons)
+        self.keys = list(game.keys)
+        if len(self.buttons) > 16 or len(self.keys) > 16:
+            raise ValueError("recordings hold at most 16 buttons and 16 keys")
+        self._bits = {name: 1 << i for i, name in enumerate(self.buttons)}
+        self._key_bits = {key: 1 << i for i, key in enumerate(self.keys)}
+        self.ticks = 0
+        self._chunks = []
+        self._last = None
+        self._repeat = 0
+
+    def _mask(self, names, bits):
+        mask = 0
+        for name in names:
+            mask |= bits.get(name, 0)
+        return mask
+
+    def record(self, inputs):
+        """Call with the Inputs of every tick, before or after step() sees them."""
+        self.ticks += 1
+        tick = (self._mask(inputs.held, self._bits), self._mask(inputs.pressed, self._bits),
+                self._mask(inputs.keys, self._key_bits))
+        if not inputs.taps and tick == self._last and self._repeat < 0xFFFF:
+            self._repeat += 1
+            return
+        self._flush()
+        if inputs.taps:
+            self._chunks.append(TICK.pack(1, *tick, len(inputs.taps)))
+            self._chunks.extend(TAP.pack(*pos) for pos in inputs.taps)
+            self._last = None
+        else:
+            self._last, self._repeat = tick, 1
+
+    def _flush(self):
+        if self._last is not None:
+            self._chunks.append(TICK.pack(self._repeat, *self._last, 0))
+            self._last = None
+
+    def save(self, path):
+        self._flush()
+        score = score_of(self.game)
+        with open(path, "wb") as f:
+            width, height = self.game.width, self.game.height
+            f.write(HEADER.pack(MAGIC, VERSION, self.seed, width, height, type(self.game).fps))
+            _write_str(f, self.name)
+            f.write(struct.pack("<B", len(self.buttons)))
+            for name in self.buttons:
+                _write_str(f, name)
+            f.write(struct.pack("<B", len(self.keys)))
+            f.write(struct.pack(f"<{len(self.keys)}i", *self.keys))
+            f.write(FOOTER.pack(self.ticks, score is not None, score or 0, state_hash(self.game)))
+            f.write(zlib.compress(b"".join(self._chunks), 9))
+        return path
+
+
+def _write_str(f, text):
+    data = text.encode()
+    f.write(struct.pack("<H", len(data)) + data)
+
+
+def _read_str(data, offset):
+    (n,), offset = struct.unpack_from("<H", data, offset), offset + 2
+    return data[offset:offset + n].decode(), offset + n
+
+
+class Recording:
+    """A loaded recording; inputs() yields its ticks as Inputs."""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            data = f.read()
+        magic, version, self.seed, width, height, self.fps = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} wodi recording")
+        self.path = path
+        self.size = (width, height)
+        offset = HEADER.size
+        self.name, offset = _read_str(data, offset)
+        count, offset = data[offset], offset + 1
+        self.buttons = []
+        for _ in range(count):
+            name, offset = _read_str(data, offset)
+            self.buttons.append(name)
+        n = data[offset]
+        self.keys = list(struct.unpack_from(f"<{n}i", data, offset + 1))
+        offset += 1 + 4 * n
+        self.ticks, has_score, score, self.state_hash = FOOTER.unpack_from(data, offset)
+        self.score = score if has_score else None
+        self._body = zlib.decompress(data[offset + FOOTER.size:])
+
+    def game_path(self, root=ROOT):
+        return os.path.join(root, self.name, "game.py")
+
+    def inputs(self):
+        body, offset = self._body, 0
+        buttons, keys = {}, {}
+
+        def names(mask, table, cache):
+            found = cache.get(mask)
+            if found is None:
+                found = cache[mask] = frozenset(v for i, v in enumerate(table) if mask >> i & 1)
+            return found
+
+        while offset < len(body):
+            repeat, held, pressed, held_keys, n = TICK.unpack_from(body, offset)
+            offset += TICK.size
+            taps = tuple(TAP.unpack_from(body, offset + i * TAP.size) for i in range(n))
+            offset += n * TAP.size
+            tick = Inputs(names(held, self.buttons, buttons), names(pressed, self.buttons, buttons),
+                          taps, names(held_keys, self.keys, keys))
+            for _ in range(repeat):
+                yield tick
+
+
+def replay(recording, game_cls=None, render=False):
+    """Play a Recording headless as fast as possible and compare the outcome with the recorded one."""
+    # wodi.game records through this module, so these wait until first use
+    from wodi.game import open_screen
+    from wodi.headless import load_game
+
+    game_cls = game_cls or load_game(recording.game_path())
+    pygame.init()
+    screen = open_screen(game_cls, recording.size)
+    random.seed(recording.seed)
+    game = game_cls(screen)
+
+    start = time.perf_counter()
+    for inputs in recording.inputs():
+        game.step(inputs)
+        if render:
+            game.latched = inputs
+            game.render(screen)
+    seconds = time.perf_counter() - start
+
+    score, digest = score_of(game), state_hash(game)
+    return {
+        "ticks": recording.ticks,
+        "seconds": seconds,
+        "ticks_per_sec": recording.ticks / seconds if seconds else float("inf"),
+        "score": score,
+        "ok": score == recording.score and digest == recording.state_hash,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("recordings", nargs="+")
+    parser.add_argument("--render", action="store_true", help="also draw every tick")
+    args = parser.parse_args(argv)
+    import wodi.headless  # noqa: F401, sets the dummy SDL drivers before the display opens
+
+    failed = 0
+    for path in args.recordings:
+        recording = Recording(path)
+        result = replay(recording, render=args.render)
+        failed += not result["ok"]
+        print(f"{path}: {recording.name} {result['ticks']} ticks in {result['seconds']:.2f}s "
+              f"({result['ticks_per_sec']:.0f}/sec), score {result['score']} "
+              f"{'matches' if result['ok'] else 'DIFFERS from'} the recording")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+"""Uniform-grid spatial hash for broadphase collision between many small rects."""
+
+
+class SpatialHash:
+    """Buckets objects by the grid cells their rect overlaps.
+
+    Objects up to one cell in size land in at most four cells, so a query only
+    touches the handful of cells around the queried rect instead of every object.
+    """
+
+    def __init__(self, cell_size):
+        self.cell_size = cell_size
+        self._cells = {}
+
+    def __len__(self):
+        return sum(len(bucket) for bucket in self._cells.values())
+
+    def clear(self):
+        self._cells.clear()
+
+    def _span(self, rect):
+        size = self.cell_size
+        return (range(rect.left // size, (rect.right - 1) // size + 1),
+                range(rect.top // size, (rect.bottom - 1) // size + 1))
+
+    def insert(self, obj, rect):
+        cells = self._cells
+        xs, ys = self._span(rect)
+        for cx in xs:
+            for cy in ys:
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = [obj]
+                else:
+                    bucket.append(obj)
+
+    def remove(self, obj, rect):
+        cells = self._cells
+        xs, ys = self._span(rect)
+        for cx in xs:
+            for cy in ys:
+                bucket = cells.get((cx, cy))
+                if bucket is not None and obj in bucket:
+                    bucket.remove(obj)
+                    if not bucket:
+                        del cells[(cx, cy)]
+
+    def query(self, rect):
+        """Return the objects sharing a cell with rect, each once.
+
+        The result may be a live bucket, so callers must not mutate it.
+        """
+        cells = self._cells
+        xs, ys = self._span(rect)
+        if len(xs) == 1 and len(ys) == 1:
+            return cells.get((xs[0], ys[0]), [])
+        found = []
+        seen = set()
+        for cx in xs:
+            for cy in ys:
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    continue
+                for obj in bucket:
+                    if id(obj) not in seen:
+                        seen.add(id(obj))
+                        found.append(obj)
+        return found
@@ -0,0 +1,60 @@
+"""Wave-based enemy spawning on game time, with a per-tick budget and a live cap."""
+
+from collections import namedtuple
+
+# count enemies every `interval` ticks, for `ticks` ticks (None: until reset)
+Wave = namedtuple("Wave", "interval count ticks", defaults=(1, None))
+
+
+class SpawnScheduler:
+    """Says how many enemies to spawn on each tick of a list of waves.
+
+    Call due(live) once per step() with the number of enemies alive. Time
+    only moves while due() is called, so a game that stops stepping on
+    game over also stops spawning. Each interval queues `count` spawns. At
+    most `budget` of them come out per tick, and never more than would take
+    the live count past `cap`. Spawns the cap has no room for are dropped,
+    not saved up, so a crowd that clears does not get an instant refill.
+    The last wave runs until reset(), whatever its ticks.
+
+        spawner = SpawnScheduler([Wave(30), Wave(20, 2, ticks=900)], cap=128)
+        for _ in range(spawner.due(len(enemies))):
+            spawn_enemy()
+    """
+
+    def __init__(self, waves, cap, budget=1):
+        self.waves = tuple(waves)
+        self.cap = cap
+        self.budget = budget
+        self.reset()
+
+    def reset(self):
+        self.tick = 0
+        self.wave = 0
+        self.wave_tick = 0
+        self.pending = 0
+        self.dropped = 0
+
+    @property
+    def current(self):
+        return self.waves[self.wave]
+
+    def due(self, live):
+        """Advance one tick and return how many enemies to spawn on it."""
+        wave = self.waves[self.wave]
+        if wave.ticks is not None and self.wave_tick >= wave.ticks and self.wave + 1 < len(self.waves):
+            self.wave += 1
+            self.wave_tick = 0
+            wave = self.waves[self.wave]
+        self.tick += 1
+        self.wave_tick += 1
+        if self.wave_tick % wave.interval == 0:
+            self.pending += wave.count
+
+        room = max(self.cap - live, 0)
+        if self.pending > room:
+            self.dropped += self.pending - room
+            self.pending = room
+        spawn = min(self.pending, self.budget)
+        self.pending -= spawn
+        return spawn
@@ -0,0 +1,92 @@
+"""Swept AABB tests: where along one step a moving rect first touches another.
+
+colliderect() only compares end positions, so anything moving further per
+step than the thickness it has to hit (a fall onto a 20 px platform, a
+bullet crossing an enemy, a long frame) can pass straight through. These
+sweep the whole move instead and report the time of impact.
+"""
+
+from collections import namedtuple
+
+INF = float("inf")
+
+# time: fraction of the step at first contact (0 = already overlapping at the start)
+# nx, ny: face of the target that was hit, e.g. ny == -1 for its top
+# index: position in the list passed to first_hit() or landing()
+Hit = namedtuple("Hit", "time nx ny index", defaults=(-1,))
+
+OVERLAPPING = Hit(0.0, 0, 0)
+
+
+def sweep(moving, dx, dy, target, tdx=0, tdy=0):
+    """First contact of `moving` travelling (dx, dy) with `target` travelling (tdx, tdy) during one step, or None.
+
+    Both rects are given at their start positions. Touching edges do not
+    count, matching colliderect().
+    """
+    if moving.colliderect(target):
+        return OVERLAPPING
+    dx -= tdx
+    dy -= tdy
+    enter, leave = -INF, INF
+    nx = ny = 0
+
+    if dx:
+        if dx > 0:
+            near, far, face = target.left - moving.right, target.right - moving.left, -1
+        else:
+            near, far, face = target.right - moving.left, target.left - moving.right, 1
+        near, far = near / dx, far / dx
+        if near > enter:
+            enter, nx = near, face
+        leave = min(leave, far)
+    elif moving.right <= target.left or moving.left >= target.right:
+        return None
+
+    if dy:
+        if dy > 0:
+            near, far, face = target.top - moving.bottom, target.bottom - moving.top, -1
+        else:
+            near, far, face = target.bottom - moving.top, target.top - moving.bottom, 1
+        near, far = near / dy, far / dy
+        if near > enter:
+            enter, nx, ny = near, 0, face
+        leave = min(leave, far)
+    elif moving.bottom <= target.top or moving.top >= target.bottom:
+        return None
+
+    if enter >= leave or enter >= 1 or leave <= 0:
+        return None
+    return Hit(enter, nx, ny)
+
+
+def hits(a_prev, a, b_prev, b):
+    """sweep() for two rects given where they were before the step and where they are now."""
+    return sweep(a_prev, a.x - a_prev.x, a.y - a_prev.y, b_prev, b.x - b_prev.x, b.y - b_prev.y)
+
+
+def first_hit(moving, dx, dy, targets):
+    """Earliest sweep() hit against a list of static rects, with its index, or None."""
+    best = None
+    for i, target in enumerate(targets):
+        hit = sweep(moving, dx, dy, target)
+        if hit and (best is None or hit.time < best.time):
+            best = hit._replace(index=i)
+    return best
+
+
+def landing(prev, rect, platforms):
+    """The first platform whose top `rect` dropped onto since `prev`, as a Hit, or None.
+
+    Side and underside contacts are ignored, so platforms stay jump-through
+    from below.
+    """
+    dx, dy = rect.x - prev.x, rect.y - prev.y
+    if dy <= 0:
+        return None
+    best = None
+    for i, plat in enumerate(platforms):
+        hit = sweep(prev, dx, dy, plat)
+        if hit and hit.ny == -1 and (best is None or hit.time < best.time):
+            best = hit._replace(index=i)
+    return best
@@ -0,0 +1,101 @@
+"""Cached text rendering for game HUDs and button labels."""
+
+from collections import OrderedDict
+
+import pygame
+
+
+class GlyphAtlas:
+    """Per-character surfaces for one font/color, for text that changes every frame.
+
+    Glyphs are placed by their metrics advance alone, so kerning pairs that
+    font.render() would tighten come out a pixel or so apart. That is fine
+    for scores and counters; labels that rarely change should go through
+    TextCache.render() instead.
+    """
+
+    def __init__(self, font, color, antialias=True):
+        self.font = font
+        self.color = color
+        self.antialias = antialias
+        self.height = font.get_height()
+        self._glyphs = {}
+
+    def glyph(self, char):
+        entry = self._glyphs.get(char)
+        if entry is None:
+            surface = self.font.render(char, self.antialias, self.color)
+            metrics = self.font.metrics(char)[0]
+            advance = metrics[4] if metrics else surface.get_width()
+            entry = (surface, advance)
+            self._glyphs[char] = entry
+        return entry
+
+    def size(self, text):
+        return sum(self.glyph(char)[1] for char in text), self.height
+
+    def draw(self, surface, text, x, y, center=True):
+        if center:
+            width, height = self.size(text)
+            x -= width // 2
+            y -= height // 2
+        left = x
+        batch = []
+        for char in text:
+            glyph, advance = self.glyph(char)
+            batch.append((glyph, (x, y)))
+            x += advance
+        surface.blits(batch, False)
+        return pygame.Rect(left, y, x - left, self.height)
+
+
+class TextCache:
+    """LRU caches of rendered labels keyed on (font, text, color, antialias) and of glyph atlases."""
+
+    def __init__(self, max_size=256, max_atlases=16):
+        self.max_size = max_size
+        self.max_atlases = max_atlases
+        self._labels = OrderedDict()
+        self._atlases = OrderedDict()
+
+    def render(self, text, font, color, antialias=True):
+        key = (font, text, color, antialias)
+        label = self._labels.get(key)
+        if label is not None:
+            self._labels.move_to_end(key)
+            return label
+        label = font.render(text, antialias, color)
+        self._labels[key] = label
+        if len(self._labels) > self.max_size:
+            self._labels.popitem(last=False)
+        return label
+
+    def atlas(self, font, color, antialias=True):
+        key = (font, color, antialias)
+        atlas = self._atlases.get(key)
+        if atlas is not None:
+            self._atlases.move_to_end(key)
+            return atlas
+        atlas = self._atlases[key] = GlyphAtlas(font, color, antialias)
+        if len(self._atlases) > self.max_atlases:
+            self._atlases.popitem(last=False)
+        return atlas
+
+    def draw(self, surface, text, font, color, x, y, center=True, dynamic=False):
+        """Blit text at (x, y) and return its rect; dynamic text goes through the glyph atlas."""
+        if dynamic:
+            return self.atlas(font, color).draw(surface, text, x, y, center)
+        label = self.render(text, font, color)
+        rect = label.get_rect(center=(x, y)) if center else label.get_rect(topleft=(x, y))
+        return surface.blit(label, rect)
+
+    def clear(self):
+        self._labels.clear()
+        self._atlases.clear()
+
+
+text_cache = TextCache()
+
+
+def draw_text(surface, text, font, color, x, y, center=True, dynamic=False):
+    return text_cache.draw(surface, text, font, color, x, y, center, dynamic)
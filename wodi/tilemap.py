@@ -0,0 +1,291 @@
+"""Binary tilemap levels, memory-mapped and streamed in chunks around the camera.
+
+    python -m wodi.tilemap generate level.wodt --width 100000 --height 64
+    python -m wodi.tilemap info level.wodt
+
+A level file is a header (tile size in px, chunk size in tiles, level size
+in tiles, spawn point), a palette of (r, g, b, flags) per tile id, then one
+byte per tile. Tiles are stored chunk by chunk, each chunk's rows back to
+back, so a chunk is one contiguous slice of the file. Tile 0 is empty.
+
+TileMap maps the file rather than reading it: only the chunks that are
+streamed in become pygame Rects and a cached Surface, so a level can be far
+bigger than it would be as Python objects.
+"""
+
+import argparse
+import mmap
+import random
+import struct
+import sys
+from collections import OrderedDict
+
+import pygame
+
+from wodi.camera import finish_surface, keyed_surface
+
+MAGIC = b"WODT"
+VERSION = 1
+HEADER = struct.Struct("<4sBHHIIiiB")  # magic, version, tile px, chunk tiles, width, height, spawn x/y px, palette size
+PALETTE_ENTRY = struct.Struct("<BBBB")  # r, g, b, flags
+
+SOLID = 1
+
+EMPTY, PLATFORM, OBSTACLE = 0, 1, 2
+PALETTE = [(0, 0, 0, 0), (0, 0, 0, SOLID), (200, 0, 0, SOLID)]
+
+
+def tiles_from_rects(rects, width, height, tile_size, tile=PLATFORM):
+    """Row-major tile bytes for a width x height tile level with every tile a rect touches set to `tile`.
+
+    Turns a game's hard-coded platform list into level data.
+    """
+    tiles = bytearray(width * height)
+    for rect in rects:
+        x0, x1 = max(rect.left // tile_size, 0), min((rect.right - 1) // tile_size + 1, width)
+        for ty in range(max(rect.top // tile_size, 0), min((rect.bottom - 1) // tile_size + 1, height)):
+            tiles[ty * width + x0:ty * width + x1] = bytes([tile]) * (x1 - x0)
+    return tiles
+
+
+def save_tilemap(path, width, height, tiles, tile_size=32, chunk_tiles=16, palette=PALETTE, spawn=(0, 0)):
+    """Write a level of width x height tiles.
+
+    tiles is either row-major tile bytes for the whole level, or a function
+    (cx, cy) -> the chunk_tiles * chunk_tiles tile bytes of one chunk, which
+    lets huge levels be written one chunk at a time.
+    """
+    chunks_x = -(-width // chunk_tiles)
+    chunks_y = -(-height // chunk_tiles)
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, tile_size, chunk_tiles, width, height, spawn[0], spawn[1], len(palette)))
+        for entry in palette:
+            f.write(PALETTE_ENTRY.pack(*entry))
+        for cy in range(chunks_y):
+            for cx in range(chunks_x):
+                if callable(tiles):
+                    data = tiles(cx, cy)
+                else:
+                    data = bytearray(chunk_tiles * chunk_tiles)
+                    x0 = cx * chunk_tiles
+                    n = min(chunk_tiles, width - x0)
+                    for row in range(min(chunk_tiles, height - cy * chunk_tiles)):
+                        start = (cy * chunk_tiles + row) * width + x0
+                        data[row * chunk_tiles:row * chunk_tiles + n] = tiles[start:start + n]
+                if len(data) != chunk_tiles * chunk_tiles:
+                    raise ValueError(f"chunk ({cx}, {cy}) has {len(data)} tiles, expected {chunk_tiles ** 2}")
+                f.write(data)
+    return path
+
+
+class Chunk:
+    """One streamed-in square of the level: its solid tiles as Rects, and a Surface drawn on first use."""
+
+    __slots__ = ("tilemap", "cx", "cy", "rect", "empty", "solids", "_surface")
+
+    def __init__(self, tilemap, cx, cy):
+        self.tilemap = tilemap
+        self.cx, self.cy = cx, cy
+        size = tilemap.chunk_px
+        self.rect = pygame.Rect(cx * size, cy * size, size, size)
+        self.invalidate()
+
+    def invalidate(self):
+        """Rebuild from the tile bytes after they changed."""
+        self._surface = None
+        self.empty = not any(self.tilemap.chunk_bytes(self.cx, self.cy))
+        self.solids = [] if self.empty else self._runs()
+
+    def _runs(self):
+        """Solid tiles as one Rect per horizontal run, in world pixels."""
+        tilemap = self.tilemap
+        n, size, solid = tilemap.chunk_tiles, tilemap.tile_size, tilemap.solid
+        data = tilemap.chunk_bytes(self.cx, self.cy)
+        left, top = self.rect.topleft
+        rects = []
+        for row in range(n):
+            line = data[row * n:(row + 1) * n]
+            if not any(line):
+                continue
+            start = None
+            for col in range(n + 1):
+                is_solid = col < n and solid[line[col]]
+                if is_solid and start is None:
+                    start = col
+                elif not is_solid and start is not None:
+                    rects.append(pygame.Rect(left + start * size, top + row * size, (col - start) * size, size))
+                    start = None
+        return rects
+
+    @property
+    def surface(self):
+        """Every tile of the chunk drawn once; empty tiles are transparent."""
+        if self._surface is None:
+            tilemap = self.tilemap
+            n, size, colors = tilemap.chunk_tiles, tilemap.tile_size, tilemap.colors
+            surface = keyed_surface((tilemap.chunk_px, tilemap.chunk_px))
+            data = tilemap.chunk_bytes(self.cx, self.cy)
+            for row in range(n):
+                for col in range(n):
+                    tile = data[row * n + col]
+                    if tile:
+                        surface.fill(colors[tile], (col * size, row * size, size, size))
+            self._surface = finish_surface(surface)
+        return self._surface
+
+
+class TileMap:
+    """A level file opened with mmap; chunks are built on demand and the least recently used dropped.
+
+    Writes through set_tile() change only the in-memory copy of the map, never
+    the file, and invalidate the chunk holding the tile. Reading a tile
+    outside the map gives EMPTY; writing one raises IndexError.
+    """
+
+    def __init__(self, path, max_chunks=64):
+        self.path = path
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_COPY)
+        (magic, version, self.tile_size, self.chunk_tiles, self.width, self.height,
+         spawn_x, spawn_y, palette_size) = HEADER.unpack_from(self._map)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} wodi tilemap")
+        self.spawn = (spawn_x, spawn_y)
+        self.palette = [PALETTE_ENTRY.unpack_from(self._map, HEADER.size + i * PALETTE_ENTRY.size)
+                        for i in range(palette_size)]
+        # Indexed by tile id; unknown ids draw pink and are not solid
+        self.colors = [(255, 105, 180)] * 256
+        self.solid = [False] * 256
+        for tile, (r, g, b, flags) in enumerate(self.palette):
+            self.colors[tile] = (r, g, b)
+            self.solid[tile] = bool(flags & SOLID) and tile != EMPTY
+
+        self.chunk_px = self.chunk_tiles * self.tile_size
+        self.chunks_x = -(-self.width // self.chunk_tiles)
+        self.chunks_y = -(-self.height // self.chunk_tiles)
+        self._data = HEADER.size + palette_size * PALETTE_ENTRY.size
+        self.max_chunks = max_chunks
+        self.loaded = OrderedDict()  # (cx, cy) -> Chunk, least recently used first
+        self.loads = 0
+
+    def close(self):
+        self.loaded.clear()
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @property
+    def rect(self):
+        return pygame.Rect(0, 0, self.width * self.tile_size, self.height * self.tile_size)
+
+    def _offset(self, cx, cy):
+        return self._data + (cy * self.chunks_x + cx) * self.chunk_tiles * self.chunk_tiles
+
+    def chunk_bytes(self, cx, cy):
+        offset = self._offset(cx, cy)
+        return self._map[offset:offset + self.chunk_tiles * self.chunk_tiles]
+
+    def tile(self, tx, ty):
+        if not (0 <= tx < self.width and 0 <= ty < self.height):
+            return EMPTY
+        n = self.chunk_tiles
+        return self._map[self._offset(tx // n, ty // n) + (ty % n) * n + tx % n]
+
+    def set_tile(self, tx, ty, tile):
+        if not (0 <= tx < self.width and 0 <= ty < self.height):
+            raise IndexError(f"tile ({tx}, {ty}) is outside the {self.width}x{self.height} map")
+        n = self.chunk_tiles
+        self._map[self._offset(tx // n, ty // n) + (ty % n) * n + tx % n] = tile
+        chunk = self.loaded.get((tx // n, ty // n))
+        if chunk is not None:
+            chunk.invalidate()
+
+    def chunk_coords(self, rect):
+        """(cx, cy) of every chunk rect overlaps, clipped to the level."""
+        size = self.chunk_px
+        x0, x1 = max(rect.left // size, 0), min((rect.right - 1) // size + 1, self.chunks_x)
+        y0, y1 = max(rect.top // size, 0), min((rect.bottom - 1) // size + 1, self.chunks_y)
+        return [(cx, cy) for cy in range(y0, y1) for cx in range(x0, x1)]
+
+    def chunk(self, cx, cy):
+        key = (cx, cy)
+        chunk = self.loaded.get(key)
+        if chunk is None:
+            chunk = self.loaded[key] = Chunk(self, cx, cy)
+            self.loads += 1
+        else:
+            self.loaded.move_to_end(key)
+        return chunk
+
+    def stream(self, view, margin=1):
+        """Load the chunks around `view` (margin more chunks on every side) and drop
+        the least recently used beyond max_chunks. Returns the chunks overlapping view."""
+        pad = margin * self.chunk_px
+        for cx, cy in self.chunk_coords(view.inflate(2 * pad, 2 * pad)):
+            self.chunk(cx, cy)
+        visible = [self.chunk(cx, cy) for cx, cy in self.chunk_coords(view)]
+        while len(self.loaded) > self.max_chunks:
+            self.loaded.popitem(last=False)
+        return visible
+
+    def visible(self, view):
+        """stream() for wodi.camera.Camera.draw: (surface, world topleft) of each non-empty chunk in view."""
+        return [(chunk.surface, chunk.rect.topleft) for chunk in self.stream(view) if not chunk.empty]
+
+    def solids(self, rect):
+        """Solid tile rects overlapping rect, from the chunks it touches."""
+        found = []
+        for cx, cy in self.chunk_coords(rect):
+            found.extend(r for r in self.chunk(cx, cy).solids if r.colliderect(rect))
+        return found
+
+
+def generate(path, width, height, seed=0, tile_size=32, chunk_tiles=16, per_chunk=3):
+    """A random platformer level written chunk by chunk: a floor plus `per_chunk` ledges per chunk."""
+    n = chunk_tiles
+
+    def chunk(cx, cy):
+        rng = random.Random(f"{seed}:{cx}:{cy}")
+        data = bytearray(n * n)
+        for _ in range(per_chunk):
+            length = rng.randint(2, n // 2)
+            x, y = rng.randrange(n - length), rng.randrange(n)
+            data[y * n + x:y * n + x + length] = bytes([PLATFORM]) * length
+        floor = height - 1 - cy * n
+        if 0 <= floor < n:
+            data[floor * n:(floor + 1) * n] = bytes([PLATFORM]) * n
+        return data
+
+    return save_tilemap(path, width, height, chunk, tile_size, chunk_tiles,
+                        spawn=(tile_size * 2, (height - 3) * tile_size))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    make = commands.add_parser("generate", help="write a random platformer level")
+    make.add_argument("path")
+    make.add_argument("--width", type=int, default=10000, help="tiles")
+    make.add_argument("--height", type=int, default=64, help="tiles")
+    make.add_argument("--tile-size", type=int, default=32)
+    make.add_argument("--chunk-tiles", type=int, default=16)
+    make.add_argument("--seed", type=int, default=0)
+    info = commands.add_parser("info", help="describe a level file")
+    info.add_argument("path")
+    args = parser.parse_args(argv)
+
+    if args.command == "generate":
+        generate(args.path, args.width, args.height, args.seed, args.tile_size, args.chunk_tiles)
+    with TileMap(args.path) as tilemap:
+        print(f"{args.path}: {tilemap.width}x{tilemap.height} tiles of {tilemap.tile_size}px, "
+              f"{tilemap.chunks_x}x{tilemap.chunks_y} chunks of {tilemap.chunk_px}px, "
+              f"{len(tilemap.palette)} palette entries, spawn {tilemap.spawn}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,48 @@
+"""Fixed-timestep simulation with interpolated rendering."""
+
+import pygame
+
+
+class FixedTimestep:
+    """Turns variable frame times into a whole number of fixed-size physics steps.
+
+    Physics always advances in steps of 1/hz seconds, so jump heights and fall
+    speeds do not depend on the render frame rate. After advance() returns,
+    alpha says how far the leftover time reaches into the next step, for
+    interpolating between the previous and current simulation states.
+    """
+
+    def __init__(self, hz=60, max_steps=8):
+        self.hz = hz
+        self.dt = 1.0 / hz
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.alpha = 0.0
+        self.dropped = 0
+
+    def advance(self, frame_time):
+        """Add frame_time seconds and return how many fixed steps to run now."""
+        self.accumulator += frame_time
+        steps = int(self.accumulator / self.dt)
+        if steps > self.max_steps:
+            # Too far behind to catch up: slow the game down instead of stalling
+            self.dropped += steps - self.max_steps
+            self.accumulator -= (steps - self.max_steps) * self.dt
+            steps = self.max_steps
+        self.accumulator -= steps * self.dt
+        self.alpha = self.accumulator / self.dt
+        return steps
+
+    def reset(self):
+        self.accumulator = 0.0
+        self.alpha = 0.0
+
+
+def lerp(a, b, t):
+    return a + (b - a) * t
+
+
+def lerp_rect(previous, current, t):
+    """Rect drawn between two simulation states; t is FixedTimestep.alpha."""
+    return pygame.Rect(round(lerp(previous.x, current.x, t)), round(lerp(previous.y, current.y, t)),
+                       current.width, current.height)
@@ -0,0 +1,378 @@
+"""Many copies of a game stepped at once, with every copy's state in NumPy arrays, for training bots.
+
+    env = DodgeVecEnv(seed=0)
+    obs = env.reset(1024)
+    while training:
+        obs, reward, done = env.step(actions)   # actions: int array, one per copy
+
+The environments re-implement a game's step() rules on arrays of shape
+(n,) or (n, slots) instead of Rects, so one step() call advances every
+copy. A copy that finishes is reset in the same call. Its obs row then
+shows the new episode, and the finished episode's score and length are
+left in final_score and final_ticks. Randomness comes from one NumPy
+Generator, so a run is repeatable from its seed but does not follow the
+same random draws as the pygame game.
+
+observe="vector" gives float32 features scaled to about [0, 1].
+observe="grid" gives a low-res uint8 picture of each copy with one cell
+per `cell` pixels: 0 empty, 1 player, 2 enemy, 3 bullet. A grid step
+costs more than a vector one, since every step fills a new (n, rows,
+cols) array and paints each live box into it. In
+benchmarks/bench_vecenv.py at 1024 copies that makes the dodger about
+ten times slower than with vectors, though both environments stay above
+100k steps a second with either observation.
+"""
+
+import numpy
+
+from wodi.spawn import Wave
+
+EMPTY, PLAYER, ENEMY, BULLET = 0, 1, 2, 3
+
+
+def overlap(ax, ay, aw, ah, bx, by, bw, bh):
+    """pygame.Rect.colliderect on arrays: True where the boxes share some area."""
+    return (ax < bx + bw) & (bx < ax + aw) & (ay < by + bh) & (by < ay + ah)
+
+
+def paint(grid, value, x, y, w, h, alive, cell):
+    """Set every cell of the C-contiguous grid (n, rows, cols) that a live box touches to value; box arrays are (n, k).
+
+    Only live boxes are visited: each covers a small block of cells, and
+    the blocks are written one offset at a time, so the cost follows the
+    number of boxes rather than the size of the grid. Offsets past a
+    smaller box's block repeat its last row or column.
+    """
+    rows, cols = grid.shape[1:]
+    copy, slot = numpy.nonzero(alive)
+    x, y = x[copy, slot], y[copy, slot]
+    c0, c1 = numpy.maximum(x // cell, 0), numpy.minimum((x + w - 1) // cell, cols - 1)
+    r0, r1 = numpy.maximum(y // cell, 0), numpy.minimum((y + h - 1) // cell, rows - 1)
+    on_grid = (c0 <= c1) & (r0 <= r1)
+    if not on_grid.all():
+        copy, c0, c1, r0, r1 = copy[on_grid], c0[on_grid], c1[on_grid], r0[on_grid], r1[on_grid]
+    if not len(copy):
+        return
+    flat = grid.reshape(-1)
+    base = copy * (rows * cols)
+    for dr in range(int((r1 - r0).max()) + 1):
+        row = base + numpy.minimum(r0 + dr, r1) * cols
+        for dc in range(int((c1 - c0).max()) + 1):
+            flat[row + numpy.minimum(c0 + dc, c1)] = value
+
+
+class VecEnv:
+    """Shared reset/step plumbing; subclasses hold the game rules.
+
+    Subclasses set num_actions and size and implement _allocate(n),
+    _reset(mask), _step(actions) returning the done mask (adding to
+    self.score as they go), _vector() and _draw(grid).
+    """
+
+    num_actions = 1
+    size = (0, 0)
+
+    def __init__(self, observe="vector", cell=10, seed=None):
+        if observe not in ("vector", "grid"):
+            raise ValueError(f"observe must be 'vector' or 'grid', not {observe!r}")
+        self.observe = observe
+        self.cell = cell
+        self.rng = numpy.random.default_rng(seed)
+        self.n = None
+
+    @property
+    def grid_shape(self):
+        width, height = self.size
+        return (-(-height // self.cell), -(-width // self.cell))
+
+    def reset(self, n=None):
+        """Start n fresh copies (default: as many as before) and return their observations."""
+        n = self.n if n is None else n
+        if n is None:
+            raise ValueError("the first reset() needs the number of copies")
+        if n != self.n:
+            self.n = n
+            self._allocate(n)
+        everything = numpy.ones(self.n, dtype=bool)
+        self.score = numpy.zeros(self.n, dtype=numpy.int64)
+        self.ticks = numpy.zeros(self.n, dtype=numpy.int64)
+        self.final_score = numpy.zeros(self.n, dtype=numpy.int64)
+        self.final_ticks = numpy.zeros(self.n, dtype=numpy.int64)
+        self._reset(everything)
+        return self.observation()
+
+    def step(self, actions):
+        """Advance every copy one tick; returns (obs, reward, done) arrays with one row per copy."""
+        actions = numpy.asarray(actions)
+        if actions.shape != (self.n,):
+            raise ValueError(f"expected {self.n} actions, got shape {actions.shape}")
+        if actions.size and (actions.min() < 0 or actions.max() >= self.num_actions):
+            raise ValueError(f"actions must be in [0, {self.num_actions})")
+        before = self.score.copy()
+        self.ticks += 1
+        done = self._step(actions)
+        reward = (self.score - before).astype(numpy.float32)
+        if done.any():
+            self.final_score[done] = self.score[done]
+            self.final_ticks[done] = self.ticks[done]
+            self.score[done] = 0
+            self.ticks[done] = 0
+            self._reset(done)
+        return self.observation(), reward, done
+
+    def observation(self):
+        if self.observe == "vector":
+            return self._vector()
+        grid = numpy.zeros((self.n,) + self.grid_shape, dtype=numpy.uint8)
+        self._draw(grid)
+        return grid
+
+    def _paint(self, grid, value, x, y, w, h, alive=None):
+        if alive is None:
+            alive = numpy.ones(x.shape, dtype=bool)
+        paint(grid, value, x, y, w, h, alive, self.cell)
+
+
+class DodgeVecEnv(VecEnv):
+    """Day 28's dodger: enemies fall, the player slides left and right along the bottom.
+
+    Actions: 0 stay, 1 left, 2 right. Reward is +1 for every enemy that
+    falls off the bottom, the game's score. A copy is done when an enemy
+    touches the player.
+    """
+
+    num_actions = 3
+    size = (600, 400)
+    player_size = 40
+    player_speed = 5
+    enemy_size = 40
+
+    def __init__(self, num_enemies=5, enemy_speed=5, respawn_range=(-150, -40), **kwargs):
+        super().__init__(**kwargs)
+        self.num_enemies = num_enemies
+        self.enemy_speed = enemy_speed
+        self.respawn_range = respawn_range
+
+    def _allocate(self, n):
+        k = self.num_enemies
+        self.player_x = numpy.zeros(n, dtype=numpy.int64)
+        self.enemy_x = numpy.zeros((n, k), dtype=numpy.int64)
+        self.enemy_y = numpy.zeros((n, k), dtype=numpy.int64)
+
+    def _respawn(self, mask):
+        """Put the masked enemies back above the screen; mask is (n, k)."""
+        count = int(mask.sum())
+        low, high = self.respawn_range
+        self.enemy_x[mask] = self.rng.integers(0, self.size[0] - self.enemy_size, count, endpoint=True)
+        self.enemy_y[mask] = self.rng.integers(low, high, count, endpoint=True)
+
+    def _reset(self, mask):
+        self.player_x[mask] = self.size[0] // 2
+        self._respawn(numpy.repeat(mask[:, None], self.num_enemies, axis=1))
+
+    def _step(self, actions):
+        width, height = self.size
+        px = self.player_x
+        px -= self.player_speed * ((actions == 1) & (px > 0))
+        px += self.player_speed * ((actions == 2) & (px + self.player_size < width))
+
+        self.enemy_y += self.enemy_speed
+        fallen = self.enemy_y > height
+        if fallen.any():
+            self.score += fallen.sum(axis=1)
+            self._respawn(fallen)
+
+        size = self.enemy_size
+        hit = overlap(px[:, None], height - 60, self.player_size, self.player_size,
+                      self.enemy_x, self.enemy_y, size, size)
+        return hit.any(axis=1)
+
+    def _vector(self):
+        width, height = self.size
+        return numpy.concatenate([
+            (self.player_x / width)[:, None],
+            self.enemy_x / width,
+            self.enemy_y / height,
+        ], axis=1).astype(numpy.float32)
+
+    def _draw(self, grid):
+        size = self.enemy_size
+        self._paint(grid, ENEMY, self.enemy_x, self.enemy_y, size, size)
+        self._paint(grid, PLAYER, self.player_x[:, None], numpy.full((self.n, 1), self.size[1] - 60),
+                    self.player_size, self.player_size)
+
+
+class ShooterVecEnv(VecEnv):
+    """Day 41's shooter: enemies cross the play area from its edges, the player moves a grid square a tick and shoots up.
+
+    Actions: 0 stay, 1 left, 2 right, 3 up, 4 down, 5 shoot. Reward is +1
+    per enemy shot. A copy is done when the player leaves the play area or
+    an enemy touches it.
+
+    Enemies come from the same waves, one per tick at most, as the game's
+    SpawnScheduler. Enemies and bullets live in max_enemies/max_bullets
+    slots per copy, 128 each like the game's pools. Hits are tested
+    between the boxes each bullet and enemy swept over the tick.
+
+    One rule differs on purpose: when two enemies claim the same bullet in
+    a tick, neither is hit and both fly on. Day 41 gives the bullet to
+    whichever enemy comes first in its reversed pool loop, an order that
+    depends on the pool's release history and has no slot equivalent here.
+    """
+
+    num_actions = 6
+    size = (720, 1280)
+    grid_size = 40
+    game_top = 80
+    bullet_size = 10
+    bullet_speed = 5
+    waves = (Wave(30, ticks=900), Wave(20, ticks=900), Wave(30, 2))
+
+    def __init__(self, max_enemies=128, max_bullets=128, **kwargs):
+        super().__init__(**kwargs)
+        self.max_enemies = max_enemies
+        self.max_bullets = max_bullets
+        self.game_bottom = self.size[1] // 2 - 60
+        # Wave i covers ticks (starts[i], starts[i + 1]]
+        self.wave_starts = numpy.cumsum([0] + [w.ticks or 0 for w in self.waves[:-1]])
+        self.wave_interval = numpy.array([w.interval for w in self.waves])
+        self.wave_count = numpy.array([w.count for w in self.waves])
+
+    @property
+    def grid_shape(self):
+        # Only the play area is observed
+        return (-(-(self.game_bottom - self.game_top) // self.cell), -(-self.size[0] // self.cell))
+
+    def _allocate(self, n):
+        e, b = self.max_enemies, self.max_bullets
+        self.player_x = numpy.zeros(n, dtype=numpy.int64)
+        self.player_y = numpy.zeros(n, dtype=numpy.int64)
+        self.pending = numpy.zeros(n, dtype=numpy.int64)
+        for name in ("enemy_x", "enemy_y", "enemy_vx", "enemy_vy"):
+            setattr(self, name, numpy.zeros((n, e), dtype=numpy.int64))
+        self.enemy_alive = numpy.zeros((n, e), dtype=bool)
+        self.bullet_x = numpy.zeros((n, b), dtype=numpy.int64)
+        self.bullet_y = numpy.zeros((n, b), dtype=numpy.int64)
+        self.bullet_alive = numpy.zeros((n, b), dtype=bool)
+
+    def _reset(self, mask):
+        self.player_x[mask] = self.size[0] // 2
+        self.player_y[mask] = self.game_top + (self.game_bottom - self.game_top) // 2
+        self.pending[mask] = 0
+        self.enemy_alive[mask] = False
+        self.bullet_alive[mask] = False
+
+    def _spawn_enemies(self):
+        t = self.ticks
+        wave = numpy.searchsorted(self.wave_starts, t, "left") - 1
+        due = (t - self.wave_starts[wave]) % self.wave_interval[wave] == 0
+        self.pending += numpy.where(due, self.wave_count[wave], 0)
+        live = self.enemy_alive.sum(axis=1)
+        self.pending = numpy.minimum(self.pending, numpy.maximum(self.max_enemies - live, 0))
+        rows = numpy.flatnonzero(self.pending > 0)
+        if not len(rows):
+            return
+        self.pending[rows] -= 1
+        slots = numpy.argmin(self.enemy_alive[rows], axis=1)
+
+        width, g = self.size[0], self.grid_size
+        rng, count = self.rng, len(rows)
+        side = rng.integers(0, 4, count)  # top, bottom, left, right
+        speed = rng.integers(1, 2, count, endpoint=True)
+        along_x = rng.integers(0, width - g, count, endpoint=True)
+        along_y = rng.integers(self.game_top, self.game_bottom - g, count, endpoint=True)
+        x = numpy.select([side < 2, side == 2], [along_x, 0], width - g)
+        y = numpy.select([side == 0, side == 1], [self.game_top, self.game_bottom - g], along_y)
+        vx = numpy.select([side == 2, side == 3], [speed, -speed], 0)
+        vy = numpy.select([side == 0, side == 1], [speed, -speed], 0)
+        self.enemy_x[rows, slots], self.enemy_y[rows, slots] = x, y
+        self.enemy_vx[rows, slots], self.enemy_vy[rows, slots] = vx, vy
+        self.enemy_alive[rows, slots] = True
+
+    def _step(self, actions):
+        width, height = self.size
+        g, bs = self.grid_size, self.bullet_size
+        self._spawn_enemies()
+
+        shooting = numpy.flatnonzero((actions == 5) & ~self.bullet_alive.all(axis=1))
+        if len(shooting):
+            slots = numpy.argmin(self.bullet_alive[shooting], axis=1)
+            self.bullet_x[shooting, slots] = self.player_x[shooting] + g // 2 - bs // 2
+            self.bullet_y[shooting, slots] = self.player_y[shooting]
+            self.bullet_alive[shooting, slots] = True
+
+        px, py = self.player_x, self.player_y
+        px += g * ((actions == 2).astype(numpy.int64) - (actions == 1))
+        py += g * ((actions == 4).astype(numpy.int64) - (actions == 3))
+        done = (px < 0) | (px + g > width) | (py < self.game_top) | (py + g > self.game_bottom)
+
+        self.bullet_y -= self.bullet_speed
+        self.bullet_alive &= self.bullet_y + bs >= self.game_top
+
+        ex, ey, vx, vy = self.enemy_x, self.enemy_y, self.enemy_vx, self.enemy_vy
+        ex += vx
+        ey += vy
+        alive = self.enemy_alive
+        done |= (alive & overlap(px[:, None], py[:, None], g, g, ex, ey, g, g)).any(axis=1)
+
+        # Slots fill lowest first, so only test up to the highest slot live in any copy
+        e_used = numpy.flatnonzero(alive.any(axis=0))
+        b_used = numpy.flatnonzero(self.bullet_alive.any(axis=0))
+        if len(e_used) and len(b_used):
+            e_end, b_end = e_used[-1] + 1, b_used[-1] + 1
+            ex_, ey_, vx_, vy_ = ex[:, :e_end], ey[:, :e_end], vx[:, :e_end], vy[:, :e_end]
+            # Swept boxes: enemies over their last move, bullets over their last 5 px
+            sx, sy = ex_ - numpy.maximum(vx_, 0), ey_ - numpy.maximum(vy_, 0)
+            sw, sh = g + numpy.abs(vx_), g + numpy.abs(vy_)
+            hits = (alive[:, :e_end, None] & self.bullet_alive[:, None, :b_end]
+                    & overlap(sx[:, :, None], sy[:, :, None], sw[:, :, None], sh[:, :, None],
+                              self.bullet_x[:, None, :b_end], self.bullet_y[:, None, :b_end],
+                              bs, bs + self.bullet_speed))
+        else:
+            hits = numpy.zeros((self.n, 0, 0), dtype=bool)
+        if hits.any():
+            # An enemy takes its first bullet, unless an earlier enemy also wants that bullet
+            first_bullet = numpy.where(hits.any(axis=2), hits.argmax(axis=2), -1)
+            first_enemy = hits.argmax(axis=1)
+            rows, enemies = numpy.nonzero(first_bullet >= 0)
+            bullets = first_bullet[rows, enemies]
+            mutual = first_enemy[rows, bullets] == enemies
+            rows, enemies, bullets = rows[mutual], enemies[mutual], bullets[mutual]
+            alive[rows, enemies] = False
+            self.bullet_alive[rows, bullets] = False
+            numpy.add.at(self.score, rows, 1)
+
+        # Gone off screen for good
+        alive &= overlap(ex, ey, g, g, 0, 0, width, height)
+        return done
+
+    def _vector(self):
+        width, top, bottom = self.size[0], self.game_top, self.game_bottom
+        span = bottom - top
+        e, b = self.max_enemies, self.max_bullets
+        out = numpy.empty((self.n, 2 + 5 * e + 3 * b), dtype=numpy.float32)
+        columns = [
+            (self.player_x[:, None], 0, width),
+            (self.player_y[:, None], top, span),
+            (self.enemy_x, 0, width),
+            (self.enemy_y, top, span),
+            (self.enemy_vx, 0, 2),
+            (self.enemy_vy, 0, 2),
+            (self.enemy_alive, 0, 1),
+            (self.bullet_x, 0, width),
+            (self.bullet_y, top, span),
+            (self.bullet_alive, 0, 1),
+        ]
+        start = 0
+        for values, offset, scale in columns:
+            end = start + values.shape[1]
+            numpy.subtract(values, offset, out=out[:, start:end], casting="unsafe")
+            out[:, start:end] /= scale
+            start = end
+        return out
+
+    def _draw(self, grid):
+        g, bs, top = self.grid_size, self.bullet_size, self.game_top
+        self._paint(grid, BULLET, self.bullet_x, self.bullet_y - top, bs, bs, self.bullet_alive)
+        self._paint(grid, ENEMY, self.enemy_x, self.enemy_y - top, g, g, self.enemy_alive)
+        self._paint(grid, PLAYER, self.player_x[:, None], (self.player_y - top)[:, None], g, g)